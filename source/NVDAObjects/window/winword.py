@@ -1012,7 +1012,9 @@ def getTextWithFields(  # noqa: C901
 			return [self.text]
 		extraDetail = formatConfig.get("extraDetail", False) if formatConfig else False
 		if not formatConfig:
-			formatConfig = config.conf["documentFormatting"]
+			formatConfig = config.conf.getSectionSnapshot("documentFormatting")
+		# Copy, as the caller's format config may be shared or read-only.
+		formatConfig = formatConfig.copy()
 		formatConfig["autoLanguageSwitching"] = config.conf["speech"].get("autoLanguageSwitching", False)
 		startOffset = self._rangeObj.start
 		endOffset = self._rangeObj.end
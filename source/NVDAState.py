@@ -67,6 +67,12 @@ def addonStateFile(self) -> str:
 
 		return os.path.join(self.configDir, stateFilename)
 
+	@property
+	def addonManifestIndexFile(self) -> str:
+		from addonHandler import manifestIndexFilename
+
+		return os.path.join(self.configDir, manifestIndexFilename)
+
 	@property
 	def profileTriggersFile(self) -> str:
 		return os.path.join(self.configDir, "profileTriggers.ini")
@@ -13,7 +13,10 @@
 import inspect
 import itertools
 import collections
+from concurrent.futures import ThreadPoolExecutor
+import copy
 import shutil
+import threading
 from io import StringIO
 import pickle
 from six import string_types
@@ -21,8 +24,11 @@
 	Callable,
 	Dict,
 	IO,
+	Iterable,
 	Literal,
+	NamedTuple,
 	Optional,
+	TypeVar,
 	Set,
 	TYPE_CHECKING,
 	Tuple,
@@ -36,6 +42,7 @@
 from logHandler import log
 import winKernel
 import addonAPIVersion
+import buildVersion
 import importlib
 import NVDAState
 from NVDAState import WritePaths
@@ -64,6 +71,7 @@
 
 MANIFEST_FILENAME = "manifest.ini"
 stateFilename = "addonsState.pickle"
+manifestIndexFilename = "addonManifestIndex.pickle"
 BUNDLE_EXTENSION = "nvda-addon"
 BUNDLE_MIMETYPE = "application/x-nvda-addon"
 NVDA_ADDON_PROG_ID = "NVDA.Addon.1"
@@ -233,6 +241,144 @@ def _cleanupCompatibleAddonsFromDowngrade(self) -> None:
 state = AddonsState()
 
 
+_ManifestFileStatT = Optional[Tuple[int, int]]
+"""The modification time in nanoseconds and the size of a manifest file, or C{None} if it does not exist."""
+_ManifestIndexKeyT = Tuple[str, Tuple[_ManifestFileStatT, ...]]
+"""The NVDA language and the state of the manifest and its candidate translations on disk."""
+
+
+class _AddonManifestIndex:
+	"""A persisted index of the validated manifests of installed add-ons.
+	Parsing and validating a manifest and its translation is repeated for every add-on
+	each time the list of available add-ons is refreshed, which slows down NVDA start up
+	when many add-ons are installed.
+	This index stores the validated manifest of each add-on directory,
+	keyed by the modification time and size of the manifest files and the NVDA language,
+	so that only manifests which have changed since the index was last saved are parsed again.
+	"""
+
+	_FORMAT_VERSION = 1
+	"""Increase when the format of the stored entries changes, to discard indexes written in an older format."""
+
+	def __init__(self):
+		self._entries: dict[str, tuple[_ManifestIndexKeyT, dict, dict | None]] = {}
+		"""Maps normalized add-on paths to the index key
+		and the validated manifest and translated manifest data."""
+		self._isLoaded = False
+		self._isDirty = False
+		# Manifests may be loaded from several threads at once, see L{_loadAddons}.
+		self._loadLock = threading.Lock()
+
+	@property
+	def indexPath(self) -> str:
+		"""Returns path to the index file."""
+		return WritePaths.addonManifestIndexFile
+
+	def _ensureLoaded(self) -> None:
+		if self._isLoaded:
+			return
+		with self._loadLock:
+			if not self._isLoaded:
+				self._load()
+				self._isLoaded = True
+
+	def _load(self) -> None:
+		try:
+			with open(self.indexPath, "rb") as f:
+				pickledIndex = pickle.load(f)
+		except FileNotFoundError:
+			return  # Clean config or index not yet saved - no point logging in this case
+		except Exception:
+			log.debugWarning("Failed to load add-on manifest index", exc_info=True)
+			return
+		if (
+			not isinstance(pickledIndex, dict)
+			or pickledIndex.get("formatVersion") != self._FORMAT_VERSION
+			# The manifest specification and validation may change between NVDA versions.
+			or pickledIndex.get("nvdaVersion") != buildVersion.version
+		):
+			log.debug("Discarding add-on manifest index written by a different NVDA version")
+			self._isDirty = True
+			return
+		self._entries = pickledIndex["entries"]
+
+	def save(self) -> None:
+		"""Saves the index to a file, if it has changed since it was loaded."""
+		if not NVDAState.shouldWriteToDisk():
+			log.debugWarning("NVDA should not write to disk from secure mode or launcher", stack_info=True)
+			return
+		if not self._isDirty:
+			return
+		from fileUtils import FaultTolerantFile
+
+		try:
+			with FaultTolerantFile(self.indexPath) as f:
+				pickle.dump(
+					{
+						"formatVersion": self._FORMAT_VERSION,
+						"nvdaVersion": buildVersion.version,
+						"entries": self._entries,
+					},
+					f,
+				)
+		except (OSError, pickle.PicklingError):
+			log.debugWarning("Error saving add-on manifest index", exc_info=True)
+		else:
+			self._isDirty = False
+
+	@staticmethod
+	def _getKey(addonPath: str, lang: str) -> _ManifestIndexKeyT:
+		fileStats: list[_ManifestFileStatT] = []
+		for manifestPath in (MANIFEST_FILENAME, *_translatedManifestPaths(lang)):
+			try:
+				stat = os.stat(os.path.join(addonPath, manifestPath))
+			except OSError:
+				fileStats.append(None)
+			else:
+				fileStats.append((stat.st_mtime_ns, stat.st_size))
+		return (lang, tuple(fileStats))
+
+	def getManifest(self, addonPath: str) -> "AddonManifest":
+		"""Gets the manifest of the add-on in the given directory,
+		parsing it only if it is not indexed or has changed on disk since it was indexed.
+		@param addonPath: the base directory of the add-on.
+		@raise AddonError: if the manifest has errors.
+		"""
+		self._ensureLoaded()
+		# The key is computed before the manifest is read,
+		# so a manifest modified while being read is parsed again next time.
+		key = self._getKey(addonPath, languageHandler.getLanguage())
+		entryPath = os.path.normcase(os.path.abspath(addonPath))
+		entry = self._entries.get(entryPath)
+		if entry is not None and entry[0] == key:
+			_key, manifestData, translatedData = copy.deepcopy(entry)
+			return AddonManifest._fromValidatedData(manifestData, translatedData)
+		manifest = _readAddonManifest(addonPath)
+		translatedData = manifest._translatedConfig.dict() if manifest._translatedConfig is not None else None
+		self._entries[entryPath] = (key, manifest.dict(), translatedData)
+		self._isDirty = True
+		return manifest
+
+	def prune(self, addonPaths: Iterable[str]) -> None:
+		"""Removes the entries of add-ons which are no longer available.
+		@param addonPaths: the base directories of the add-ons to keep in the index.
+		"""
+		self._ensureLoaded()
+		keep = {os.path.normcase(os.path.abspath(path)) for path in addonPaths}
+		for entryPath in self._entries.keys() - keep:
+			del self._entries[entryPath]
+			self._isDirty = True
+
+	def clear(self) -> None:
+		"""Forgets all indexed manifests, so that every manifest is parsed again."""
+		self._entries.clear()
+		self._isLoaded = True
+		self._isDirty = True
+
+
+_manifestIndex = _AddonManifestIndex()
+
+
 def getRunningAddons() -> "AddonHandlerModelGeneratorT":
 	"""Returns currently loaded add-ons."""
 	return getAvailableAddons(filterFunc=lambda addon: addon.isRunning)
@@ -332,15 +478,94 @@ def _getDefaultAddonPaths() -> list[str]:
 	return addon_paths
 
 
-def _getAvailableAddonsFromPath(
-	path: str,
-	isFirstLoad: bool = False,
-) -> "AddonHandlerModelGeneratorT":
-	"""Gets available add-ons from path.
-	An addon is only considered available if the manifest file is loaded with no errors.
-	@param path: path from where to find addon directories.
+_MAX_LOADING_WORKERS = 8
+"""The maximum number of threads used to load add-on manifests or inspect add-on bundles."""
+
+_ItemT = TypeVar("_ItemT")
+_ResultT = TypeVar("_ResultT")
+
+
+def _mapInParallel(func: Callable[[_ItemT], _ResultT], items: Iterable[_ItemT]) -> list[_ResultT]:
+	"""Calls func for each item on a thread pool, as loading add-ons is mostly spent waiting on the disk.
+	@return: The results, in the order of items.
 	"""
-	log.debug("Listing add-ons from %s", path)
+	items = list(items)
+	if len(items) <= 1:
+		return [func(item) for item in items]
+	with ThreadPoolExecutor(
+		max_workers=min(_MAX_LOADING_WORKERS, len(items)),
+		thread_name_prefix="addonHandler",
+	) as executor:
+		return list(executor.map(func, items))
+
+
+def _loadAddon(addonPath: str) -> Addon | None:
+	"""Loads the add-on in the given directory, logging any error.
+	@return: The add-on, or C{None} if it could not be loaded.
+	"""
+	log.debug("Loading add-on from %s", addonPath)
+	try:
+		return Addon(addonPath)
+	except Exception:
+		log.error("Error loading Addon from path: %s", addonPath, exc_info=True)
+		return None
+
+
+def _loadAddons(addonPaths: Iterable[str]) -> list[Addon | None]:
+	"""Loads the add-ons in the given directories in parallel.
+	Errors are logged for each add-on which could not be loaded.
+	@param addonPaths: the base directories of the add-ons.
+	@return: The add-ons in the order of addonPaths, with C{None} for add-ons which could not be loaded.
+	"""
+	return _mapInParallel(_loadAddon, addonPaths)
+
+
+class _InspectedAddonBundle(NamedTuple):
+	"""The result of inspecting an add-on bundle with L{_inspectAddonBundles}."""
+
+	path: str
+	bundle: AddonBundle | None
+	"""The bundle, or C{None} if it could not be opened or its manifest has errors."""
+	sha256: str | None
+	"""The SHA-256 hex digest of the bundle file, if requested and the file could be read."""
+
+
+def _inspectAddonBundle(bundlePath: str, computeChecksum: bool) -> _InspectedAddonBundle:
+	try:
+		bundle = AddonBundle(bundlePath)
+	except Exception:
+		log.error("Error opening addon bundle from %s", bundlePath, exc_info=True)
+		return _InspectedAddonBundle(bundlePath, None, None)
+	sha256 = None
+	if computeChecksum:
+		from utils.security import sha256_checksum
+
+		try:
+			with open(bundlePath, "rb") as f:
+				sha256 = sha256_checksum(f)
+		except OSError:
+			log.error("Error computing the checksum of addon bundle %s", bundlePath, exc_info=True)
+	return _InspectedAddonBundle(bundlePath, bundle, sha256)
+
+
+def _inspectAddonBundles(
+	bundlePaths: Iterable[str],
+	computeChecksums: bool = False,
+) -> list[_InspectedAddonBundle]:
+	"""Opens the given add-on bundles and validates their manifests in parallel.
+	Errors are logged for each bundle which could not be opened.
+	@param bundlePaths: the paths of the add-on bundle files.
+	@param computeChecksums: Whether to also compute the SHA-256 of each bundle file.
+	@return: The results in the order of bundlePaths.
+	"""
+	return _mapInParallel(lambda path: _inspectAddonBundle(path, computeChecksums), bundlePaths)
+
+
+def _getAddonDirsFromPath(path: str, isFirstLoad: bool = False) -> list[str]:
+	"""Lists the add-on directories in path, in the order they are returned by the file system.
+	Directories of add-ons which failed to be deleted are removed when isFirstLoad is C{True}.
+	"""
+	addonPaths = []
 	for p in os.listdir(path):
 		if p.endswith(DELETEDIR_SUFFIX):
 			if isFirstLoad and NVDAState.shouldWriteToDisk():
@@ -351,58 +576,74 @@ def _getAvailableAddonsFromPath(
 			if not len(os.listdir(addon_path)):
 				log.error("Error loading Addon from path: %s", addon_path)
 			else:
-				log.debug("Loading add-on from %s", addon_path)
+				addonPaths.append(addon_path)
+	return addonPaths
+
+
+def _getAvailableAddonsFromPath(
+	path: str,
+	isFirstLoad: bool = False,
+) -> "AddonHandlerModelGeneratorT":
+	"""Gets available add-ons from path.
+	An addon is only considered available if the manifest file is loaded with no errors.
+	Manifests are loaded in parallel, pending installs and removals are then handled in order.
+	@param path: path from where to find addon directories.
+	"""
+	log.debug("Listing add-ons from %s", path)
+	addonPaths = _getAddonDirsFromPath(path, isFirstLoad)
+	for addon_path, a in zip(addonPaths, _loadAddons(addonPaths)):
+		if a is None:
+			continue
+		try:
+			name = a.manifest["name"]
+			if (
+				isFirstLoad
+				and NVDAState.shouldWriteToDisk()
+				and name in state[AddonStateCategory.PENDING_REMOVE]
+				and not a.path.endswith(ADDON_PENDINGINSTALL_SUFFIX)
+			):
 				try:
-					a = Addon(addon_path)
-					name = a.manifest["name"]
-					if (
-						isFirstLoad
-						and NVDAState.shouldWriteToDisk()
-						and name in state[AddonStateCategory.PENDING_REMOVE]
-						and not a.path.endswith(ADDON_PENDINGINSTALL_SUFFIX)
-					):
-						try:
-							a.completeRemove()
-							continue
-						except RuntimeError:
-							log.exception(f"Failed to remove {name} add-on")
-							_failedPendingRemovals.add(name)
-					if (
-						isFirstLoad
-						and NVDAState.shouldWriteToDisk()
-						and (
-							name in state[AddonStateCategory.PENDING_INSTALL]
-							or a.path.endswith(ADDON_PENDINGINSTALL_SUFFIX)
-						)
-					):
-						newPath = a.completeInstall()
-						if newPath:
-							a = Addon(newPath)
-						else:  # installation failed
-							_failedPendingInstalls.add(name)
-					if (
-						isFirstLoad
-						and name in state[AddonStateCategory.PENDING_OVERRIDE_COMPATIBILITY]
-						and name not in _failedPendingInstalls
-					):
-						state[AddonStateCategory.OVERRIDE_COMPATIBILITY].add(name)
-						state[AddonStateCategory.PENDING_OVERRIDE_COMPATIBILITY].remove(name)
-					log.debug(
-						"Found add-on {name} - {a.version}."
-						" Requires API: {a.minimumNVDAVersion}."
-						" Last-tested API: {a.lastTestedNVDAVersion}".format(
-							name=name,
-							a=a,
-						),
-					)
-					if a.isDisabled:
-						log.debug("Disabling add-on %s", name)
-					if not (isAddonCompatible(a) or a.overrideIncompatibility):
-						log.debugWarning("Add-on %s is considered incompatible", name)
-						state[AddonStateCategory.BLOCKED].add(a.name)
-					yield a
-				except:  # noqa: E722
-					log.error("Error loading Addon from path: %s", addon_path, exc_info=True)
+					a.completeRemove()
+					continue
+				except RuntimeError:
+					log.exception(f"Failed to remove {name} add-on")
+					_failedPendingRemovals.add(name)
+			if (
+				isFirstLoad
+				and NVDAState.shouldWriteToDisk()
+				and (
+					name in state[AddonStateCategory.PENDING_INSTALL]
+					or a.path.endswith(ADDON_PENDINGINSTALL_SUFFIX)
+				)
+			):
+				newPath = a.completeInstall()
+				if newPath:
+					a = Addon(newPath)
+				else:  # installation failed
+					_failedPendingInstalls.add(name)
+			if (
+				isFirstLoad
+				and name in state[AddonStateCategory.PENDING_OVERRIDE_COMPATIBILITY]
+				and name not in _failedPendingInstalls
+			):
+				state[AddonStateCategory.OVERRIDE_COMPATIBILITY].add(name)
+				state[AddonStateCategory.PENDING_OVERRIDE_COMPATIBILITY].remove(name)
+			log.debug(
+				"Found add-on {name} - {a.version}."
+				" Requires API: {a.minimumNVDAVersion}."
+				" Last-tested API: {a.lastTestedNVDAVersion}".format(
+					name=name,
+					a=a,
+				),
+			)
+			if a.isDisabled:
+				log.debug("Disabling add-on %s", name)
+			if not (isAddonCompatible(a) or a.overrideIncompatibility):
+				log.debugWarning("Add-on %s is considered incompatible", name)
+				state[AddonStateCategory.BLOCKED].add(a.name)
+			yield a
+		except:  # noqa: E722
+			log.error("Error loading Addon from path: %s", addon_path, exc_info=True)
 
 
 _availableAddons = collections.OrderedDict()
@@ -428,6 +669,9 @@ def getAvailableAddons(
 		generators = [_getAvailableAddonsFromPath(path, isFirstLoad) for path in _getDefaultAddonPaths()]
 		for addon in itertools.chain(*generators):
 			_availableAddons[addon.path] = addon
+		_manifestIndex.prune(_availableAddons.keys())
+		if NVDAState.shouldWriteToDisk():
+			_manifestIndex.save()
 	return (addon for addon in _availableAddons.values() if not filterFunc or filterFunc(addon))
 
 
@@ -535,19 +779,7 @@ def __init__(self, path: str):
 		self._extendedPackages = set()
 		self._importedAddonModules: list[str] = []
 		self._modulesBeforeInstall: set[str] = set()
-		manifest_path = os.path.join(path, MANIFEST_FILENAME)
-		with open(manifest_path, "rb") as f:
-			translatedInput = None
-			for translatedPath in _translatedManifestPaths():
-				p = os.path.join(self.path, translatedPath)
-				if os.path.exists(p):
-					log.debug("Using manifest translation from %s", p)
-					translatedInput = open(p, "rb")
-					break
-			self._manifest = AddonManifest(f, translatedInput)
-			if self.manifest.errors is not None:
-				_report_manifest_errors(self.manifest)
-				raise AddonError("Manifest file has errors.")
+		self._manifest = _manifestIndex.getManifest(path)
 
 	def completeInstall(self) -> Optional[str]:
 		if not os.path.exists(self.pendingInstallPath):
@@ -886,6 +1118,32 @@ def initTranslation():
 		del callerFrame  # Avoid reference problems with frames (per python docs)
 
 
+def _readAddonManifest(path: str) -> "AddonManifest":
+	"""Parses and validates the manifest of the add-on in the given directory,
+	merging in its translation for the current NVDA language if there is one.
+	@param path: the base directory of the add-on.
+	@raise AddonError: if the manifest has errors.
+	"""
+	manifest_path = os.path.join(path, MANIFEST_FILENAME)
+	with open(manifest_path, "rb") as f:
+		translatedInput = None
+		for translatedPath in _translatedManifestPaths():
+			p = os.path.join(path, translatedPath)
+			if os.path.exists(p):
+				log.debug("Using manifest translation from %s", p)
+				translatedInput = open(p, "rb")
+				break
+		try:
+			manifest = AddonManifest(f, translatedInput)
+		finally:
+			if translatedInput is not None:
+				translatedInput.close()
+	if manifest.errors is not None:
+		_report_manifest_errors(manifest)
+		raise AddonError("Manifest file has errors.")
+	return manifest
+
+
 def _translatedManifestPaths(lang=None, forBundle=False):
 	if lang is None:
 		lang = languageHandler.getLanguage()  # can't rely on default keyword arguments here.
@@ -1097,6 +1355,23 @@ def __init__(self, input: IO[bytes], translatedInput: IO[bytes] | None = None):
 				if value:
 					self["symbolDictionaries"][fileName]["displayName"] = value
 
+	@classmethod
+	def _fromValidatedData(cls, data: dict, translatedData: dict | None = None) -> "AddonManifest":
+		"""Constructs an :class:`AddonManifest` from the data of a manifest which was already validated,
+		such as the result of :meth:`dict` on a manifest without errors.
+		Parsing and validation are skipped.
+
+		:param data: The validated manifest data, with any translation already merged in.
+		:param translatedData: The data of the translated manifest, defaults to ``None``
+		"""
+		manifest = cls.__new__(cls)
+		ConfigObj.__init__(manifest, data, encoding="utf-8", default_encoding="utf-8")
+		manifest._errors = None
+		manifest._translatedConfig = None
+		if translatedData is not None:
+			manifest._translatedConfig = ConfigObj(translatedData, encoding="utf-8", default_encoding="utf-8")
+		return manifest
+
 	@property
 	def errors(self):
 		return self._errors
@@ -3,7 +3,6 @@
 # This file is covered by the GNU General Public License.
 # See the file COPYING for more details.
 
-from copy import deepcopy
 import json
 import os
 import pathlib
@@ -32,6 +31,7 @@
 	AddonStoreModel,
 	CachedAddonsModel,
 	InstalledAddonStoreModel,
+	_copyAddonGUICollection,
 	_createAddonGUICollection,
 	_createInstalledStoreModelFromData,
 	_createStoreCollectionFromJson,
@@ -39,9 +39,11 @@
 from .models.channel import Channel
 from .models.status import AvailableAddonStatus, _canUpdateAddon, getStatus, _StatusFilterKey
 from .network import (
+	_closeSession,
 	_getCurrentApiVersionForURL,
 	_getAddonStoreURL,
 	_getCacheHashURL,
+	_getIfModified,
 	_LATEST_API_VER,
 )
 from .settings import _AddonStoreSettings
@@ -88,6 +90,8 @@ class _DataManager:
 	def __init__(self):
 		self._lang = languageHandler.getLanguage()
 		self._preferredChannel = Channel.ALL
+		self._cacheHash: Optional[str] = None
+		self._cacheHashETag: Optional[str] = None
 		self._cacheLatestFile = os.path.join(WritePaths.addonStoreDir, _DataManager._cacheLatestFilename)
 		self._cacheCompatibleFile = os.path.join(
 			WritePaths.addonStoreDir,
@@ -119,39 +123,64 @@ def terminate(self):
 			self._initialiseAvailableAddonsThread.join(timeout=1)
 		if self._initialiseAvailableAddonsThread.is_alive():
 			log.debugWarning("initialiseAvailableAddons thread did not terminate immediately")
+		_closeSession()
 
-	def _getLatestAddonsDataForVersion(self, apiVersion: str) -> Optional[bytes]:
+	def _getLatestAddonsDataForVersion(
+		self,
+		apiVersion: str,
+		etag: Optional[str] = None,
+	) -> Optional[requests.Response]:
+		"""Fetch the add-on data for an API version.
+		@param etag: The ETag of the cached data for this API version, if any.
+		@return: The response, with a status of either OK or not modified if C{etag} is provided,
+		or C{None} if the data could not be fetched.
+		"""
 		url = _getAddonStoreURL(self._preferredChannel, self._lang, apiVersion)
 		try:
 			log.debug(f"Fetching add-on data from {url}")
-			response = requests.get(url, timeout=FETCH_TIMEOUT_S)
+			response = _getIfModified(url, etag, timeout=FETCH_TIMEOUT_S)
 		except requests.exceptions.RequestException as e:
 			log.debugWarning(f"Unable to fetch addon data: {e}")
 			return None
+		if etag and response.status_code == requests.codes.not_modified:
+			log.debug(f"Add-on data not modified since last fetched from {url}")
+			return response
 		if response.status_code != requests.codes.OK:
 			log.error(
 				f"Unable to get data from API ({url}), response ({response.status_code}): {response.content}",
 			)
 			return None
-		return response.content
+		return response
 
 	def _getCacheHash(self) -> Optional[str]:
 		url = _getCacheHashURL()
 		try:
 			log.debug(f"Fetching add-on data from {url}")
-			response = requests.get(url, timeout=FETCH_TIMEOUT_S)
+			response = _getIfModified(url, self._cacheHashETag, timeout=FETCH_TIMEOUT_S)
 		except requests.exceptions.RequestException as e:
 			log.debugWarning(f"Unable to get cache hash: {e}")
 			return None
+		if self._cacheHashETag and response.status_code == requests.codes.not_modified:
+			return self._cacheHash
 		if response.status_code != requests.codes.OK:
 			log.error(
 				f"Unable to get data from API ({url}), response ({response.status_code}): {response.content}",
 			)
 			return None
 		cacheHash = response.json()
+		self._cacheHash = cacheHash
+		self._cacheHashETag = response.headers.get("ETag")
 		return cacheHash
 
-	def _cacheCompatibleAddons(self, addonData: str, cacheHash: Optional[str]):
+	def _getETagForRevalidation(self, cache: Optional[CachedAddonsModel]) -> Optional[str]:
+		"""Get the ETag to check whether cached add-on data is still up to date on the server.
+		@return: The ETag, or C{None} if the cache is for another language.
+		"""
+		if cache is None or cache.cachedLanguage != self._lang:
+			return None
+		return cache.etag
+
+	def _cacheCompatibleAddons(self, addonData: str, cacheHash: Optional[str], etag: Optional[str] = None):
 		if not NVDAState.shouldWriteToDisk():
 			return
 		if not addonData or not cacheHash:
@@ -161,11 +190,12 @@ def _cacheCompatibleAddons(self, addonData: str, cacheHash: Optional[str]):
 			"data": addonData,
 			"cachedLanguage": self._lang,
 			"nvdaAPIVersion": addonAPIVersion.CURRENT,
+			"etag": etag,
 		}
 		with open(self._cacheCompatibleFile, "w", encoding="utf-8") as cacheFile:
 			json.dump(cacheData, cacheFile, ensure_ascii=False)
 
-	def _cacheLatestAddons(self, addonData: str, cacheHash: Optional[str]):
+	def _cacheLatestAddons(self, addonData: str, cacheHash: Optional[str], etag: Optional[str] = None):
 		if not NVDAState.shouldWriteToDisk():
 			return
 		if not addonData or not cacheHash:
@@ -175,10 +205,26 @@ def _cacheLatestAddons(self, addonData: str, cacheHash: Optional[str]):
 			"data": addonData,
 			"cachedLanguage": self._lang,
 			"nvdaAPIVersion": _LATEST_API_VER,
+			"etag": etag,
 		}
 		with open(self._cacheLatestFile, "w", encoding="utf-8") as cacheFile:
 			json.dump(cacheData, cacheFile, ensure_ascii=False)
 
+	def _updateCacheHash(self, cacheFilePath: str, cacheHash: str):
+		"""Record in a cache file that its add-on data is still up to date for a new cache hash,
+		so that it isn't revalidated again when NVDA restarts.
+		"""
+		if not NVDAState.shouldWriteToDisk():
+			return
+		try:
+			with open(cacheFilePath, "r", encoding="utf-8") as cacheFile:
+				cacheData = json.load(cacheFile)
+			cacheData["cacheHash"] = cacheHash
+			with open(cacheFilePath, "w", encoding="utf-8") as cacheFile:
+				json.dump(cacheData, cacheFile, ensure_ascii=False)
+		except (OSError, JSONDecodeError):
+			log.exception(f"Unable to update add-on store cache: {cacheFilePath}")
+
 	def _getCachedAddonData(self, cacheFilePath: str) -> Optional[CachedAddonsModel]:
 		if not os.path.exists(cacheFilePath):
 			return None
@@ -206,6 +252,8 @@ def _getCachedAddonData(self, cacheFilePath: str) -> Optional[CachedAddonsModel]
 			cacheHash=cacheHash,
 			cachedLanguage=cachedLanguage,
 			nvdaAPIVersion=tuple(nvdaAPIVersion),  # loads as list,
+			# Caches written by older versions of NVDA have no ETag.
+			etag=cacheData.get("etag"),
 		)
 
 	# Translators: A title of the dialog shown when fetching add-on data from the store fails
@@ -236,18 +284,34 @@ def getLatestCompatibleAddons(
 			or self._compatibleAddonCache.cachedLanguage != self._lang
 		)
 		if shouldRefreshData:
-			apiData = self._getLatestAddonsDataForVersion(_getCurrentApiVersionForURL())
-			if apiData:
-				decodedApiData = apiData.decode()
+			response = self._getLatestAddonsDataForVersion(
+				_getCurrentApiVersionForURL(),
+				etag=(
+					self._getETagForRevalidation(self._compatibleAddonCache)
+					if self._compatibleAddonCache
+					and self._compatibleAddonCache.nvdaAPIVersion == addonAPIVersion.CURRENT
+					else None
+				),
+			)
+			if response is not None and response.status_code == requests.codes.not_modified:
+				# The cached data is still up to date, only the cache hash changed.
+				if cacheHash is not None:
+					self._compatibleAddonCache.cacheHash = cacheHash
+					self._updateCacheHash(self._cacheCompatibleFile, cacheHash)
+			elif response is not None and response.content:
+				decodedApiData = response.content.decode()
+				etag = response.headers.get("ETag")
 				self._cacheCompatibleAddons(
 					addonData=decodedApiData,
 					cacheHash=cacheHash,
+					etag=etag,
 				)
 				self._compatibleAddonCache = CachedAddonsModel(
 					cachedAddonData=_createStoreCollectionFromJson(decodedApiData),
 					cacheHash=cacheHash,
 					cachedLanguage=self._lang,
 					nvdaAPIVersion=addonAPIVersion.CURRENT,
+					etag=etag,
 				)
 			else:
 				self._do_displayError(
@@ -258,7 +322,7 @@ def getLatestCompatibleAddons(
 
 		if self._compatibleAddonCache is None:
 			return _createAddonGUICollection()
-		return deepcopy(self._compatibleAddonCache.cachedAddonData)
+		return _copyAddonGUICollection(self._compatibleAddonCache.cachedAddonData)
 
 	def getLatestAddons(
 		self,
@@ -272,18 +336,29 @@ def getLatestAddons(
 			or self._latestAddonCache.cachedLanguage != self._lang
 		)
 		if shouldRefreshData:
-			apiData = self._getLatestAddonsDataForVersion(_LATEST_API_VER)
-			if apiData:
-				decodedApiData = apiData.decode()
+			response = self._getLatestAddonsDataForVersion(
+				_LATEST_API_VER,
+				etag=self._getETagForRevalidation(self._latestAddonCache),
+			)
+			if response is not None and response.status_code == requests.codes.not_modified:
+				# The cached data is still up to date, only the cache hash changed.
+				if cacheHash is not None:
+					self._latestAddonCache.cacheHash = cacheHash
+					self._updateCacheHash(self._cacheLatestFile, cacheHash)
+			elif response is not None and response.content:
+				decodedApiData = response.content.decode()
+				etag = response.headers.get("ETag")
 				self._cacheLatestAddons(
 					addonData=decodedApiData,
 					cacheHash=cacheHash,
+					etag=etag,
 				)
 				self._latestAddonCache = CachedAddonsModel(
 					cachedAddonData=_createStoreCollectionFromJson(decodedApiData),
 					cacheHash=cacheHash,
 					cachedLanguage=self._lang,
 					nvdaAPIVersion=_LATEST_API_VER,
+					etag=etag,
 				)
 			else:
 				self._do_displayError(
@@ -294,7 +369,7 @@ def getLatestAddons(
 
 		if self._latestAddonCache is None:
 			return _createAddonGUICollection()
-		return deepcopy(self._latestAddonCache.cachedAddonData)
+		return _copyAddonGUICollection(self._latestAddonCache.cachedAddonData)
 
 	def _do_displayError(
 		self,
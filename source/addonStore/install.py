@@ -23,9 +23,13 @@
 	from addonHandler import AddonBundle, Addon as AddonHandlerModel  # noqa: F401
 
 
-def _getAddonBundleToInstallIfValid(addonPath: str) -> "AddonBundle":
+def _getAddonBundleToInstallIfValid(
+	addonPath: str,
+	bundle: Optional["AddonBundle"] = None,
+) -> "AddonBundle":
 	"""
 	@param addonPath: path to the 'nvda-addon' file.
+	@param bundle: The bundle already opened from addonPath, if any.
 	@return: the addonBundle, if valid
 	@raise DisplayableError if the addon bundle is invalid / incompatible.
 	"""
@@ -33,7 +37,8 @@ def _getAddonBundleToInstallIfValid(addonPath: str) -> "AddonBundle":
 	from gui.message import DisplayableError
 
 	try:
-		bundle = AddonBundle(addonPath)
+		if bundle is None:
+			bundle = AddonBundle(addonPath)
 	except AddonError:
 		log.error("Error opening addon bundle from %s" % addonPath, exc_info=True)
 		raise DisplayableError(
@@ -68,10 +73,11 @@ def _getPreviouslyInstalledAddonById(addon: "AddonBundle") -> Optional["AddonHan
 	return installedAddon
 
 
-def installAddon(addonPath: PathLike) -> None:
+def installAddon(addonPath: PathLike, bundle: Optional["AddonBundle"] = None) -> None:
 	"""Installs the addon at path.
 	Any error messages / warnings are presented to the user via a GUI message box.
 	If attempting to install an addon that is pending removal, it will no longer be pending removal.
+	@param bundle: The bundle already opened from addonPath, e.g. by L{addonHandler._inspectAddonBundles}.
 	@note See also L{gui.addonGui.installAddon}
 	@raise DisplayableError on failure
 	"""
@@ -79,7 +85,7 @@ def installAddon(addonPath: PathLike) -> None:
 	from gui.message import DisplayableError
 
 	addonPath = cast(str, addonPath)
-	bundle = _getAddonBundleToInstallIfValid(addonPath)
+	bundle = _getAddonBundleToInstallIfValid(addonPath, bundle)
 	prevAddon = _getPreviouslyInstalledAddonById(bundle)
 
 	addonObj = systemUtils.ExecAndPump[addonHandler.Addon](addonHandler.installAddonBundle, bundle).funcRes
@@ -322,6 +322,8 @@ class CachedAddonsModel:
 	cachedLanguage: str
 	# AddonApiVersionT or the string .network._LATEST_API_VER
 	nvdaAPIVersion: Union[addonAPIVersion.AddonApiVersionT, str]
+	etag: Optional[str] = None
+	"""The ETag of the cached data, used to check whether it has changed on the server."""
 
 
 def _createInstalledStoreModelFromData(addon: Dict[str, Any]) -> InstalledAddonStoreModel:
@@ -393,6 +395,14 @@ def _createAddonGUICollection() -> "AddonGUICollectionT":
 	return {channel: CaseInsensitiveDict() for channel in Channel if channel != Channel.ALL}
 
 
+def _copyAddonGUICollection(collection: "AddonGUICollectionT") -> "AddonGUICollectionT":
+	"""Copies the mapping of each channel of a collection,
+	so that add-ons can be added to or removed from the copy without affecting the original collection.
+	The add-on models are shared, as they are immutable.
+	"""
+	return {channel: addons.copy() for channel, addons in collection.items()}
+
+
 def _createStoreCollectionFromJson(jsonData: str) -> "AddonGUICollectionT":
 	"""Use json string to construct a listing of available addons.
 	See https://github.com/nvaccess/addon-datastore#api-data-generation-details
@@ -7,6 +7,8 @@
 	Future,
 	ThreadPoolExecutor,
 )
+import dataclasses
+import hashlib
 import os
 import pathlib
 import shutil
@@ -20,6 +22,7 @@
 )
 
 import requests
+from requests.adapters import HTTPAdapter
 
 import addonAPIVersion
 from core import callLater
@@ -27,7 +30,6 @@
 import NVDAState
 from NVDAState import WritePaths
 import threading
-from utils.security import sha256_checksum
 from config import conf
 
 from .models.addon import (
@@ -69,6 +71,104 @@ def _getCacheHashURL() -> str:
 	return f"{_getBaseURL()}/cacheHash.json"
 
 
+_MAX_CONCURRENT_DOWNLOADS = 10
+"""The maximum number of add-ons downloaded at the same time."""
+
+_session: Optional[requests.Session] = None
+_sessionLock = threading.Lock()
+
+
+def _getSession() -> requests.Session:
+	"""Get the session shared by all add-on store requests,
+	so that connections to the server are pooled and reused.
+	"""
+	global _session
+	with _sessionLock:
+		if _session is None:
+			_session = requests.Session()
+			adapter = HTTPAdapter(pool_maxsize=_MAX_CONCURRENT_DOWNLOADS)
+			_session.mount("https://", adapter)
+			_session.mount("http://", adapter)
+		return _session
+
+
+def _closeSession() -> None:
+	"""Close the pooled connections of the shared session."""
+	global _session
+	with _sessionLock:
+		if _session is not None:
+			_session.close()
+			_session = None
+
+
+def _getIfModified(url: str, etag: Optional[str], timeout: float) -> requests.Response:
+	"""Fetch a URL with the shared session.
+	@param etag: The ETag of the cached content for this URL, if any.
+	When provided, the server responds with a status of 304 (not modified) and no content,
+	if the content has not changed.
+	"""
+	headers = {"If-None-Match": etag} if etag else None
+	return _getSession().get(url, headers=headers, timeout=timeout)
+
+
+@dataclasses.dataclass
+class _PartialDownload:
+	"""The part of an add-on file downloaded so far,
+	used to resume an interrupted download and to compute the checksum while downloading.
+	"""
+
+	url: str
+	size: int = 0
+	"""The number of bytes written to the download file."""
+	sha256: "hashlib._Hash" = dataclasses.field(default_factory=hashlib.sha256)
+	"""The checksum of the bytes written to the download file."""
+	validator: Optional[str] = None
+	"""The strong ETag or last modification date of the file, used to ensure it has not changed when resuming."""
+
+	def reset(self, response: requests.Response):
+		"""Start over with the full content of the given response."""
+		self.size = 0
+		self.sha256 = hashlib.sha256()
+		etag = response.headers.get("ETag")
+		if etag and not etag.startswith("W/"):
+			self.validator = etag
+		else:
+			self.validator = response.headers.get("Last-Modified")
+
+	def getRangeHeaders(self) -> Dict[str, str]:
+		"""The headers to request the rest of the file."""
+		if not self.size:
+			return {}
+		headers = {"Range": f"bytes={self.size}-"}
+		if self.validator:
+			headers["If-Range"] = self.validator
+		return headers
+
+	def isResumedBy(self, response: requests.Response) -> bool:
+		"""Whether the response contains the rest of the file."""
+		return (
+			self.size > 0
+			and response.status_code == requests.codes.partial_content
+			and response.headers.get("Content-Range", "").startswith(f"bytes {self.size}-")
+		)
+
+
+class _RetryableHTTPError(requests.exceptions.HTTPError):
+	"""An HTTP error status which is likely temporary, such as an overloaded server."""
+
+	STATUS_CODES = frozenset(
+		{
+			requests.codes.request_timeout,
+			requests.codes.too_many_requests,
+			requests.codes.internal_server_error,
+			requests.codes.bad_gateway,
+			requests.codes.service_unavailable,
+			requests.codes.gateway_timeout,
+		},
+	)
+	"""The statuses after which a request is worth retrying."""
+
+
 class AddonFileDownloader:
 	OnCompleteT = Callable[
 		["AddonListItemVM[_AddonStoreModel]", Optional[os.PathLike]],
@@ -104,8 +204,14 @@ def __init__(self):
 			# Path to downloaded file
 			Optional[os.PathLike],
 		] = {}
+		self._partialDownloads: Dict[str, _PartialDownload] = {}
+		"""
+		Interrupted downloads which can be resumed, keyed by download file path.
+
+		Usage should be protected by AddonFileDownloader.DOWNLOAD_LOCK.
+		"""
 		self._executor = ThreadPoolExecutor(
-			max_workers=10,
+			max_workers=_MAX_CONCURRENT_DOWNLOADS,
 			thread_name_prefix="AddonDownloader",
 		)
 
@@ -154,7 +260,9 @@ def _done(self, downloadAddonFuture: Future[Optional[os.PathLike]]):
 			try:
 				with self.DOWNLOAD_LOCK:
 					# If the download was cancelled, the file may have been partially downloaded.
-					os.remove(self._pending[downloadAddonFuture][0].model.tempDownloadPath)
+					tempDownloadPath = self._pending[downloadAddonFuture][0].model.tempDownloadPath
+					self._partialDownloads.pop(tempDownloadPath, None)
+					os.remove(tempDownloadPath)
 			except FileNotFoundError:
 				pass
 			except Exception as e:
@@ -200,24 +308,93 @@ def cancelAll(self):
 			self._pending.clear()
 		shutil.rmtree(WritePaths.addonStoreDownloadDir)
 
+	_RESUMABLE_ERRORS = (
+		requests.exceptions.ConnectionError,
+		requests.exceptions.ChunkedEncodingError,
+		requests.exceptions.ReadTimeout,
+		_RetryableHTTPError,
+	)
+	"""Errors after which a download is resumed."""
+	MAX_DOWNLOAD_ATTEMPTS = 3
+	"""The number of times an interrupted download is resumed before giving up."""
+
 	def _downloadAddonToPath(
 		self,
 		addonData: "AddonListItemVM[_AddonStoreModel]",
 		downloadFilePath: str,
-	) -> bool:
+	) -> Optional[str]:
 		"""
-		@return: True if the add-on is downloaded successfully,
-		False if the download is cancelled
+		Download an add-on file, resuming an interrupted download of the same file if possible.
+		@return: The sha256 hex digest of the downloaded file if the add-on is downloaded successfully,
+		None if the download is cancelled
 		"""
 		if not NVDAState.shouldWriteToDisk():
 			log.error("Should not write to disk, cancelling download")
-			return False
+			return None
+
+		url = addonData.model.URL
+		with self.DOWNLOAD_LOCK:
+			partial = self._partialDownloads.pop(downloadFilePath, None)
+			if (
+				partial is None
+				or partial.url != url
+				or not os.path.exists(downloadFilePath)
+				or os.path.getsize(downloadFilePath) != partial.size
+			):
+				partial = _PartialDownload(url)
+		attempt = 1
+		while True:
+			try:
+				if not self._streamAddonToPath(addonData, downloadFilePath, partial):
+					return None  # The download was cancelled
+				return partial.sha256.hexdigest()
+			except self._RESUMABLE_ERRORS as e:
+				if attempt >= self.MAX_DOWNLOAD_ATTEMPTS:
+					with self.DOWNLOAD_LOCK:
+						# Allow the user to resume the download when trying again.
+						self._partialDownloads[downloadFilePath] = partial
+					raise
+				attempt += 1
+				log.debugWarning(
+					f"Download of {addonData.model.addonId} interrupted after {partial.size} bytes, resuming: {e}",
+				)
 
+	def _streamAddonToPath(
+		self,
+		addonData: "AddonListItemVM[_AddonStoreModel]",
+		downloadFilePath: str,
+		partial: _PartialDownload,
+	) -> bool:
+		"""
+		Write the rest of an add-on file to the download file, updating its checksum on the fly.
+		@return: True if the add-on is downloaded successfully,
+		False if the download is cancelled
+		"""
 		# Some add-ons are quite large, so we need to allow for a long download time.
 		# 1GB at 0.5 MB/s takes 4.5hr to download.
 		MAX_ADDON_DOWNLOAD_TIME = 60 * 60 * 6  # 6 hours
-		with requests.get(addonData.model.URL, stream=True, timeout=MAX_ADDON_DOWNLOAD_TIME) as r:
-			with open(downloadFilePath, "wb") as fd:
+		with _getSession().get(
+			partial.url,
+			stream=True,
+			timeout=MAX_ADDON_DOWNLOAD_TIME,
+			headers=partial.getRangeHeaders(),
+		) as r:
+			if r.status_code == requests.codes.range_not_satisfiable and partial.size:
+				# The file is no longer as long as the partial download, so it can't be resumed.
+				log.debug(f"Unable to resume download of {addonData.model.addonId}, starting over")
+				partial.reset(r)
+				return self._streamAddonToPath(addonData, downloadFilePath, partial)
+			try:
+				r.raise_for_status()
+			except requests.exceptions.HTTPError as e:
+				if r.status_code in _RetryableHTTPError.STATUS_CODES:
+					raise _RetryableHTTPError(*e.args, response=r) from e
+				raise
+			if partial.isResumedBy(r):
+				log.debug(f"Resuming download of {addonData.model.addonId} from byte {partial.size}")
+			else:
+				partial.reset(r)
+			with open(downloadFilePath, "ab" if partial.size else "wb") as fd:
 				# Most add-ons are small. This value was chosen quite arbitrarily, but with the intention to allow
 				# interrupting the download. This is particularly important on a slow connection, to provide
 				# a responsive UI when cancelling.
@@ -229,6 +406,8 @@ def _downloadAddonToPath(
 				for chunk in r.iter_content(chunk_size=chunkSize):
 					with self.DOWNLOAD_LOCK:
 						fd.write(chunk)
+						partial.size += len(chunk)
+						partial.sha256.update(chunk)
 						if addonData in self.progress:  # Removed when the download should be cancelled.
 							self.progress[addonData] += 1
 						else:
@@ -255,7 +434,8 @@ def _download(self, listItem: "AddonListItemVM[_AddonStoreModel]") -> Optional[o
 				log.debug("the download was cancelled before it started.")
 				return None  # The download was cancelled
 		try:
-			if not self._downloadAddonToPath(listItem, inProgressFilePath):
+			sha256Addon = self._downloadAddonToPath(listItem, inProgressFilePath)
+			if sha256Addon is None:
 				return None  # The download was cancelled
 		except requests.exceptions.RequestException as e:
 			log.debugWarning(f"Unable to download addon file: {e}")
@@ -277,7 +457,7 @@ def _download(self, listItem: "AddonListItemVM[_AddonStoreModel]") -> Optional[o
 				).format(name=addonData.displayName),
 				_addonDownloadFailureMessageTitle,
 			)
-		if not self._checkChecksum(inProgressFilePath, addonData):
+		if sha256Addon.casefold() != addonData.sha256.casefold():
 			with self.DOWNLOAD_LOCK:
 				os.remove(inProgressFilePath)
 			log.debugWarning(f"Cache file deleted, checksum mismatch: {inProgressFilePath}")
@@ -295,13 +475,6 @@ def _download(self, listItem: "AddonListItemVM[_AddonStoreModel]") -> Optional[o
 		log.debug(f"Cache file available: {cacheFilePath}")
 		return cast(os.PathLike, cacheFilePath)
 
-	@staticmethod
-	def _checkChecksum(addonFilePath: str, addonData: _AddonStoreModel) -> bool:
-		with AddonFileDownloader.DOWNLOAD_LOCK:
-			with open(addonFilePath, "rb") as f:
-				sha256Addon = sha256_checksum(f)
-		return sha256Addon.casefold() == addonData.sha256.casefold()
-
 	@staticmethod
 	def _getCacheFilenameForAddon(addonData: _AddonGUIModel) -> str:
 		return f"{addonData.addonId}-{addonData.addonVersionName}.nvda-addon"
@@ -0,0 +1,94 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Searching the add-ons listed in the add-on store."""
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+
+from .models.addon import (
+	_AddonGUIModel,
+	_AddonManifestModel,
+	_AddonStoreModel,
+)
+
+
+def _getSearchTexts(model: _AddonGUIModel) -> tuple[str, ...]:
+	"""Gets the case folded texts of an add-on which are matched against a search term."""
+	texts = [model.displayName, model.description, model.addonId]
+	if isinstance(model, _AddonStoreModel):
+		texts.append(model.publisher)
+	if isinstance(model, _AddonManifestModel):
+		texts.append(model.author)
+	return tuple(text.casefold() for text in texts)
+
+
+class _AddonSearchIndex:
+	"""An index of the add-ons in a list, to find the add-ons whose display name, description, ID,
+	publisher or author contain a search term, ignoring case.
+
+	Each text is indexed by its n-grams of up to L{_NGRAM_LENGTH} characters.
+	The candidates for a term are the add-ons containing all the n-grams of the term,
+	which are then checked for the whole term.
+	As the user types in the search box, a term usually extends the previous one,
+	in which case only the add-ons matching the previous term are checked.
+	"""
+
+	_NGRAM_LENGTH = 3
+
+	def __init__(self, models: Mapping[str, _AddonGUIModel]):
+		"""
+		@param models: The add-ons to index, by the ID of their list item.
+		"""
+		self._searchTexts: dict[str, tuple[str, ...]] = {}
+		self._ngramIndex: defaultdict[str, set[str]] = defaultdict(set)
+		for listItemId, model in models.items():
+			texts = _getSearchTexts(model)
+			self._searchTexts[listItemId] = texts
+			for text in texts:
+				for ngram in self._getNgrams(text):
+					self._ngramIndex[ngram].add(listItemId)
+		self._lastTerm: str | None = None
+		self._lastMatches: frozenset[str] = frozenset()
+
+	@classmethod
+	def _getNgrams(cls, text: str) -> Iterable[str]:
+		for length in range(1, cls._NGRAM_LENGTH + 1):
+			for start in range(len(text) - length + 1):
+				yield text[start : start + length]
+
+	def _getCandidates(self, term: str) -> Iterable[str]:
+		if not term:
+			return self._searchTexts.keys()
+		if len(term) <= self._NGRAM_LENGTH:
+			return self._ngramIndex.get(term, ())
+		postings = []
+		for start in range(len(term) - self._NGRAM_LENGTH + 1):
+			posting = self._ngramIndex.get(term[start : start + self._NGRAM_LENGTH])
+			if not posting:
+				return ()
+			postings.append(posting)
+		postings.sort(key=len)
+		return set.intersection(*postings)
+
+	def search(self, term: str) -> frozenset[str]:
+		"""Finds the add-ons with a text containing term, ignoring case.
+		@param term: The search term.
+		@return: The IDs of the list items of the matching add-ons.
+		"""
+		term = term.casefold()
+		if self._lastTerm is not None and self._lastTerm in term:
+			# Any add-on containing the new term also contains the previous one.
+			candidates = self._lastMatches
+		else:
+			candidates = self._getCandidates(term)
+		matches = frozenset(
+			listItemId
+			for listItemId in candidates
+			if any(term in text for text in self._searchTexts[listItemId])
+		)
+		self._lastTerm = term
+		self._lastMatches = matches
+		return matches
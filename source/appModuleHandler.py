@@ -345,6 +345,12 @@ def reloadAppModules():
 			continue
 		# Fetch and cache right away; the process could die any time.
 		obj.appModule
+	# Import late to avoid circular import.
+	import inputCore
+	import scriptHandler
+
+	inputCore.clearGlobalGestureMapIndexes()
+	scriptHandler.clearFindScriptCache()
 
 
 def initialize():
@@ -177,6 +177,14 @@ def _createNVDAArgParser() -> NoConsoleOptionParser:
 		"This setting can be overwritten with other log level (--loglevel, -l) "
 		"switch or if debug logging is specified.",
 	)
+	parser.add_argument(
+		"--async-logging",
+		action="store_true",
+		dest="asyncLogging",
+		default=False,
+		help="Write log messages to the log file on a background thread.\n"
+		"This reduces the impact of logging, particularly debug logging, on responsiveness.",
+	)
 	parser.add_argument(
 		"--no-sr-flag",
 		action="store_false",
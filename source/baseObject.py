@@ -220,6 +220,9 @@ class ScriptableObject(AutoPropertyObject, metaclass=ScriptableType):
 	@type scriptCategory: str
 	"""
 
+	_gestureBindingsGeneration: int = 0
+	"""Incremented whenever the gesture bindings of this object change."""
+
 	def __init__(self):
 		#: Maps input gestures to script functions.
 		#: @type: dict
@@ -261,6 +264,7 @@ def bindGesture(self, gestureIdentifier, scriptName):
 		import inputCore
 
 		self._gestureMap[inputCore.normalizeGestureIdentifier(gestureIdentifier)] = func
+		self._gestureBindingsGeneration += 1
 
 	def removeGestureBinding(self, gestureIdentifier):
 		"""
@@ -273,10 +277,12 @@ def removeGestureBinding(self, gestureIdentifier):
 		import inputCore
 
 		del self._gestureMap[inputCore.normalizeGestureIdentifier(gestureIdentifier)]
+		self._gestureBindingsGeneration += 1
 
 	def clearGestureBindings(self):
 		"""Remove all input gesture bindings from this object."""
 		self._gestureMap.clear()
+		self._gestureBindingsGeneration += 1
 
 	def bindGestures(self, gestureMap):
 		"""Bind or unbind multiple input gestures.
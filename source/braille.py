@@ -909,7 +909,7 @@ def getControlFieldBraille(
 	field: textInfos.Field,
 	ancestors: typing.List[textInfos.Field],
 	reportStart: bool,
-	formatConfig: config.AggregatedSection,
+	formatConfig: config.AggregatedSection | typing.Mapping[str, Any],
 ) -> Optional[str]:
 	presCat = field.getPresentationCategory(ancestors, formatConfig)
 	# Cache this for later use.
@@ -1045,7 +1045,7 @@ def _getControlFieldForTableCell(
 	hasDetails: bool,
 	detailsRoles: _AnnotationRolesT,
 	field: textInfos.Field,
-	formatConfig: config.AggregatedSection,
+	formatConfig: config.AggregatedSection | typing.Mapping[str, Any],
 	states: Set[controlTypes.State],
 ) -> str:
 	reportTableHeaders = formatConfig["reportTableHeaders"]
@@ -1466,7 +1466,7 @@ def _getReadingUnit(self):
 		return textInfos.UNIT_PARAGRAPH if config.conf["braille"]["readByParagraph"] else textInfos.UNIT_LINE
 
 	def update(self):
-		formatConfig = config.conf["documentFormatting"]
+		formatConfig = config.conf.getSectionSnapshot("documentFormatting")
 		unit = self._getReadingUnit()
 		self.rawText = ""
 		self.rawTextTypeforms = []
@@ -2287,6 +2287,24 @@ def formatCellsForLog(cells: List[int]) -> str:
 	)
 
 
+def _getChangedCellsSpan(oldCells: List[int], newCells: List[int]) -> Tuple[int, int]:
+	"""Finds the span of cells which differ between two arrays of cells of the same length.
+	@param oldCells: The cells displayed before.
+	@param newCells: The cells to display.
+	@return: The index of the first changed cell and the index after the last changed cell.
+		Both are 0 if no cells changed.
+	"""
+	start = 0
+	end = len(newCells)
+	while start < end and oldCells[start] == newCells[start]:
+		start += 1
+	if start == end:
+		return (0, 0)
+	while oldCells[end - 1] == newCells[end - 1]:
+		end -= 1
+	return (start, end)
+
+
 pre_writeCells = extensionPoints.Action()
 """
 Notifies when cells are about to be written to a braille display.
@@ -2421,6 +2439,18 @@ def __init__(self):
 			self._tether = config.conf["braille"]["tetherTo"]
 		self._detector = None
 		self._rawText = ""
+		self._lastDisplayedCells: Optional[Tuple["BrailleDisplayDriver", List[int]]] = None
+		"""
+		The display the handler last wrote cells to, along with these cells.
+		Writes of the same cells to the same display are skipped,
+		and drivers which support it are told which cells changed.
+		"""
+		self._lastQueuedCells: Optional[Tuple["BrailleDisplayDriver", List[int]]] = None
+		"""
+		For thread safe displays, the display and cells last taken from L{queuedWrite} by the background thread,
+		which may still be writing them.
+		Protected by L{queuedWriteLock}.
+		"""
 
 		self.queuedWriteLock = threading.Lock()
 		self.ackTimerHandle = winKernel.createWaitableTimer()
@@ -2743,6 +2773,7 @@ def _setDisplay(
 		oldDisplay = self.display
 		newDisplay = self._switchDisplay(oldDisplay, newDisplayClass, **kwargs)
 		self.display = newDisplay
+		self.invalidateDisplayedCells()
 		log.info(
 			f"Loaded braille display driver {newDisplay.name!r}, current display has {newDisplay.numCells} cells.",
 		)
@@ -2824,13 +2855,16 @@ def _writeCells(self, cells: List[int]):
 		)
 		if not self.display.isThreadSafe:
 			try:
-				self.display.display(cells)
+				self._displayCells(cells)
 			except:  # noqa: E722
 				log.error("Error displaying cells. Disabling display", exc_info=True)
 				self.handleDisplayUnavailable()
 			return
 		with self.queuedWriteLock:
 			alreadyQueued: Optional[List[int]] = self.queuedWrite
+			if not alreadyQueued and self._lastQueuedCells == (self.display, cells):
+				# The display already shows these cells, or is being written these cells.
+				return
 			self.queuedWrite = cells
 		# If a write was already queued, we don't need to queue another;
 		# we just replace the data.
@@ -2840,6 +2874,40 @@ def _writeCells(self, cells: List[int]):
 			# Queue a call to the background thread.
 			self._writeCellsInBackground()
 
+	def _displayCells(self, cells: List[int]) -> bool:
+		"""Writes cells to the display, unless it already shows them.
+		If the display supports partial updates, it is told which cells changed.
+		@param cells: The cells to display, normalized to the size of the display.
+		@return: Whether the cells were written.
+		"""
+		display = self.display
+		lastDisplayedCells = self._lastDisplayedCells
+		if lastDisplayedCells is not None and lastDisplayedCells[0] is display:
+			oldCells = lastDisplayedCells[1]
+		else:
+			oldCells = None
+		if oldCells == cells:
+			return False
+		# Copy the cells, as the caller may go on modifying them.
+		cells = list(cells)
+		if display.supportsPartialUpdate and oldCells is not None and len(oldCells) == len(cells):
+			start, end = _getChangedCellsSpan(oldCells, cells)
+			display.displayChangedCells(cells, start, end)
+		else:
+			display.display(cells)
+		self._lastDisplayedCells = (display, cells)
+		return True
+
+	def invalidateDisplayedCells(self):
+		"""Forgets which cells the display shows, so that the next update writes all cells to it.
+		Drivers should call this when the display lost its content,
+		e.g. after reconnecting or leaving an internal menu,
+		before asking the handler to update the display.
+		"""
+		with self.queuedWriteLock:
+			self._lastQueuedCells = None
+		self._lastDisplayedCells = None
+
 	def _writeCellsInBackground(self):
 		"""Writes cells to a braille display in the background by queuing a function to the i/o thread."""
 		hwIo.bgThread.queueAsApc(self._bgThreadExecutor)
@@ -3253,15 +3321,18 @@ def _bgThreadExecutor(self, param: int):
 		with self.queuedWriteLock:
 			data: Optional[List[int]] = self.queuedWrite
 			self.queuedWrite = None
+			if data:
+				# Copy the cells, as the caller may go on modifying them.
+				self._lastQueuedCells = (self.display, list(data))
 		if not data:
 			return
 		try:
-			self.display.display(data)
+			displayed = self._displayCells(data)
 		except:  # noqa: E722
 			log.error("Error displaying cells. Disabling display", exc_info=True)
 			self.handleDisplayUnavailable()
 		else:
-			if self.display.receivesAckPackets:
+			if displayed and self.display.receivesAckPackets:
 				self.display._awaitingAck = True
 				SECOND_TO_MS = 1000
 				hwIo.bgThread.setWaitableTimer(
@@ -3276,6 +3347,8 @@ def _ackTimeoutResetter(self, param: int):
 		if self.display and self.display.receivesAckPackets and self.display._awaitingAck:
 			log.debugWarning(f"Waiting for {self.display.name} ACK packet timed out")
 			self.display._awaitingAck = False
+			# The display may not have received the last cells written.
+			self.invalidateDisplayedCells()
 			self._writeCellsInBackground()
 
 
@@ -3468,6 +3541,25 @@ def display(self, cells):
 		@type cells: [int, ...]
 		"""
 
+	#: Whether this driver can write only the cells which changed since the last write.
+	#: If it can, L{displayChangedCells} is called rather than L{display} when part of the display changes.
+	#: This is useful for protocols which support writing a window of cells,
+	#: particularly over slow connections.
+	supportsPartialUpdate: bool = False
+
+	def displayChangedCells(self, cells: List[int], start: int, end: int):
+		"""Display the given braille cells, of which only some changed since the last call to L{display}
+		or L{displayChangedCells}.
+		This is only called if L{supportsPartialUpdate} is C{True}.
+		Drivers which lose track of what the display shows, e.g. because it reconnected,
+		may still write all cells.
+		The base implementation writes all cells with L{display}.
+		@param cells: All the braille cells to display.
+		@param start: The index of the first changed cell.
+		@param end: The index after the last changed cell.
+		"""
+		self.display(cells)
+
 	#: Automatic port constant to be used by braille displays that support the "automatic" port
 	#: Kept for backwards compatibility
 	AUTOMATIC_PORT = AUTOMATIC_PORT
@@ -574,6 +574,7 @@ def _handleInitPackets(self, data: bytes):
 		if len(self._oldCells) == self.numCells:
 			# Ensure display is updated after reconnection and exit from internal menu.
 			self._clearOldCells()
+			braille.handler.invalidateDisplayedCells()
 			braille.handler._displayWithCursor()
 			log.debug(
 				"Updated display content after reconnection or display menu exit",
@@ -316,6 +316,10 @@ def _set_brailleDestination(self, value: str):
 			raise RuntimeError("No board information")
 		if value != self._brailleDestination:
 			self.display([0] * self.numRows * self.numCols)
+			if braille.handler:
+				# The display was cleared behind the handler's back,
+				# so the next update must write all cells to the new destination.
+				braille.handler.invalidateDisplayedCells()
 		if (
 			value == BrailleDestination.TEXT
 			and self._boardInformation.features & DP_Features.HAS_TEXT_DISPLAY
@@ -211,6 +211,7 @@ def _onReceive(self, data: bytes):
 			elif packetType == constants.EB_MODE:
 				if packetSubType == constants.EB_MODE_DRIVER:
 					log.debug("Braille display switched to driver mode, updating display...")
+					braille.handler.invalidateDisplayedCells()
 					braille.handler.update()
 				elif packetSubType == constants.EB_MODE_INTERNAL:
 					log.debug("Braille display switched to internal mode")
@@ -3,10 +3,14 @@
 # See the file COPYING for more details.
 # Copyright (C) 2012-2024 NV Access Limited, Rui Batista, Babbage B.V., Julien Cochuyt, Leonard de Ruijter
 
+import threading
 import time
-from typing import Optional, List, Set
+from collections import OrderedDict
+from queue import SimpleQueue
+from typing import Callable, Optional, List, Sequence, Set, Tuple
 
 import louis
+import louisHelper
 import brailleTables
 import braille
 import config
@@ -18,6 +22,7 @@
 import api
 from baseObject import AutoPropertyObject
 import keyLabels
+import queueHandler
 import struct
 
 
@@ -42,6 +47,120 @@
 UNICODE_BRAILLE_PROTECTED = "⣿"  # All dots down
 
 
+#: A function which back-translates a string of dotsIO braille,
+#: given the list of tables to use and the liblouis mode.
+BackTranslateFunc = Callable[[List[str], str, int], str]
+
+
+class BackTranslator:
+	"""Back-translates braille input, reusing the translations of cells entered previously.
+	Translations are cached, so that translating the same cells again is instant;
+	e.g. when a cell is erased and the cells before it are translated again.
+	In incremental mode, the text for the cells up to the last word boundary (a blank cell) is reused,
+	and only the cells after it are translated again.
+	This is only correct for tables without indicators which span words,
+	such as capitalized or grade 1 passage indicators.
+	Translation can also be done in the background; see L{translateInBackground}.
+	"""
+
+	#: The maximum number of translations to cache.
+	cacheSize: int = 128
+
+	def __init__(
+		self,
+		backTranslate: BackTranslateFunc = louisHelper.backTranslate,
+		incremental: bool = False,
+	):
+		"""
+		@param backTranslate: The function which translates cells.
+		@param incremental: Whether to only translate the cells after the last word boundary.
+			L{BrailleInputHandler} only buffers one word, so it doesn't use this.
+		"""
+		self._backTranslate = backTranslate
+		self.incremental = incremental
+		#: Maps tables, mode and cells to the text they were translated to, least recently used first.
+		self._cache: OrderedDict[Tuple[Tuple[str, ...], int, Tuple[int, ...]], str] = OrderedDict()
+		self._cacheLock = threading.Lock()
+		self._queue: SimpleQueue = SimpleQueue()
+		self._thread: Optional[threading.Thread] = None
+
+	def translate(self, tables: List[str], cells: Sequence[int], mode: int) -> str:
+		"""Back-translates cells.
+		This can be called from any thread.
+		@param tables: The file names of the tables to use.
+		@param cells: The cells, without L{LOUIS_DOTS_IO_START}.
+		@param mode: The liblouis translation mode, which should include C{louis.dotsIO}.
+		@return: The text.
+		"""
+		key = (tuple(tables), mode, tuple(cells))
+		with self._cacheLock:
+			text = self._cache.get(key)
+			if text is not None:
+				self._cache.move_to_end(key)
+				return text
+		cells = key[2]
+		boundary = 0
+		if self.incremental:
+			# Don't consider a blank cell at the end, which just ends the word.
+			for index in range(len(cells) - 2, -1, -1):
+				if cells[index] == 0:
+					boundary = index + 1
+					break
+		prefix = self.translate(tables, cells[:boundary], mode) if boundary else ""
+		text = prefix + self._translateCells(tables, cells[boundary:], mode)
+		with self._cacheLock:
+			self._cache[key] = text
+			if len(self._cache) > self.cacheSize:
+				self._cache.popitem(last=False)
+		return text
+
+	def _translateCells(self, tables: List[str], cells: Sequence[int], mode: int) -> str:
+		data = "".join([chr(cell | LOUIS_DOTS_IO_START) for cell in cells])
+		return self._backTranslate(list(tables), data, mode)
+
+	def translateInBackground(
+		self,
+		tables: List[str],
+		cells: Sequence[int],
+		mode: int,
+		onResult: Callable[[str], None],
+	):
+		"""Back-translates cells on a background thread.
+		Translations are done in the order in which they were requested.
+		@param tables: The file names of the tables to use.
+		@param cells: The cells, without L{LOUIS_DOTS_IO_START}.
+		@param mode: The liblouis translation mode, which should include C{louis.dotsIO}.
+		@param onResult: Called on the main thread with the text.
+		"""
+		if self._thread is None:
+			self._thread = threading.Thread(
+				name=f"{__name__}.{self.__class__.__qualname__}",
+				target=self._run,
+				daemon=True,
+			)
+			self._thread.start()
+		self._queue.put((list(tables), tuple(cells), mode, onResult))
+
+	def _run(self):
+		while True:
+			request = self._queue.get()
+			if request is None:
+				break
+			tables, cells, mode, onResult = request
+			try:
+				text = self.translate(tables, cells, mode)
+			except Exception:
+				log.error(f"Error back-translating {cells!r}", exc_info=True)
+				continue
+			queueHandler.queueFunction(queueHandler.eventQueue, onResult, text)
+
+	def terminate(self):
+		"""Stops the background thread once it is done with pending translations."""
+		if self._thread is not None:
+			self._queue.put(None)
+			self._thread = None
+
+
 class BrailleInputHandler(AutoPropertyObject):
 	"""Handles braille input."""
 
@@ -81,6 +200,12 @@ def __init__(self):
 		self._uncontSentTime = None
 		#: The modifiers currently being held virtually to be part of the next braille input gesture.
 		self.currentModifiers = set()
+		self._backTranslator = BackTranslator()
+		#: Incremented whenever the buffer is cleared,
+		#: so that background translations of cells which are no longer buffered don't update L{bufferText}.
+		self._bufferGeneration = 0
+		#: The buffer generation and text of the last translation done to report a contracted cell.
+		self._lastReportTranslation: Tuple[int, str] = (0, "")
 		self.handlePostConfigProfileSwitch()
 		config.post_configProfileSwitch.register(self.handlePostConfigProfileSwitch)
 
@@ -110,6 +235,13 @@ def _get_currentFocusIsTextObj(self):
 	def _get_useContractedForCurrentFocus(self):
 		return self._table.contracted and self.currentFocusIsTextObj and not self.currentModifiers
 
+	# Provided by auto property: L{_get_translationTables}
+	translationTables: List[str]
+
+	def _get_translationTables(self) -> List[str]:
+		"""The tables with which to back-translate braille input."""
+		return [self._table.fileName, "braille-patterns.cti"]
+
 	def _translate(self, endWord: bool) -> bool:
 		"""Translate buffered braille up to the cursor.
 		Any text produced is sent to the system.
@@ -124,15 +256,12 @@ def _translate(self, endWord: bool) -> bool:
 			self.bufferText = ""
 		oldTextLen = len(self.bufferText)
 		pos = self.untranslatedStart + self.untranslatedCursorPos
-		data = "".join([chr(cell | LOUIS_DOTS_IO_START) for cell in self.bufferBraille[:pos]])
 		mode = louis.dotsIO | louis.noUndefinedDots
 		if (not self.currentFocusIsTextObj or self.currentModifiers) and self._table.contracted:
 			mode |= louis.partialTrans
-		self.bufferText = louis.backTranslate(
-			[self._table.fileName, "braille-patterns.cti"],
-			data,
-			mode=mode,
-		)[0]
+		self.bufferText = self._backTranslator.translate(
+			self.translationTables, self.bufferBraille[:pos], mode
+		)
 		newText = self.bufferText[oldTextLen:]
 		if newText:
 			# New text was generated by the cells just entered.
@@ -160,6 +289,7 @@ def _translate(self, endWord: bool) -> bool:
 			# Clear the previous word (anything before the cursor) from the buffer.
 			del self.bufferBraille[:pos]
 			self.bufferText = ""
+			self._bufferGeneration += 1
 			self.cellsWithText.clear()
 			self.currentModifiers.clear()
 			self.untranslatedStart = 0
@@ -171,21 +301,55 @@ def _translate(self, endWord: bool) -> bool:
 
 		return False
 
-	def _translateForReportContractedCell(self, pos):
+	def _bufferHasText(self) -> bool:
+		"""Whether the buffered cells up to the cursor produce text.
+		In contracted text fields, L{bufferText} might not have been updated yet by a background translation,
+		so the cells are translated, which is instant if the background translation is done.
+		"""
+		if not self.useContractedForCurrentFocus:
+			return bool(self.bufferText)
+		cells = self.bufferBraille[: self.untranslatedStart + self.untranslatedCursorPos]
+		if not cells:
+			return False
+		mode = louis.dotsIO | louis.noUndefinedDots | louis.partialTrans
+		return bool(self._backTranslator.translate(self.translationTables, cells, mode))
+
+	def _translateForReportContractedCell(
+		self,
+		pos: int,
+		onTranslated: Optional[Callable[[str, str], None]] = None,
+	):
 		"""Translate text for current input as required by L{_reportContractedCell}.
-		@return: The previous translated text.
-		@rtype: str
+		When typing contracted braille in a text field, long words can be slow to translate,
+		so the translation is done in the background and L{bufferText} is updated on the main thread.
+		@param onTranslated: Called with the translated text before and after the cell at C{pos} was entered,
+			unless the cell was erased before it was translated.
+			This is called even if the word was ended or the buffer was flushed before the cell was translated.
 		"""
 		cells = self.bufferBraille[: pos + 1]
-		data = "".join([chr(cell | LOUIS_DOTS_IO_START) for cell in cells])
-		oldText = self.bufferText
-		text = louis.backTranslate(
-			[self._table.fileName, "braille-patterns.cti"],
-			data,
-			mode=louis.dotsIO | louis.noUndefinedDots | louis.partialTrans,
-		)[0]
-		self.bufferText = text
-		return oldText
+		mode = louis.dotsIO | louis.noUndefinedDots | louis.partialTrans
+		generation = self._bufferGeneration
+
+		def onResult(text: str):
+			lastGeneration, lastText = self._lastReportTranslation
+			self._lastReportTranslation = (generation, text)
+			if generation != self._bufferGeneration:
+				# The word was ended or the buffer flushed in the meantime,
+				# so bufferText no longer belongs to these cells, but the cell should still be reported.
+				oldText = lastText if lastGeneration == generation else ""
+			else:
+				oldText = self.bufferText
+				self.bufferText = text
+				if self.bufferBraille[: len(cells)] != cells:
+					# The cell was erased in the meantime.
+					return
+			if onTranslated:
+				onTranslated(oldText, text)
+
+		if self.useContractedForCurrentFocus:
+			self._backTranslator.translateInBackground(self.translationTables, cells, mode, onResult)
+		else:
+			onResult(self._backTranslator.translate(self.translationTables, cells, mode))
 
 	def _reportContractedCell(self, pos):
 		"""Report a guess about the character(s) produced by a cell of contracted braille.
@@ -193,19 +357,31 @@ def _reportContractedCell(self, pos):
 		However, it's helpful for the user to have a rough idea.
 		For example, in English contracted braille, "alw" is the contraction for "always".
 		As the user types "alw", the characters a, l, w will be spoken.
+		If no guess can be made (e.g. for a number sign), the dots of the cell are reported instead.
+		"""
+		dots = self.bufferBraille[pos]
+
+		def reportGuess(oldText: str, newText: str):
+			if not self._reportContractedGuess(oldText, newText):
+				speakDots(dots)
+
+		self._translateForReportContractedCell(pos, reportGuess)
+
+	def _reportContractedGuess(self, oldText: str, newText: str) -> bool:
+		"""Report the characters added to the translated text by the last cell of contracted braille.
+		@param oldText: The translated text before the cell was entered.
+		@param newText: The translated text after the cell was entered.
 		@return: C{True} if a guess was reported, C{False} if not (e.g. a number sign).
-		@rtype: bool
 		"""
-		oldText = self._translateForReportContractedCell(pos)
 		oldTextLen = len(oldText)
-		if oldText != self.bufferText[:oldTextLen]:
+		if oldText != newText[:oldTextLen]:
 			# This cell caused the text before it to change, so we can't make a useful guess.
 			return False
-		newText = self.bufferText[oldTextLen:]
-		if newText:
+		addedText = newText[oldTextLen:]
+		if addedText:
 			# New text was generated by the cells just entered.
 			# Speak them as separate characters.
-			speech.speakMessage(" ".join(newText))
+			speech.speakMessage(" ".join(addedText))
 			return True
 		return False
 
@@ -216,7 +392,9 @@ def _reportUntranslated(self, pos):
 		if speakTyped:
 			if protected:
 				speech.speakSpelling(speech.PROTECTED_CHAR)
-			elif not self._table.contracted or not self._reportContractedCell(pos):
+			elif self._table.contracted:
+				self._reportContractedCell(pos)
+			else:
 				dots = self.bufferBraille[pos]
 				speakDots(dots)
 		if self._table.contracted and (not speakTyped or protected):
@@ -267,7 +445,7 @@ def toggleModifiers(self, modifiers: List[str]):
 			raise ValueError("%r contains unknown modifiers" % modifiers)
 
 		# Ensure input buffer is clear for the modified key
-		if self.bufferText:
+		if self._bufferHasText():
 			self._translate(True)
 
 		toToggle: frozenset[str] = frozenset(modifiers)
@@ -369,6 +547,7 @@ def eraseLastCell(self):
 	def flushBuffer(self):
 		self.bufferBraille = []
 		self.bufferText = ""
+		self._bufferGeneration += 1
 		self.cellsWithText.clear()
 		self.currentModifiers.clear()
 		self.untranslatedBraille = ""
@@ -482,6 +661,8 @@ def initialize():
 
 def terminate():
 	global handler
+	if handler:
+		handler._backTranslator.terminate()
 	handler = None
 
 
@@ -21,6 +21,7 @@
 import contextlib
 from copy import deepcopy
 from collections import OrderedDict
+from types import MappingProxyType
 from configobj import ConfigObj
 from configobj.validate import Validator
 from logHandler import log
@@ -527,6 +528,9 @@ def __init__(self):
 			},
 		)
 		self.rootSection: Optional[AggregatedSection] = None
+		self.snapshotGeneration: int = 0
+		"""Incremented whenever the section snapshots are rebuilt, see L{getSectionSnapshot}."""
+		self._sectionSnapshots: Dict[str, MappingProxyType[str, Any]] = {}
 		self._shouldHandleProfileSwitch: bool = True
 		self._pendingHandleProfileSwitch: bool = False
 		self._suspendedTriggers: Optional[List[ProfileTrigger]] = None
@@ -545,6 +549,7 @@ def _handleProfileSwitch(self, shouldNotify=True):
 		init = currentRootSection is None
 		# Reset the cache.
 		self.rootSection = AggregatedSection(self, (), self.spec, self.profiles)
+		self._invalidateSectionSnapshots()
 		if init:
 			# We're still initialising, so don't notify anyone about this change.
 			return
@@ -643,6 +648,25 @@ def __setitem__(self, key, val):
 	def dict(self):
 		return self.rootSection.dict()
 
+	def getSectionSnapshot(self, key: str) -> MappingProxyType[str, Any]:
+		"""Gets a read-only snapshot of the settings in a section, aggregated from all active profiles.
+		Unlike the section, a snapshot is cheap to read from and to copy,
+		and it is shared by all callers until a profile switch or a setting is written.
+		Subsections are also snapshots.
+		The snapshot is then rebuilt and L{snapshotGeneration} is incremented.
+		@param key: The name of a top level section, e.g. C{"documentFormatting"}.
+		"""
+		try:
+			return self._sectionSnapshots[key]
+		except KeyError:
+			pass
+		snapshot = self._sectionSnapshots[key] = _freezeSection(self[key].dict())
+		return snapshot
+
+	def _invalidateSectionSnapshots(self) -> None:
+		self.snapshotGeneration += 1
+		self._sectionSnapshots = {}
+
 	def listProfiles(self):
 		try:
 			profileFiles = os.listdir(WritePaths.profilesDir)
@@ -703,6 +727,8 @@ def manualActivateProfile(self, name):
 		self._handleProfileSwitch()
 
 	def _markWriteProfileDirty(self):
+		# Every write to a profile goes through here.
+		self._invalidateSectionSnapshots()
 		if len(self.profiles) == 1:
 			# There's nothing other than the base config, which is always saved anyway.
 			return
@@ -1064,6 +1090,12 @@ def __init__(self, validationFuncName):
 	default = None  # converted to the appropriate type
 
 
+def _freezeSection(section: Dict[str, Any]) -> MappingProxyType[str, Any]:
+	return MappingProxyType(
+		{key: _freezeSection(val) if isinstance(val, dict) else val for key, val in section.items()},
+	)
+
+
 class AggregatedSection:
 	"""A view of a section of configuration which aggregates settings from all active profiles."""
 
@@ -1323,6 +1355,7 @@ def _linkDeprecatedValues(self, key: aggregatedSection._cacheKeyT, val: aggregat
 		# If we have reached this point, we must have a new key and value to set.
 		self._getUpdateSection()[key] = val
 		self._cache[key] = val
+		self.manager._invalidateSectionSnapshots()
 
 	def _getUpdateSection(self):
 		profile = self.profiles[-1]
@@ -12,9 +12,12 @@
 They are implemented using the L{ContentRecognizer} class.
 """
 
+from bisect import bisect_right
 from collections import namedtuple
 import ctypes
-from typing import Callable, Dict, List, Union
+import hashlib
+import math
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import garbageHandler
 from baseObject import AutoPropertyObject
 import cursorManager
@@ -170,6 +173,49 @@ def convertHeightToScreen(self, height):
 		return int(height / self.resizeFactor)
 
 
+class ImageChangeDetector:
+	"""Finds the rows of an image which changed since the previous image,
+	so that recognition can be skipped or limited to the changed rows.
+	The image is divided into bands of rows, each of which is hashed.
+	"""
+
+	def __init__(self, bandHeight: int = 16):
+		"""
+		@param bandHeight: The number of rows hashed together.
+		"""
+		self.bandHeight = bandHeight
+		#: The hash of each band of the previous image, or C{None} if there was none.
+		self._hashes: Optional[List[bytes]] = None
+
+	def reset(self):
+		"""Forgets the previous image, so that the next image is considered to have changed entirely."""
+		self._hashes = None
+
+	def update(self, pixels: ctypes.Array) -> Optional[Tuple[int, int]]:
+		"""Compares an image with the previous image, and remembers it for the next comparison.
+		@param pixels: The image, as a ctypes array of rows.
+		@return: C{None} if the image didn't change,
+			otherwise the first row which changed and the row after the last which changed.
+		"""
+		height = len(pixels)
+		size = ctypes.sizeof(pixels)
+		rowSize = size // height if height else 0
+		data = memoryview((ctypes.c_char * size).from_buffer(pixels))
+		bandHeight = self.bandHeight
+		hashes = [
+			hashlib.blake2b(data[top * rowSize : (top + bandHeight) * rowSize], digest_size=16).digest()
+			for top in range(0, height, bandHeight)
+		]
+		oldHashes = self._hashes
+		self._hashes = hashes
+		if oldHashes is None or len(oldHashes) != len(hashes):
+			return 0, height
+		changed = [index for index, (old, new) in enumerate(zip(oldHashes, hashes)) if old != new]
+		if not changed:
+			return None
+		return changed[0] * bandHeight, min((changed[-1] + 1) * bandHeight, height)
+
+
 class RecognitionResult(garbageHandler.TrackedObject, metaclass=ABCMeta):
 	"""Provides access to the result of recognition by a recognizer.
 	The result is textual, but to facilitate navigation by word, line, etc.
@@ -195,6 +241,55 @@ def makeTextInfo(self, obj, position) -> BaseContentRecogTextInfo:
 LwrWord = namedtuple("LwrWord", ("offset", "left", "top", "width", "height"))
 
 
+class _LwrWordGrid:
+	"""A spatial index of words, used internally by LinesWordsResult to find the word at a point.
+	The area covered by the words is divided into a grid of cells,
+	each listing the words which overlap it.
+	"""
+
+	def __init__(self, words: List[LwrWord]):
+		self._words = words
+		#: Maps the column and row of each cell to the indexes of the words which overlap it.
+		self._cells: Dict[Tuple[int, int], List[int]] = {}
+		if not words:
+			self._left = self._top = 0
+			self._cellWidth = self._cellHeight = 1
+			return
+		self._left = min(word.left for word in words)
+		self._top = min(word.top for word in words)
+		right = max(word.left + word.width for word in words)
+		bottom = max(word.top + word.height for word in words)
+		# Use about as many cells as words, so that each cell lists few words.
+		cellsPerSide = math.isqrt(len(words)) or 1
+		self._cellWidth = max(1, math.ceil((right - self._left) / cellsPerSide))
+		self._cellHeight = max(1, math.ceil((bottom - self._top) / cellsPerSide))
+		for index, word in enumerate(words):
+			firstColumn, firstRow = self._getCell(word.left, word.top)
+			lastColumn, lastRow = self._getCell(
+				word.left + max(word.width, 1) - 1,
+				word.top + max(word.height, 1) - 1,
+			)
+			for column in range(firstColumn, lastColumn + 1):
+				for row in range(firstRow, lastRow + 1):
+					self._cells.setdefault((column, row), []).append(index)
+
+	def _getCell(self, x: int, y: int) -> Tuple[int, int]:
+		return (int((x - self._left) // self._cellWidth), int((y - self._top) // self._cellHeight))
+
+	def getWordIndex(self, x: int, y: int) -> Optional[int]:
+		"""Finds the word at a point.
+		@param x: The x screen coordinate.
+		@param y: The y screen coordinate.
+		@return: The index of the first word containing the point, or C{None} if no word does.
+		"""
+		words = self._words
+		for index in self._cells.get(self._getCell(x, y), ()):
+			word = words[index]
+			if word.left <= x < word.left + word.width and word.top <= y < word.top + word.height:
+				return index
+		return None
+
+
 class LinesWordsResult(RecognitionResult):
 	"""A L{RecognizerResult} which can create TextInfos based on a simple lines/words data structure.
 	The data structure is a list of lines, wherein each line is a list of words,
@@ -227,6 +322,10 @@ def __init__(self, data: List[List[Dict[str, Union[str, int]]]], imageInfo: Reco
 		self.lines = []
 		#: Start offsets and screen coordinates for each word.
 		self.words = []
+		#: Start offsets for each word, to look up words by offset.
+		self._wordOffsets: List[int] = []
+		#: Finds words at screen points, created when first needed.
+		self._wordGrid: Optional[_LwrWordGrid] = None
 		self._parseData()
 		self.text = "".join(self._textList)
 
@@ -240,6 +339,7 @@ def _parseData(self):
 					# Separate with a space.
 					self._textList.append(" ")
 					self.textLen += 1
+				self._wordOffsets.append(self.textLen)
 				self.words.append(
 					LwrWord(
 						self.textLen,
@@ -257,6 +357,64 @@ def _parseData(self):
 			self.textLen += 1
 			self.lines.append(self.textLen)
 
+	def getWordIndexFromOffset(self, offset: int) -> int:
+		"""Finds the word containing an offset.
+		Each word includes the space or line ending which follows it.
+		@param offset: The offset in L{text}.
+		@return: The index in L{words} of the word, or -1 if the offset is before the first word.
+		"""
+		return bisect_right(self._wordOffsets, offset) - 1
+
+	def getWordIndexFromPoint(self, x: int, y: int) -> Optional[int]:
+		"""Finds the word at a point on the screen.
+		@param x: The x screen coordinate.
+		@param y: The y screen coordinate.
+		@return: The index in L{words} of the word, or C{None} if there is no word at the point.
+		"""
+		if self._wordGrid is None:
+			self._wordGrid = _LwrWordGrid(self.words)
+		return self._wordGrid.getWordIndex(x, y)
+
+	def replaceRows(
+		self,
+		rowsResult: "LinesWordsResult",
+		top: int,
+		bottom: int,
+	) -> Tuple["LinesWordsResult", int, int, int]:
+		"""Makes a result in which the lines within some rows of the recognized image
+		are replaced by the lines recognized in an image of just those rows.
+		Lines which are partly within the rows are replaced as well.
+		@param rowsResult: The result of recognizing the rows,
+			with coordinates relative to the top of the rows.
+		@param top: The first row in the recognized image.
+		@param bottom: The row after the last row in the recognized image.
+		@return: The new result,
+			the offset at which the replaced text starts,
+			and the offsets after the replaced text in this result and in the new result.
+		"""
+		linesBefore = []
+		linesAfter = []
+		lines = linesBefore
+		for line in self.data:
+			if line:
+				lineTop = min(word["y"] for word in line)
+				lineBottom = max(word["y"] + word["height"] for word in line)
+				if lineBottom <= top:
+					lines = linesBefore
+				elif lineTop >= bottom:
+					lines = linesAfter
+				else:
+					# This line is replaced.
+					continue
+			# Lines without words stay with the line before them.
+			lines.append(line)
+		rowsLines = [[dict(word, y=word["y"] + top) for word in line] for line in rowsResult.data]
+		newResult = LinesWordsResult(linesBefore + rowsLines + linesAfter, self.imageInfo)
+		start = self.lines[len(linesBefore) - 1] if linesBefore else 0
+		firstLineAfter = len(self.data) - len(linesAfter)
+		oldEnd = self.lines[firstLineAfter - 1] if firstLineAfter > 0 else 0
+		return newResult, start, oldEnd, newResult.textLen - (self.textLen - oldEnd)
+
 	def makeTextInfo(self, obj, position):
 		return LwrTextInfo(obj, position, self)
 
@@ -282,32 +440,36 @@ def _getStoryLength(self):
 		return self.result.textLen
 
 	def _getLineOffsets(self, offset):
-		start = 0
-		for end in self.result.lines:
-			if end > offset:
-				return (start, end)
-			start = end
+		lines = self.result.lines
+		index = bisect_right(lines, offset)
+		start = lines[index - 1] if index > 0 else 0
+		if index < len(lines):
+			return (start, lines[index])
 		# offset is too big. Fail gracefully by returning the last line.
 		return (start, self.result.textLen)
 
 	def _getWordOffsets(self, offset):
-		start = 0
-		for word in self.result.words:
-			if word.offset > offset:
-				return (start, word.offset)
-			start = word.offset
+		wordOffsets = self.result._wordOffsets
+		index = bisect_right(wordOffsets, offset)
+		start = wordOffsets[index - 1] if index > 0 else 0
+		if index < len(wordOffsets):
+			return (start, wordOffsets[index])
 		# offset is in the last word (or offset is too big).
 		return (start, self.result.textLen)
 
 	def _getBoundingRectFromOffset(self, offset):
-		word = None
-		for nextWord in self.result.words:
-			if nextWord.offset > offset:
-				# Stop! We need the word before this.
-				break
-			word = nextWord
+		index = self.result.getWordIndexFromOffset(offset)
+		if index < 0:
+			raise LookupError(f"No word at offset {offset}")
+		word = self.result.words[index]
 		return RectLTWH(word.left, word.top, word.width, word.height)
 
+	def _getOffsetFromPoint(self, x, y):
+		index = self.result.getWordIndexFromPoint(x, y)
+		if index is None:
+			raise LookupError(f"No word at point {x}, {y}")
+		return self.result.words[index].offset
+
 
 class SimpleTextResult(RecognitionResult):
 	"""A L{RecognitionResult} which presents a simple text string.
@@ -346,3 +508,145 @@ def _getStoryText(self):
 
 	def _getStoryLength(self):
 		return len(self.result.text)
+
+
+class ResultRefresher:
+	"""Recognizes new images of the same content to refresh a result.
+	Recognition is skipped if the image didn't change.
+	If only some rows of the image changed and the result is a L{LinesWordsResult},
+	only those rows are recognized, and the lines recognized in them replace the lines in the result.
+	"""
+
+	#: Only the changed rows are recognized if they are at most this fraction of the image.
+	maxPartialFraction: float = 0.5
+
+	def __init__(self, recognizer: ContentRecognizer, imageInfo: RecogImageInfo):
+		self.recognizer = recognizer
+		self.imageInfo = imageInfo
+		self._changeDetector = ImageChangeDetector()
+		#: The offset at which the text replaced by the last refresh started,
+		#: and the offsets after it in the old and new results,
+		#: or C{None} if the whole text was replaced.
+		self._lastChange: Optional[Tuple[int, int, int]] = None
+
+	def recognize(
+		self,
+		pixels: ctypes.Array,
+		result: Optional[RecognitionResult],
+		onResult: onRecognizeResultCallbackT,
+	):
+		"""Recognizes an image, calling back with the refreshed result.
+		@param pixels: The image, captured as described by L{imageInfo}.
+		@param result: The result for the previous image, or C{None} if there is none.
+		@param onResult: Called with the new result, or with C{result} itself if the image didn't change.
+		"""
+		self._lastChange = None
+		changedRows = self._changeDetector.update(pixels)
+		if result is not None and changedRows is None:
+			onResult(result)
+			return
+		rows = self._getRowsToRecognize(result, changedRows) if result is not None else None
+		if rows is None:
+			self.recognizer.recognize(pixels, self.imageInfo, onResult)
+			return
+		top, bottom = rows
+		imageInfo = self.imageInfo
+		resizeFactor = imageInfo.resizeFactor
+		rowsImageInfo = RecogImageInfo.createFromRecognizer(
+			imageInfo.screenLeft,
+			imageInfo.screenTop + int(top // resizeFactor),
+			imageInfo.screenWidth,
+			int((bottom - top) // resizeFactor),
+			self.recognizer,
+		)
+		rowSize = ctypes.sizeof(pixels) // len(pixels)
+		rowsPixels = (type(pixels[0]) * (bottom - top)).from_buffer_copy(
+			memoryview((ctypes.c_char * ctypes.sizeof(pixels)).from_buffer(pixels))[
+				top * rowSize : bottom * rowSize
+			],
+		)
+
+		def onRowsResult(rowsResult: Union[RecognitionResult, Exception]):
+			if not isinstance(rowsResult, LinesWordsResult):
+				if not isinstance(rowsResult, Exception):
+					# The recognizer unexpectedly changed the kind of result.
+					# Recognize the whole image next time.
+					self._changeDetector.reset()
+					rowsResult = result
+				onResult(rowsResult)
+				return
+			newResult, start, oldEnd, newEnd = result.replaceRows(rowsResult, top, bottom)
+			self._lastChange = (start, oldEnd, newEnd)
+			onResult(newResult)
+
+		self.recognizer.recognize(rowsPixels, rowsImageInfo, onRowsResult)
+
+	def _getRowsToRecognize(
+		self,
+		result: RecognitionResult,
+		changedRows: Tuple[int, int],
+	) -> Optional[Tuple[int, int]]:
+		"""Finds the rows of the recognized image to recognize again.
+		These are the changed rows, extended to include whole lines of the result,
+		and enough rows for the recognizer to resize them by the same factor as the whole image.
+		@return: The first row and the row after the last,
+			or C{None} if the whole image should be recognized.
+		"""
+		imageInfo = self.imageInfo
+		resizeFactor = imageInfo.resizeFactor
+		if not isinstance(result, LinesWordsResult) or not float(resizeFactor).is_integer():
+			return None
+		resizeFactor = int(resizeFactor)
+		recogHeight = imageInfo.recogHeight
+		top, bottom = changedRows
+		while True:
+			top, bottom = self._extendToLines(result, top, bottom)
+			# Rows must map to whole rows on the screen.
+			top = max(0, top - top % resizeFactor)
+			bottom = min(recogHeight, -(-bottom // resizeFactor) * resizeFactor)
+			if bottom - top > recogHeight * self.maxPartialFraction:
+				return None
+			rowsHeight = (bottom - top) // resizeFactor
+			if self.recognizer.getResizeFactor(imageInfo.screenWidth, rowsHeight) == imageInfo.resizeFactor:
+				return top, bottom
+			if top == 0 and bottom == recogHeight:
+				return None
+			# The recognizer would resize so few rows differently,
+			# so the positions of the lines recognized in them wouldn't match the result.
+			padding = max(resizeFactor, (bottom - top) // 2)
+			top -= padding
+			bottom += padding
+
+	@staticmethod
+	def _extendToLines(result: LinesWordsResult, top: int, bottom: int) -> Tuple[int, int]:
+		"""Extends rows of the recognized image to include the whole of every line of the result they cross.
+		@return: The first row and the row after the last.
+		"""
+		extended = True
+		while extended:
+			extended = False
+			for line in result.data:
+				if not line:
+					continue
+				lineTop = min(word["y"] for word in line)
+				lineBottom = max(word["y"] + word["height"] for word in line)
+				if lineTop < bottom and lineBottom > top and (lineTop < top or lineBottom > bottom):
+					top = min(top, lineTop)
+					bottom = max(bottom, lineBottom)
+					extended = True
+		return top, bottom
+
+	def mapOffset(self, offset: int) -> int:
+		"""Maps an offset in the previous result to the same position in the result of the last refresh.
+		Offsets in text which was replaced are kept within the replacement text.
+		@param offset: The offset in the previous result.
+		@return: The offset in the new result.
+		"""
+		if self._lastChange is None:
+			return offset
+		start, oldEnd, newEnd = self._lastChange
+		if offset < start:
+			return offset
+		if offset >= oldEnd:
+			return offset - oldEnd + newEnd
+		return max(start, min(offset, newEnd - 1))
@@ -21,11 +21,18 @@
 import cursorManager
 import eventHandler
 import textInfos
+import textInfos.offsets
 from logHandler import log
 import queueHandler
 import core
 from scriptHandler import script
-from . import RecogImageInfo, ContentRecognizer, RecognitionResult, onRecognizeResultCallbackT
+from . import (
+	RecogImageInfo,
+	ContentRecognizer,
+	RecognitionResult,
+	ResultRefresher,
+	onRecognizeResultCallbackT,
+)
 
 if TYPE_CHECKING:
 	import inputCore
@@ -124,6 +131,7 @@ def __init__(
 	):
 		self.recognizer = recognizer
 		self.imageInfo = imageInfo
+		self._refresher = ResultRefresher(recognizer, imageInfo)
 		super().__init__(result=None, obj=obj)
 		LiveText.initOverlayClass(self)
 
@@ -141,7 +149,7 @@ def _recognize(self, onResult: onRecognizeResultCallbackT):
 			imgInfo.screenWidth,
 			imgInfo.screenHeight,
 		)
-		self.recognizer.recognize(pixels, self.imageInfo, onResult)
+		self._refresher.recognize(pixels, self.result, onResult)
 
 	def _onFirstResult(self, result: Union[RecognitionResult, Exception]):
 		global _activeRecog
@@ -193,10 +201,22 @@ def _onResult(self, result: Union[RecognitionResult, Exception]):
 			)
 			self.stopMonitoring()
 			return
+		if result is self.result:
+			# The image didn't change, so neither did the result.
+			if self.recognizer.allowAutoRefresh:
+				self._scheduleRecognize()
+			return
 		self.result = result
 		# The current selection refers to the old result. We need to refresh that,
 		# but try to keep the same cursor position.
-		self.selection = self.makeTextInfo(self._selection.bookmark)
+		# If only some lines were recognized again, the position is moved with the text around it.
+		bookmark = self._selection.bookmark
+		if isinstance(bookmark, textInfos.offsets.Offsets):
+			mapOffset = self._refresher.mapOffset
+			bookmark = textInfos.offsets.Offsets(
+				mapOffset(bookmark.startOffset), mapOffset(bookmark.endOffset)
+			)
+		self.selection = self.makeTextInfo(bookmark)
 		# Tell LiveText that our text has changed.
 		self.event_textChange()
 		if self.recognizer.allowAutoRefresh:
@@ -57,6 +57,12 @@ def reloadGlobalPlugins():
 
 	addDirsToPythonPackagePath(globalPlugins)
 	initialize()
+	# Import late to avoid circular import.
+	import inputCore
+	import scriptHandler
+
+	inputCore.clearGlobalGestureMapIndexes()
+	scriptHandler.clearFindScriptCache()
 
 
 class GlobalPlugin(baseObject.ScriptableObject):
@@ -60,6 +60,7 @@ class DefaultAppArgs(argparse.Namespace):
 	disableAddons: bool = False
 	debugLogging: bool = False
 	noLogging: bool = False
+	asyncLogging: bool = False
 	changeScreenReaderFlag: bool = True
 	install: bool = False
 	installSilent: bool = False
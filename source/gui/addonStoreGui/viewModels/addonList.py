@@ -32,6 +32,7 @@
 	_StatusFilterKey,
 	AvailableAddonStatus,
 )
+from addonStore.search import _AddonSearchIndex
 import core
 import extensionPoints
 from buildVersion import formatVersionForGUI
@@ -249,6 +250,9 @@ def __init__(
 		self._sortByModelField: AddonListField = AddonListField.displayName
 		self._filterString: Optional[str] = None
 		self._reverseSort: bool = False
+		self._searchIndex = _AddonSearchIndex({})
+		self._sortedIds: Optional[List[str]] = None
+		"""The IDs of all add-ons in the sort order, reset when the add-ons or their status change."""
 
 		self._setSelectionPending = False
 		self._addonsFilteredOrdered: List[str] = self._getFilteredSortedIds()
@@ -268,6 +272,8 @@ def _itemDataUpdated(self, addonListItemVM: AddonListItemVM):
 		addonId: str = addonListItemVM.Id
 		log.debug(f"Item updated: {addonListItemVM!r}")
 		assert addonListItemVM == self._addons[addonId], "Must be the same instance."
+		# The status may be the sort field.
+		self._sortedIds = None
 		if addonId in self._addonsFilteredOrdered:
 			log.debug("Notifying of update")
 			index = self._addonsFilteredOrdered.index(addonId)
@@ -283,6 +289,8 @@ def resetListItems(self, listVMs: List[AddonListItemVM]):
 
 		# set new ID:listItemVM mapping.
 		self._addons = CaseInsensitiveDict({vm.Id: vm for vm in listVMs})
+		self._searchIndex = _AddonSearchIndex({vm.Id: vm.model for vm in listVMs})
+		self._sortedIds = None
 		self._updateAddonListing()
 
 		# allow new listItemVMs to notify of updates.
@@ -380,6 +388,7 @@ def setSortField(self, modelField: AddonListField, reverse: bool = False):
 		self._validate(sortField=modelField)
 		self._sortByModelField = modelField
 		self._reverseSort = reverse
+		self._sortedIds = None
 		self._updateAddonListing()
 		if oldOrder != self._addonsFilteredOrdered:
 			# ensure calling on the main thread.
@@ -423,28 +432,16 @@ def _getSortFieldData(listItemVM: AddonListItemVM) -> "_SupportsLessThan":
 				return listItemVM.model.installDate
 			return strxfrm(self._getAddonFieldText(listItemVM, self._sortByModelField))
 
-		def _containsTerm(detailsVM: AddonListItemVM, term: str) -> bool:
-			term = term.casefold()
-			model = detailsVM.model
-			inPublisher = isinstance(model, _AddonStoreModel) and term in model.publisher.casefold()
-			inAuthor = isinstance(model, _AddonManifestModel) and term in model.author.casefold()
-			return (
-				term in model.displayName.casefold()
-				or term in model.description.casefold()
-				or term in model.addonId.casefold()
-				or inPublisher
-				or inAuthor
-			)
-
-		filtered = (
-			vm
-			for vm in self._addons.values()
-			if self._filterString is None or _containsTerm(vm, self._filterString)
-		)
-		filteredSorted = list(
-			[vm.Id for vm in sorted(filtered, key=_getSortFieldData, reverse=self._reverseSort)],
-		)
-		return filteredSorted
+		if self._sortedIds is None:
+			self._sortedIds = [
+				vm.Id
+				for vm in sorted(self._addons.values(), key=_getSortFieldData, reverse=self._reverseSort)
+			]
+		if self._filterString is None:
+			return list(self._sortedIds)
+		# As sorting is stable, filtering the sorted add-ons gives the same order as sorting the filtered ones.
+		matches = self._searchIndex.search(self._filterString)
+		return [addonId for addonId in self._sortedIds if addonId in matches]
 
 	def _tryPersistSelection(
 		self,
@@ -567,11 +567,23 @@ def installPending(cls):
 			# Add-ons can have "installTasks", which often call the GUI assuming they are on the main thread.
 			log.error("installation must happen on main thread.")
 		while addonDataManager._downloadsPendingInstall:
-			listItemVM, fileDownloaded = addonDataManager._downloadsPendingInstall.pop()
-			cls._doInstall(listItemVM, fileDownloaded)
+			pendingInstalls = list(addonDataManager._downloadsPendingInstall)
+			addonDataManager._downloadsPendingInstall.clear()
+			# Opening bundles and validating their manifests is thread safe,
+			# unlike installing them, so it is done for all pending add-ons up front.
+			inspectedBundles = addonHandler._inspectAddonBundles(
+				fileDownloaded for _listItemVM, fileDownloaded in pendingInstalls
+			)
+			for (listItemVM, fileDownloaded), inspected in zip(pendingInstalls, inspectedBundles):
+				cls._doInstall(listItemVM, fileDownloaded, inspected.bundle)
 
 	@classmethod
-	def _doInstall(cls, listItemVM: AddonListItemVM, fileDownloaded: PathLike):
+	def _doInstall(
+		cls,
+		listItemVM: AddonListItemVM,
+		fileDownloaded: PathLike,
+		bundle: Optional["addonHandler.AddonBundle"] = None,
+	):
 		if not core.isMainThread():
 			# Add-ons can have "installTasks", which often call the GUI assuming they are on the main thread.
 			log.error("installation must happen on main thread.")
@@ -579,7 +591,7 @@ def _doInstall(cls, listItemVM: AddonListItemVM, fileDownloaded: PathLike):
 		listItemVM.status = AvailableAddonStatus.INSTALLING
 		log.debug(f"{listItemVM.Id} status: {listItemVM.status}")
 		try:
-			installAddon(fileDownloaded)
+			installAddon(fileDownloaded, bundle)
 		except DisplayableError as displayableError:
 			listItemVM.status = AvailableAddonStatus.INSTALL_FAILED
 			log.debug(f"{listItemVM.Id} status: {listItemVM.status}")
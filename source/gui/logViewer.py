@@ -7,6 +7,7 @@
 
 import wx
 import globalVars
+import logHandler
 import gui
 import gui.contextHelp
 from gui import blockAction
@@ -70,6 +71,8 @@ def refresh(self, evt=None):
 		# Ignore if log is not initialized
 		if globalVars.appArgs.logFileName is None:
 			return
+		# Records logged asynchronously might not have been written to the log file yet.
+		logHandler.flushPendingRecords()
 		pos = self.outputCtrl.GetInsertionPoint()
 		# Append new text to the output control which has been written to the log file since the last refresh.
 		try:
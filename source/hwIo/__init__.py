@@ -19,6 +19,7 @@
 	getByte,
 )
 from .hid import Hid  # noqa: F401
+from .packetFramer import PacketFramer  # noqa: F401
 from .ioThread import IoThread
 
 bgThread: IoThread
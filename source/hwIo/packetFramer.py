@@ -0,0 +1,223 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Extraction of complete packets from bytes received from braille displays.
+Rather than reading the rest of a packet synchronously once its first byte is received,
+a driver can feed all the bytes it receives, in chunks of any size, to a L{PacketFramer}.
+The framer calls back with each complete packet.
+"""
+
+from typing import Callable, Optional, Tuple
+
+from logHandler import log
+
+#: A callable which is given the received bytes and the offset at which the packet body starts,
+#: and returns the length of the body, or C{None} if more bytes must be received to know it.
+LengthGetter = Callable[[bytearray, int], Optional[int]]
+
+#: A callable which is given the body of a packet,
+#: and returns the checksum byte which should follow it, or C{None} if the packet has no checksum.
+ChecksumGetter = Callable[[bytes], Optional[int]]
+
+
+def lengthFromByte(index: int, extra: int = 0) -> LengthGetter:
+	"""Makes a L{LengthGetter} for packets with a byte giving the length of the rest of the body.
+	@param index: The index in the body of the length byte.
+	@param extra: The number of bytes after the length byte which aren't counted by it.
+	@return: The length getter.
+	"""
+
+	def getLength(data: bytearray, start: int) -> Optional[int]:
+		lengthIndex = start + index
+		if lengthIndex >= len(data):
+			return None
+		return index + 1 + extra + data[lengthIndex]
+
+	return getLength
+
+
+def lengthFromTable(
+	lengths: dict[int, int],
+	default: Optional[int] = None,
+	offset: int = 1,
+) -> LengthGetter:
+	"""Makes a L{LengthGetter} for packets with a fixed length for each packet type.
+	@param lengths: Maps the first byte of the body to the length of the rest of the body.
+	@param default: The length of the rest of the body for types not in C{lengths}.
+		If C{None}, packets of unknown type are only one byte long.
+	@param offset: The number of bytes in the body before the rest of the body, usually the type byte.
+	@return: The length getter.
+	"""
+
+	def getLength(data: bytearray, start: int) -> Optional[int]:
+		if start >= len(data):
+			return None
+		length = lengths.get(data[start], default)
+		return offset + (length or 0)
+
+	return getLength
+
+
+class PacketFramer:
+	"""Accumulates received bytes and extracts complete packets from them.
+	A packet consists of:
+		1. An optional header, such as an escape byte. Bytes received before a header are ignored.
+		2. The body, whose length is found with L{getLength}.
+			If L{escape} is set, escape bytes in the body are doubled.
+		3. An optional checksum byte, see L{getChecksum}.
+		4. An optional terminator.
+	Packets whose checksum or terminator is wrong are dropped,
+	and the framer looks for the next header one byte after the start of the dropped packet.
+	"""
+
+	def __init__(
+		self,
+		onPacket: Callable[[bytes], None],
+		getLength: LengthGetter,
+		header: bytes = b"",
+		escape: Optional[int] = None,
+		getChecksum: Optional[ChecksumGetter] = None,
+		terminator: bytes = b"",
+	):
+		"""Constructor.
+		@param onPacket: A callable taking the body of a complete packet as its only argument.
+		@param getLength: Finds the length of the body of a packet.
+		@param header: The bytes which start every packet.
+		@param escape: If provided, a byte which is doubled when it occurs in the body.
+			A single escape byte in the body starts a new packet.
+			This is usually the same as the header.
+		@param getChecksum: If provided, computes the checksum byte which follows the body.
+		@param terminator: The bytes which end every packet.
+		"""
+		self._onPacket = onPacket
+		self.getLength = getLength
+		self.header = header
+		self.escape = escape
+		self.getChecksum = getChecksum
+		self.terminator = terminator
+		self._buffer = bytearray()
+
+	def feed(self, data: bytes):
+		"""Adds received bytes, calling back with every packet they complete.
+		@param data: The bytes received, which may contain any number of whole or partial packets.
+		"""
+		buffer = self._buffer
+		buffer += data
+		packets = []
+		offset = 0
+		while True:
+			result = self._extractPacket(buffer, offset)
+			if result is None:
+				break
+			offset, packet = result
+			if packet is not None:
+				packets.append(packet)
+		del buffer[:offset]
+		for packet in packets:
+			try:
+				self._onPacket(packet)
+			except Exception:
+				log.error("Error handling packet %r", packet, exc_info=True)
+
+	def reset(self):
+		"""Discards received bytes which don't form a complete packet, e.g. after reconnecting."""
+		self._buffer.clear()
+
+	def _extractPacket(self, buffer: bytearray, start: int) -> Optional[Tuple[int, Optional[bytes]]]:
+		"""Extracts the packet starting at an offset in the buffer.
+		@param buffer: The received bytes.
+		@param start: The offset at which to look for a packet.
+		@return: C{None} if the packet isn't complete yet.
+			Otherwise, the offset after the bytes consumed,
+			and the body of the packet, or C{None} if the bytes were ignored.
+		"""
+		if start >= len(buffer):
+			return None
+		header = self.header
+		if header:
+			headerIndex = buffer.find(header, start)
+			if headerIndex < 0:
+				# Keep the end of the buffer if it could be the start of a header.
+				keepIndex = max(start, len(buffer) - len(header) + 1)
+				while keepIndex < len(buffer) and not header.startswith(buffer[keepIndex:]):
+					keepIndex += 1
+				if keepIndex == start:
+					return None
+				headerIndex = keepIndex
+			if headerIndex > start:
+				log.debugWarning(f"Ignoring bytes before header: {bytes(buffer[start:headerIndex])!r}")
+				return headerIndex, None
+		bodyStart = start + len(header)
+		if self.escape is None:
+			length = self.getLength(buffer, bodyStart)
+			if length is None:
+				return None
+			end = bodyStart + length
+			if end > len(buffer):
+				return None
+			body = bytes(buffer[bodyStart:end])
+		else:
+			result = self._unescapeBody(buffer, bodyStart)
+			if result is None:
+				return None
+			end, body = result
+			if body is None:
+				log.debugWarning(f"Ignoring incomplete packet: {bytes(buffer[start:end])!r}")
+				return end, None
+		if self.getChecksum:
+			checksum = self.getChecksum(body)
+			if checksum is not None:
+				if end >= len(buffer):
+					return None
+				if buffer[end] != checksum:
+					log.debugWarning(
+						f"Ignoring packet with wrong checksum: {bytes(buffer[start : end + 1])!r}"
+					)
+					return start + 1, None
+				end += 1
+		terminator = self.terminator
+		if terminator:
+			terminatorEnd = end + len(terminator)
+			if terminatorEnd > len(buffer):
+				return None
+			if buffer[end:terminatorEnd] != terminator:
+				log.debugWarning(
+					f"Ignoring packet without terminator: {bytes(buffer[start:terminatorEnd])!r}"
+				)
+				return start + 1, None
+			end = terminatorEnd
+		if end <= start:
+			# An empty packet without header, checksum or terminator would consume no bytes.
+			log.debugWarning(
+				f"Ignoring byte which starts an empty packet: {bytes(buffer[start : start + 1])!r}"
+			)
+			return start + 1, None
+		return end, body
+
+	def _unescapeBody(self, buffer: bytearray, bodyStart: int) -> Optional[Tuple[int, Optional[bytes]]]:
+		"""Reads a body in which escape bytes are doubled.
+		@return: C{None} if the body isn't complete yet.
+			Otherwise, the offset after the body, and the body,
+			or C{None} if a new packet started before the body was complete.
+		"""
+		escape = self.escape
+		body = bytearray()
+		length = None
+		index = bodyStart
+		while length is None or len(body) < length:
+			if index >= len(buffer):
+				return None
+			byte = buffer[index]
+			if byte == escape:
+				if index + 1 >= len(buffer):
+					return None
+				if buffer[index + 1] != escape:
+					return index, None
+				index += 1
+			body.append(byte)
+			index += 1
+			if length is None:
+				length = self.getLength(body, 0)
+		return index, bytes(body)
@@ -247,6 +247,27 @@ def executeScript(self, script):
 ]
 
 
+_ResolvedGestureScriptsT = List[
+	Tuple[
+		"weakref.ReferenceType[type]",  # class
+		Optional[ScriptNameT],  # script
+	],
+]
+
+_globalGestureMapIndexesGeneration: int = 0
+"""Incremented to invalidate the index of resolved classes of every L{GlobalGestureMap}."""
+
+
+def clearGlobalGestureMapIndexes():
+	"""Invalidate the index of resolved classes of every L{GlobalGestureMap}.
+	Indexes are automatically invalidated when modules are loaded or unloaded.
+	This must be called when modules are reloaded, e.g. when reloading plugins,
+	as classes might have been replaced without changing the number of loaded modules.
+	"""
+	global _globalGestureMapIndexesGeneration
+	_globalGestureMapIndexesGeneration += 1
+
+
 class GlobalGestureMap:
 	"""Maps gestures to scripts anywhere in NVDA.
 	This is used to allow users and locales to bind gestures in addition to those bound by
@@ -260,6 +281,15 @@ def __init__(self, entries: Optional[FlattenedGestureMapT] = None):
 		@param entries: Initial entries to add; see L{update} for the format.
 		"""
 		self._map: _InternalGestureMapT = {}
+		self._generation: int = 0
+		"""Incremented whenever the mappings change."""
+		self._index: Dict[str, _ResolvedGestureScriptsT] = {}
+		"""Lazily filled index of the classes resolved from the module and class names in L{_map},
+		keyed by normalized gesture.
+		Classes are weakly referenced, so that they can be garbage collected once their module is unloaded.
+		"""
+		self._indexState: Optional[Tuple[int, int, int]] = None
+		"""The state for which L{_index} is valid. See L{_getIndex}."""
 		#: Indicates that the last load or update contained an error.
 		self.lastUpdateContainedError: bool = False
 		#: The file name for this gesture map, if any.
@@ -270,6 +300,7 @@ def __init__(self, entries: Optional[FlattenedGestureMapT] = None):
 	def clear(self):
 		"""Clear this map."""
 		self._map.clear()
+		self._generation += 1
 		self.lastUpdateContainedError = False
 
 	def add(
@@ -297,6 +328,7 @@ def add(
 		if replace:
 			del scripts[:]
 		scripts.append((module, className, script))
+		self._generation += 1
 
 	def load(self, filename: str):
 		"""Load map entries from a file.
@@ -362,17 +394,20 @@ def update(self, entries: FlattenedGestureMapT):
 						self.lastUpdateContainedError = True
 						continue
 
-	def getScriptsForGesture(self, gesture: str) -> Generator[InputGestureScriptT, None, None]:
-		"""Get the scripts associated with a particular gesture.
-		@param gesture: The gesture identifier.
-		@return: The Python class and script name for each script;
-			the script name may be C{None} indicating that the gesture should be unbound for this class.
+	def _getIndex(self) -> Dict[str, _ResolvedGestureScriptsT]:
+		"""Get the index of resolved classes, clearing it first if it is no longer valid.
+		The index is valid as long as the mappings have not changed, no module has been loaded or unloaded
+		and L{clearGlobalGestureMapIndexes} has not been called.
 		"""
-		try:
-			scripts = self._map[gesture]
-		except KeyError:
-			return
-		for moduleName, className, scriptName in scripts:
+		state = (self._generation, len(sys.modules), _globalGestureMapIndexesGeneration)
+		if state != self._indexState:
+			self._index.clear()
+			self._indexState = state
+		return self._index
+
+	def _resolveScripts(self, gesture: str) -> _ResolvedGestureScriptsT:
+		resolved: _ResolvedGestureScriptsT = []
+		for moduleName, className, scriptName in self._map[gesture]:
 			try:
 				module = sys.modules[moduleName]
 			except KeyError:
@@ -381,7 +416,36 @@ def getScriptsForGesture(self, gesture: str) -> Generator[InputGestureScriptT, N
 				cls = getattr(module, className)
 			except AttributeError:
 				continue
-			yield cls, scriptName
+			try:
+				clsRef = weakref.ref(cls)
+			except TypeError:
+				log.debugWarning(f"{moduleName}.{className} is not a class")
+				continue
+			resolved.append((clsRef, scriptName))
+		return resolved
+
+	def _getResolvedScripts(self, gesture: str) -> Generator[InputGestureScriptT, None, None]:
+		index = self._getIndex()
+		try:
+			resolved = index[gesture]
+		except KeyError:
+			resolved = index[gesture] = self._resolveScripts(gesture)
+		scripts = [(clsRef(), scriptName) for clsRef, scriptName in resolved]
+		if any(cls is None for cls, scriptName in scripts):
+			# A class has been garbage collected in the meantime, resolve again.
+			resolved = index[gesture] = self._resolveScripts(gesture)
+			scripts = [(clsRef(), scriptName) for clsRef, scriptName in resolved]
+		yield from scripts
+
+	def getScriptsForGesture(self, gesture: str) -> Generator[InputGestureScriptT, None, None]:
+		"""Get the scripts associated with a particular gesture.
+		@param gesture: The gesture identifier.
+		@return: The Python class and script name for each script;
+			the script name may be C{None} indicating that the gesture should be unbound for this class.
+		"""
+		if gesture not in self._map:
+			return
+		yield from self._getResolvedScripts(gesture)
 
 	def getScriptsForAllGestures(self):
 		"""Get all of the scripts and their gestures.
@@ -389,8 +453,8 @@ def getScriptsForAllGestures(self):
 			the script name may be C{None} indicating that the gesture should be unbound for this class.
 		@rtype: generator of (class, str, str)
 		"""
-		for gesture in self._map:
-			for cls, scriptName in self.getScriptsForGesture(gesture):
+		for gesture in list(self._map):
+			for cls, scriptName in self._getResolvedScripts(gesture):
 				yield cls, gesture, scriptName
 
 	def remove(self, gesture: str, module: str, className: str, script: ScriptNameT):
@@ -407,6 +471,7 @@ def remove(self, gesture: str, module: str, className: str, script: ScriptNameT)
 		except KeyError:
 			raise ValueError("Mapping not found")
 		scripts.remove((module, className, script))
+		self._generation += 1
 
 	def export(self) -> FlattenedGestureMapT:
 		"""Exports this gesture map to a dictionary that can be saved to disk or imported into another gesture map."""
@@ -7,15 +7,20 @@
 """Utilities and classes to manage logging in NVDA"""
 
 import os
+import atexit
+import copy
 import ctypes
+import queue
 import sys
 import threading
 import warnings
+import weakref
 import logging
+import logging.handlers
 import inspect
 import winsound
 import traceback
-from types import FunctionType, TracebackType
+from types import CodeType, FrameType, FunctionType, TracebackType
 import globalVars
 import winKernel
 import buildVersion
@@ -88,14 +93,26 @@ def isPathExternalToNVDA(path: str) -> bool:
 	return False
 
 
-def getCodePath(f):
-	"""Using a frame object, gets its module path (relative to the current directory).[className.[funcName]]
-	@param f: the frame object to use
-	@type f: frame
-	@returns: the dotted module.class.attribute path
-	@rtype: string
-	"""
-	fn = f.f_code.co_filename
+_CODE_PATH_CACHE_MAX_SIZE = 4096
+"""The maximum number of entries in each of the L{getCodePath} caches.
+When exceeded, the cache is cleared.
+"""
+_modulePathCache: dict[CodeType, str] = {}
+"""Caches the module part of the path computed by L{getCodePath}, keyed by code object."""
+_classNameCache: "weakref.WeakKeyDictionary[type, dict[CodeType, str]]" = weakref.WeakKeyDictionary()
+"""Caches the class name resolved by L{getCodePath}, keyed by the class of the receiver and code object.
+The receiver classes are weakly referenced,
+so that dynamically created classes (e.g. C{Dynamic_*} NVDAObject classes) and classes from unloaded plugins
+can still be garbage collected.
+"""
+
+
+def _getModulePath(f: FrameType) -> str:
+	code = f.f_code
+	path = _modulePathCache.get(code)
+	if path is not None:
+		return path
+	fn = code.co_filename
 	if isPathExternalToNVDA(fn):
 		path = "external:"
 	else:
@@ -104,15 +121,88 @@ def getCodePath(f):
 		path += f.f_globals["__name__"]
 	except KeyError:
 		path += fn
-	funcName = f.f_code.co_name
+	if WritePaths.configDir is not None:
+		# Whether a path is external depends on the config directory,
+		# so only cache the result once the config directory is known.
+		if len(_modulePathCache) >= _CODE_PATH_CACHE_MAX_SIZE:
+			_modulePathCache.clear()
+		_modulePathCache[code] = path
+	return path
+
+
+def _getClassName(topCls: type, funcName: str, code: CodeType) -> str:
+	"""Find the deepest class in which the function with the given name and code
+	is reachable as a method from C{topCls}.
+	@return: The name of the class, or an empty string if the function is not a method of C{topCls}.
+	"""
+	try:
+		classNames = _classNameCache[topCls]
+	except KeyError:
+		classNames = None
+	except TypeError:
+		# This type can't be weakly referenced.
+		return _findClassName(topCls, funcName, code)
+	else:
+		className = classNames.get(code)
+		if className is not None:
+			return className
+	className = _findClassName(topCls, funcName, code)
+	if classNames is None:
+		classNames = _classNameCache.setdefault(topCls, {})
+	if len(classNames) >= _CODE_PATH_CACHE_MAX_SIZE:
+		classNames.clear()
+	classNames[code] = className
+	return className
+
+
+def _findClassName(topCls: type, funcName: str, code: CodeType) -> str:
+	if not hasattr(topCls, funcName):
+		return ""
+	for cls in topCls.__mro__:
+		member = cls.__dict__.get(funcName)
+		if not member:
+			continue
+		memberType = type(member)
+		if memberType is FunctionType and member.__code__ is code:
+			# the function was found as a standard method
+			return cls.__name__
+		elif (
+			memberType is classmethod
+			and type(member.__func__) is FunctionType
+			and member.__func__.__code__ is code
+		):
+			# function was found as a class method
+			return cls.__name__
+		elif memberType is property:
+			if type(member.fget) is FunctionType and member.fget.__code__ is code:
+				# The function was found as a property getter
+				return cls.__name__
+			elif type(member.fset) is FunctionType and member.fset.__code__ is code:
+				# the function was found as a property setter
+				return cls.__name__
+	return ""
+
+
+def getCodePath(f):
+	"""Using a frame object, gets its module path (relative to the current directory).[className.[funcName]]
+	Resolutions are cached per code object and receiver class,
+	so that repeatedly logging from the same function is cheap.
+	@param f: the frame object to use
+	@type f: frame
+	@returns: the dotted module.class.attribute path
+	@rtype: string
+	"""
+	code = f.f_code
+	path = _getModulePath(f)
+	funcName = code.co_name
 	if funcName.startswith("<"):
 		funcName = ""
 	className = ""
 	# Code borrowed from http://mail.python.org/pipermail/python-list/2000-January/020141.html
-	if f.f_code.co_argcount:
+	if code.co_argcount:
 		f_locals = f.f_locals
-		arg0 = f_locals[f.f_code.co_varnames[0]]
-		if f.f_code.co_flags & inspect.CO_NEWLOCALS:
+		arg0 = f_locals[code.co_varnames[0]]
+		if code.co_flags & inspect.CO_NEWLOCALS:
 			# Fetching of Frame.f_locals causes a function frames's locals to be cached on the frame for ever.
 			# If an Exception is currently stored as a local variable on that frame,
 			# A reference cycle will be created, holding the frame and all its variables.
@@ -130,32 +220,8 @@ def getCodePath(f):
 		# This stops infinite recursions if fetching data descriptors,
 		# And better reflects the actual source code definition.
 		topCls = arg0 if isinstance(arg0, type) else type(arg0)
-		# find the deepest class this function's name is reachable as a method from
-		if hasattr(topCls, funcName):
-			for cls in topCls.__mro__:
-				member = cls.__dict__.get(funcName)
-				if not member:
-					continue
-				memberType = type(member)
-				if memberType is FunctionType and member.__code__ is f.f_code:
-					# the function was found as a standard method
-					className = cls.__name__
-				elif (
-					memberType is classmethod
-					and type(member.__func__) is FunctionType
-					and member.__func__.__code__ is f.f_code
-				):
-					# function was found as a class method
-					className = cls.__name__
-				elif memberType is property:
-					if type(member.fget) is FunctionType and member.fget.__code__ is f.f_code:
-						# The function was found as a property getter
-						className = cls.__name__
-					elif type(member.fset) is FunctionType and member.fset.__code__ is f.f_code:
-						# the function was found as a property setter
-						className = cls.__name__
-				if className:
-					break
+		if funcName:
+			className = _getClassName(topCls, funcName, code)
 	return ".".join(x for x in (path, className, funcName) if x)
 
 
@@ -343,12 +409,9 @@ def markFragmentStart(self):
 		@returns: Whether a log file is in use and a position could be marked
 		@rtype: bool
 		"""
-		if (
-			globalVars.appArgs.secure
-			or not globalVars.appArgs.logFileName
-			or not isinstance(logHandler, FileHandler)
-		):
+		if globalVars.appArgs.secure or not globalVars.appArgs.logFileName or not _isLoggingToFile():
 			return False
+		flushPendingRecords()
 		with open(globalVars.appArgs.logFileName, "r", encoding="UTF-8") as f:
 			# _io.TextIOWrapper.seek: whence=2 -- end of stream
 			f.seek(0, 2)
@@ -367,9 +430,10 @@ def getFragment(self):
 			self.fragmentStart is None
 			or globalVars.appArgs.secure
 			or not globalVars.appArgs.logFileName
-			or not isinstance(logHandler, FileHandler)
+			or not _isLoggingToFile()
 		):
 			return None
+		flushPendingRecords()
 		with open(globalVars.appArgs.logFileName, "r", encoding="UTF-8") as f:
 			f.seek(self.fragmentStart)
 			fragment = f.read()
@@ -396,15 +460,109 @@ def emit(self, record):
 			pass
 
 
+def _playSoundForRecord(record: logging.LogRecord) -> None:
+	"""Play the sound associated with the level of a record, if any."""
+	if record.levelno >= logging.CRITICAL:
+		winsound.MessageBeep(winsound.MB_ICONHAND)
+	elif record.levelno >= logging.ERROR and shouldPlayErrorSound():
+		getOnErrorSoundRequested().notify()
+
+
 class FileHandler(logging.FileHandler):
 	def handle(self, record):
-		if record.levelno >= logging.CRITICAL:
-			winsound.MessageBeep(winsound.MB_ICONHAND)
-		elif record.levelno >= logging.ERROR and shouldPlayErrorSound():
-			getOnErrorSoundRequested().notify()
+		_playSoundForRecord(record)
 		return super().handle(record)
 
 
+class _BatchedFileHandler(logging.FileHandler):
+	"""A file handler which does not flush the stream after each record.
+	It is driven by L{_BatchingQueueListener}, which flushes once per batch of records.
+	"""
+
+	def emit(self, record: logging.LogRecord) -> None:
+		if self.stream is None:
+			self.stream = self._open()
+		try:
+			self.stream.write(self.format(record) + self.terminator)
+		except Exception:
+			self.handleError(record)
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+	"""Hands log records over to L{_BatchingQueueListener}, which writes them to the log file
+	on a background thread.
+	Error sounds are still played on the thread which logged the record.
+	"""
+
+	def handle(self, record: logging.LogRecord) -> bool:
+		_playSoundForRecord(record)
+		return super().handle(record)
+
+	def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+		"""Merge the message with its arguments and render the traceback, if any.
+		This must happen on the logging thread,
+		as the arguments might be changed afterwards or be unsafe to access from another thread
+		(e.g. NVDAObjects).
+		Formatting the record as a whole, however, is left to the background thread.
+		"""
+		record = copy.copy(record)
+		record.msg = record.getMessage()
+		record.args = None
+		if record.exc_info:
+			if not record.exc_text:
+				formatter = self.formatter or logging.Formatter()
+				record.exc_text = formatter.formatException(record.exc_info)
+			record.exc_info = None
+		return record
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+	"""Writes the records queued by L{QueueHandler}, in order, on a background thread.
+	All the records available at once are written before the handlers are flushed.
+	"""
+
+	MAX_BATCH_SIZE = 512
+	"""The maximum number of records written before the handlers are flushed."""
+
+	def start(self) -> None:
+		self._thread = threading.Thread(target=self._monitor, name="logHandler._BatchingQueueListener")
+		self._thread.daemon = True
+		self._thread.start()
+
+	def _monitor(self) -> None:
+		q = self.queue
+		stopping = False
+		while not stopping:
+			batch = [q.get()]
+			while len(batch) < self.MAX_BATCH_SIZE:
+				try:
+					batch.append(q.get_nowait())
+				except queue.Empty:
+					break
+			for record in batch:
+				if record is self._sentinel:
+					stopping = True
+					continue
+				try:
+					self.handle(record)
+				except Exception:
+					# Never let a failure end the thread, as nothing would be logged anymore.
+					traceback.print_exc(file=sys.__stderr__)
+			for handler in self.handlers:
+				try:
+					handler.flush()
+				except Exception:
+					pass
+			for _record in batch:
+				q.task_done()
+
+	def flush(self) -> None:
+		"""Block until all the records queued so far have been written."""
+		if self._thread is None or self._thread is threading.current_thread():
+			return
+		self.queue.join()
+
+
 class Formatter(logging.Formatter):
 	default_time_format = "%H:%M:%S"
 	default_msec_format = "%s.%03d"
@@ -478,6 +636,42 @@ def redirectStdout(logger):
 log: Logger = logging.getLogger(NVDA_LOGGER_NAME)
 #: The singleton log handler instance.
 logHandler: Optional[logging.Handler] = None
+_queueListener: Optional[_BatchingQueueListener] = None
+"""Writes log records to the log file on a background thread when asynchronous logging is enabled."""
+
+
+def _isLoggingToFile() -> bool:
+	return isinstance(logHandler, (FileHandler, QueueHandler))
+
+
+def flushPendingRecords() -> None:
+	"""Ensure that all records logged so far have been written to the log file.
+	This is a no-op unless asynchronous logging is enabled.
+	"""
+	if _queueListener is not None:
+		_queueListener.flush()
+
+
+def terminate() -> None:
+	"""Write all pending records and stop the asynchronous logging thread, if any.
+	Records logged afterwards are written synchronously.
+	"""
+	global _queueListener, logHandler
+	if _queueListener is None:
+		return
+	listener = _queueListener
+	_queueListener = None
+	listener.stop()
+	(fileHandler,) = listener.handlers
+	fileHandler.flush()
+	queueHandler = logHandler
+	logHandler = FileHandler(fileHandler.baseFilename, mode="a", encoding="utf-8")
+	logHandler.setFormatter(fileHandler.formatter)
+	for logFilter in queueHandler.filters:
+		logHandler.addFilter(logFilter)
+	log.root.addHandler(logHandler)
+	log.root.removeHandler(queueHandler)
+	fileHandler.close()
 
 
 def _getDefaultLogFilePath():
@@ -491,6 +685,8 @@ def _getDefaultLogFilePath():
 
 def _excepthook(*exc_info):
 	log.exception(exc_info=exc_info, codepath="unhandled exception")
+	# The process might be about to die, make sure the exception makes it to the log file.
+	flushPendingRecords()
 
 
 class _ThreadExceptHookArgs_t(NamedTuple):
@@ -598,7 +794,10 @@ def initialize(shouldDoRemoteLogging=False):
 			except (IOError, WindowsError):
 				pass  # Probably log does not exist, don't care.
 			try:
-				logHandler = FileHandler(globalVars.appArgs.logFileName, mode="w", encoding="utf-8")
+				if globalVars.appArgs.asyncLogging:
+					logHandler = _initializeQueueHandler(globalVars.appArgs.logFileName, logFormatter)
+				else:
+					logHandler = FileHandler(globalVars.appArgs.logFileName, mode="w", encoding="utf-8")
 			except IOError:
 				# if log cannot be opened, we use NullHandler to avoid logging preserving logger behaviour
 				# and set log filename to None to inform logViewer about it
@@ -628,6 +827,20 @@ def initialize(shouldDoRemoteLogging=False):
 	warnings.simplefilter("default", DeprecationWarning)
 
 
+def _initializeQueueHandler(logFileName: str, logFormatter: logging.Formatter) -> QueueHandler:
+	"""Set up asynchronous logging to the given file.
+	@raise IOError: If the log file cannot be opened.
+	"""
+	global _queueListener
+	fileHandler = _BatchedFileHandler(logFileName, mode="w", encoding="utf-8")
+	fileHandler.setFormatter(logFormatter)
+	_queueListener = _BatchingQueueListener(queue.Queue(), fileHandler)
+	_queueListener.start()
+	# Registered after the logging module's own exit handler, hence executed before it.
+	atexit.register(terminate)
+	return QueueHandler(_queueListener.queue)
+
+
 def isLogLevelForced() -> bool:
 	"""Check if the log level was overridden either from the command line or because of secure mode."""
 	return (
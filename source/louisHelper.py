@@ -6,6 +6,7 @@
 """Helper module to ease communication to and from liblouis."""
 
 import os
+import threading
 from ctypes import (
 	WINFUNCTYPE,
 	addressof,
@@ -23,6 +24,10 @@
 	import louis
 
 
+#: Serializes calls into liblouis, which isn't thread safe,
+#: so that braille input can be back-translated in the background.
+_louisLock = threading.Lock()
+
 LOUIS_TO_NVDA_LOG_LEVELS = {
 	louis.LOG_ALL: log.DEBUG,
 	louis.LOG_DEBUG: log.DEBUG,
@@ -142,7 +147,8 @@ def terminate():
 	# Unregister the liblouis logging callback.
 	louis.registerLogCallback(None)
 	# Free liblouis resources
-	louis.liblouis.lou_free()
+	with _louisLock:
+		louis.liblouis.lou_free()
 
 
 def translate(tableList, inbuf, typeform=None, cursorPos=None, mode=0):
@@ -152,17 +158,27 @@ def translate(tableList, inbuf, typeform=None, cursorPos=None, mode=0):
 	* distinguishes between cursor position 0 (cursor at first character) and None (no cursor at all)
 	"""
 	text = inbuf.replace("\0", "")
-	braille, brailleToRawPos, rawToBraillePos, brailleCursorPos = louis.translate(
-		tableList,
-		text,
-		# liblouis mutates typeform if it is a list.
-		typeform=tuple(typeform) if isinstance(typeform, list) else typeform,
-		cursorPos=cursorPos or 0,
-		mode=mode,
-	)
+	with _louisLock:
+		braille, brailleToRawPos, rawToBraillePos, brailleCursorPos = louis.translate(
+			tableList,
+			text,
+			# liblouis mutates typeform if it is a list.
+			typeform=tuple(typeform) if isinstance(typeform, list) else typeform,
+			cursorPos=cursorPos or 0,
+			mode=mode,
+		)
 	# liblouis gives us back a character string of cells, so convert it to a list of ints.
 	# For some reason, the highest bit is set, so only grab the lower 8 bits.
 	braille = [ord(cell) & 255 for cell in braille]
 	if cursorPos is None:
 		brailleCursorPos = None
 	return braille, brailleToRawPos, rawToBraillePos, brailleCursorPos
+
+
+def backTranslate(tableList: list[str], inbuf: str, mode: int = 0) -> str:
+	"""
+	Convenience wrapper for louis.backTranslate which returns only the text,
+	and which can be called from any thread.
+	"""
+	with _louisLock:
+		return louis.backTranslate(tableList, inbuf, mode=mode)[0]
@@ -8,7 +8,11 @@
 
 import threading
 import typing
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from queue import SimpleQueue
 from typing import (
+	NamedTuple,
 	Optional,
 )
 from enum import Enum, auto
@@ -86,6 +90,111 @@ class AudioPurpose(Enum):
 	SOUNDS = auto()
 
 
+class _WaveFileData(NamedTuple):
+	"""The format and decoded frames of a wave file."""
+
+	channels: int
+	samplesPerSec: int
+	bitsPerSample: int
+	frames: bytes
+
+
+class _WaveFileCache:
+	"""A least recently used cache of decoded wave files, so that sounds played often aren't read each time.
+	Files are keyed by path, and read again if their modification time or size changed.
+	"""
+
+	#: The maximum number of files kept in the cache.
+	maxSize: int = 32
+	#: Files whose decoded frames are larger than this number of bytes aren't cached.
+	maxFileSize: int = 1024 * 1024
+
+	def __init__(self):
+		self._entries: OrderedDict[str, tuple[tuple[int, int], _WaveFileData]] = OrderedDict()
+		self._lock = threading.Lock()
+
+	def get(self, fileName: str) -> _WaveFileData:
+		"""Gets the decoded contents of a wave file, reading it if it isn't cached.
+		:param fileName: The path to the wave file.
+		:return: The format and frames of the file.
+		:raises OSError: If the file can't be read.
+		:raises wave.Error: If the file isn't a supported wave file.
+		"""
+		key = os.path.normcase(os.path.abspath(fileName))
+		stat = os.stat(fileName)
+		version = (stat.st_mtime_ns, stat.st_size)
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is not None and entry[0] == version:
+				self._entries.move_to_end(key)
+				return entry[1]
+		with wave.open(fileName, "r") as f:
+			data = _WaveFileData(
+				channels=f.getnchannels(),
+				samplesPerSec=f.getframerate(),
+				bitsPerSample=f.getsampwidth() * 8,
+				frames=f.readframes(f.getnframes()),
+			)
+		with self._lock:
+			if len(data.frames) <= self.maxFileSize:
+				self._entries[key] = (version, data)
+				self._entries.move_to_end(key)
+				while len(self._entries) > self.maxSize:
+					self._entries.popitem(last=False)
+			else:
+				self._entries.pop(key, None)
+		return data
+
+	def preload(self, fileNames: Iterable[str]):
+		"""Reads wave files into the cache, ignoring files which can't be read.
+		:param fileNames: The paths to the wave files.
+		"""
+		for fileName in fileNames:
+			try:
+				self.get(fileName)
+			except (OSError, EOFError, wave.Error):
+				log.debugWarning(f"Couldn't preload wave file {fileName}", exc_info=True)
+
+	def clear(self):
+		with self._lock:
+			self._entries.clear()
+
+
+_waveFileCache = _WaveFileCache()
+
+
+class _WaveFileFeeder:
+	"""Feeds wave files to their players on a single long-lived thread,
+	rather than starting a thread each time a file is played asynchronously.
+	"""
+
+	def __init__(self):
+		self._queue: SimpleQueue[Callable[[], None]] = SimpleQueue()
+		self._lock = threading.Lock()
+		self.thread: threading.Thread | None = None
+
+	def play(self, play: Callable[[], None]):
+		"""Queues a function which plays a file, to be called on the feeder thread.
+		:param play: The function.
+		"""
+		with self._lock:
+			if self.thread is None:
+				self.thread = threading.Thread(
+					name=f"{__name__}.playWaveFile",
+					target=self._run,
+					daemon=True,
+				)
+				self.thread.start()
+		self._queue.put(play)
+
+	def _run(self):
+		while True:
+			self._queue.get()()
+
+
+_waveFileFeeder = _WaveFileFeeder()
+
+
 def playWaveFile(
 	fileName: str,
 	asynchronous: bool = True,
@@ -99,9 +208,7 @@ def playWaveFile(
 	:param isSpeechWaveFileCommand: whether this wave is played as part of a speech sequence.
 	"""
 	global fileWavePlayer, fileWavePlayerThread
-	f = wave.open(fileName, "r")
-	if f is None:
-		raise RuntimeError("can not open file %s" % fileName)
+	data = _waveFileCache.get(fileName)
 	if fileWavePlayer is not None:
 		# There are several race conditions where the background thread might feed
 		# audio after we call stop here in the main thread. Some of these are
@@ -126,7 +233,7 @@ def play():
 		# #17918: Create a function local copy of the player to avoid cases where it becomes None during playback.
 		p = fileWavePlayer
 		try:
-			p.feed(f.readframes(f.getnframes()))
+			p.feed(data.frames)
 			p.idle()
 		except Exception:
 			log.exception("Error playing wave file")
@@ -139,9 +246,9 @@ def play():
 
 	try:
 		fileWavePlayer = WavePlayer(
-			channels=f.getnchannels(),
-			samplesPerSec=f.getframerate(),
-			bitsPerSample=f.getsampwidth() * 8,
+			channels=data.channels,
+			samplesPerSec=data.samplesPerSec,
+			bitsPerSample=data.bitsPerSample,
 			outputDevice=config.conf["audio"]["outputDevice"],
 			wantDucking=False,
 			purpose=AudioPurpose.SOUNDS,
@@ -158,12 +265,8 @@ def play():
 		# In other cases, we should still raise.
 		raise
 	if asynchronous:
-		fileWavePlayerThread = threading.Thread(
-			name=f"{__name__}.playWaveFile({os.path.basename(fileName)})",
-			target=play,
-			daemon=True,
-		)
-		fileWavePlayerThread.start()
+		_waveFileFeeder.play(play)
+		fileWavePlayerThread = _waveFileFeeder.thread
 	else:
 		play()
 
@@ -562,6 +665,15 @@ def initialize():
 		func.restype = HRESULT
 	NVDAHelper.localLib.wasPlay_startup()
 	getOnErrorSoundRequested().register(playErrorSound)
+	wavesDir = os.path.join(globalVars.appDir, "waves")
+	try:
+		waveFileNames = [
+			os.path.join(wavesDir, fileName) for fileName in os.listdir(wavesDir) if fileName.endswith(".wav")
+		]
+	except OSError:
+		log.debugWarning("Couldn't list bundled wave files", exc_info=True)
+	else:
+		_waveFileCache.preload(waveFileNames)
 
 
 def terminate() -> None:
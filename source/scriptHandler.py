@@ -6,11 +6,13 @@
 from typing import (
 	Callable,
 	Generator,
+	Iterable,
 	Iterator,
 	List,
 	Optional,
 	Tuple,
 )
+import sys
 import time
 import weakref
 import types
@@ -115,14 +117,103 @@ def findScript(gesture: "inputCore.InputGesture") -> Optional[_ScriptFunctionT]:
 	return foundScript
 
 
+_FIND_SCRIPT_CACHE_MAX_SIZE = 512
+"""The maximum number of gestures for which the resolved script is cached.
+When exceeded, the cache is cleared.
+"""
+_findScriptCache: dict[tuple, Optional[_ScriptFunctionT]] = {}
+"""Caches the scripts resolved by L{_findScript}, including the absence of a script,
+keyed by the gesture class and normalized identifiers.
+The cached scripts are only valid for L{_findScriptCacheState}.
+"""
+_findScriptCacheState: Optional[tuple] = None
+"""The state for which L{_findScriptCache} is valid. See L{_getFindScriptCacheState}."""
+_findScriptCacheObjects: List[Tuple["NVDAObjects.NVDAObject", Optional[_ScriptFilterT]]] = []
+"""The objects searched for scripts in L{_findScriptCacheState}.
+They are kept alive so that their ids, which are part of the state, can't be reused by other objects.
+"""
+
+
+def clearFindScriptCache() -> None:
+	"""Clear the cache of resolved scripts.
+	This is done automatically when the focus, the tree interceptor or the gesture maps change.
+	It should be called when scripts can be resolved differently for other reasons,
+	e.g. when plugins are reloaded.
+	"""
+	global _findScriptCacheState, _findScriptCacheObjects
+	_findScriptCache.clear()
+	_findScriptCacheState = None
+	_findScriptCacheObjects = []
+
+
+def _getFindScriptCacheState(
+	objects: List[Tuple["NVDAObjects.NVDAObject", Optional[_ScriptFilterT]]],
+) -> tuple:
+	"""Get a value describing everything, other than the gesture itself,
+	which affects how L{_findScript} resolves a script.
+	If this value changes, the scripts previously resolved are no longer valid.
+	@param objects: The objects which would be searched for scripts, as yielded by L{_yieldObjectsForFindScript}.
+	"""
+	treeInterceptorState = None
+	globalMaps = [inputCore.manager.userGestureMap, inputCore.manager.localeGestureMap]
+	if braille.handler and braille.handler.display and braille.handler.display.gestureMap:
+		globalMaps.append(braille.handler.display.gestureMap)
+	objectsState = []
+	for obj, filterFunc in objects:
+		objectsState.append((id(obj), getattr(obj, "_gestureBindingsGeneration", 0)))
+		if filterFunc is _getTreeModeInterceptorScript:
+			from browseMode import BrowseModeTreeInterceptor
+
+			treeInterceptorState = (
+				obj.passThrough,
+				isinstance(obj, BrowseModeTreeInterceptor)
+				and (obj.singleLetterNavEnabled, obj.shouldTrapNonCommandGestures),
+			)
+	return (
+		tuple(objectsState),
+		treeInterceptorState,
+		tuple((id(globalMap), getattr(globalMap, "_generation", 0)) for globalMap in globalMaps),
+		# Global gesture maps refer to classes by module name,
+		# so they might be resolved differently once modules are loaded or unloaded.
+		len(sys.modules),
+	)
+
+
 def _findScript(gesture: "inputCore.InputGesture") -> Optional[_ScriptFunctionT]:
+	global _findScriptCacheState, _findScriptCacheObjects
 	focus = api.getFocusObject()
 	if not focus:
 		return None
 
+	if gesture.scriptableObject is not None:
+		# Scriptable objects specific to a gesture are not tracked by the cache.
+		return _findScriptInObjects(gesture, _yieldObjectsForFindScript(gesture))
+
+	objects = list(_yieldObjectsForFindScript(gesture))
+	state = _getFindScriptCacheState(objects)
+	if state != _findScriptCacheState:
+		_findScriptCache.clear()
+		_findScriptCacheState = state
+		_findScriptCacheObjects = objects
+	key = (type(gesture), tuple(gesture.normalizedIdentifiers))
+	try:
+		return _findScriptCache[key]
+	except KeyError:
+		pass
+	func = _findScriptInObjects(gesture, objects)
+	if len(_findScriptCache) >= _FIND_SCRIPT_CACHE_MAX_SIZE:
+		_findScriptCache.clear()
+	_findScriptCache[key] = func
+	return func
+
+
+def _findScriptInObjects(
+	gesture: "inputCore.InputGesture",
+	objects: Iterable[Tuple["NVDAObjects.NVDAObject", Optional[_ScriptFilterT]]],
+) -> Optional[_ScriptFunctionT]:
 	globalMapScripts = getGlobalMapScripts(gesture)
 
-	for obj, filterFunc in _yieldObjectsForFindScript(gesture):
+	for obj, filterFunc in objects:
 		if obj:
 			func = _getObjScript(obj, gesture, globalMapScripts)
 			if filterFunc is not None:
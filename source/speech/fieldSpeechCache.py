@@ -0,0 +1,121 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Caching of the speech generated for control and format fields.
+Documents contain many fields with the same attributes, such as the same font on every line
+or the same kind of link in every paragraph.
+The speech for such fields is computed once and then looked up by a key built from the field attributes.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from enum import Enum
+from typing import Any
+
+from .types import SpeechSequence
+
+_IMMUTABLE_SCALAR_TYPES = frozenset({int, float, bool, complex, bytes})
+
+
+class UnfreezableError(Exception):
+	"""Raised when a value can't be turned into a cache key, e.g. because it is an arbitrary object.
+	The speech for such fields is not cached.
+	"""
+
+
+def freezeFieldValue(value: Any) -> Hashable:
+	"""Converts a field attribute value into an equivalent immutable, hashable value.
+	The type of non-string values is part of the result,
+	so that values which compare equal but are spoken differently,
+	such as C{1} and C{True} or a tuple and an L{colors.RGB}, don't share a cache entry.
+	Mappings, sets and sequences are frozen recursively.
+	@param value: The value to freeze.
+	@return: The frozen value.
+	@raise UnfreezableError: If the value, or an item it contains, is not of a known type.
+	"""
+	valueType = type(value)
+	if valueType is str or value is None:
+		return value
+	if valueType in _IMMUTABLE_SCALAR_TYPES or isinstance(value, Enum):
+		return (valueType, value)
+	if isinstance(value, dict):
+		return (valueType, tuple([(key, freezeFieldValue(item)) for key, item in value.items()]))
+	if isinstance(value, (set, frozenset)):
+		return (valueType, frozenset([freezeFieldValue(item) for item in value]))
+	if isinstance(value, (list, tuple)):
+		return (valueType, tuple([freezeFieldValue(item) for item in value]))
+	raise UnfreezableError(f"Can't freeze value of type {valueType.__qualname__}")
+
+
+class FieldSpeechCache:
+	"""A bounded cache of speech sequences, evicting the least recently used sequence when full.
+	The cached sequences are only valid for a given state, such as the configuration and language.
+	When L{validate} is called with a different state, the cache is cleared.
+	"""
+
+	def __init__(self, maxSize: int = 1024):
+		"""
+		@param maxSize: The maximum number of cached sequences.
+			A size of 0 disables caching.
+		"""
+		self.maxSize = maxSize
+		self._sequences: OrderedDict[Hashable, tuple] = OrderedDict()
+		self._state: Hashable = None
+		self._formatConfigKeys: dict[tuple, int] = {}
+		self._lastFormatConfig: dict[str, Any] | None = None
+		self._lastFormatConfigKey: int | None = None
+
+	def __len__(self) -> int:
+		return len(self._sequences)
+
+	def validate(self, state: Hashable) -> None:
+		"""Clears the cache if it was filled for a different state.
+		@param state: The state on which the cached speech depends.
+		"""
+		if state != self._state:
+			self.clear()
+			self._state = state
+
+	def getFormatConfigKey(self, formatConfig: Mapping[str, Any]) -> int:
+		"""Gets a small key standing for the content of a format configuration.
+		Callers usually pass the same configuration for many fields in a row,
+		so comparing it to the previous one is much cheaper than hashing all its items.
+		@param formatConfig: The document formatting configuration.
+		@return: A key which is the same for all configurations with the same content.
+		@raise TypeError: If the configuration contains unhashable values.
+		"""
+		if formatConfig != self._lastFormatConfig:
+			items = tuple(formatConfig.items())
+			# Copy the configuration, as the caller may go on modifying it.
+			self._lastFormatConfig = dict(items)
+			self._lastFormatConfigKey = self._formatConfigKeys.setdefault(items, len(self._formatConfigKeys))
+		return self._lastFormatConfigKey
+
+	def get(self, key: Hashable) -> SpeechSequence | None:
+		"""Looks up the speech cached for a key.
+		@return: A new list with the cached speech, or C{None} if none is cached.
+		"""
+		sequence = self._sequences.get(key)
+		if sequence is None:
+			return None
+		self._sequences.move_to_end(key)
+		return list(sequence)
+
+	def add(self, key: Hashable, sequence: SpeechSequence) -> None:
+		"""Caches the speech for a key.
+		The sequence is copied, so the caller may go on modifying it.
+		"""
+		if self.maxSize <= 0:
+			return
+		self._sequences[key] = tuple(sequence)
+		if len(self._sequences) > self.maxSize:
+			self._sequences.popitem(last=False)
+
+	def clear(self) -> None:
+		self._sequences.clear()
+		self._formatConfigKeys.clear()
+		self._lastFormatConfig = None
+		self._lastFormatConfigKey = None
+		self._state = None
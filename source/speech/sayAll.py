@@ -5,14 +5,17 @@
 # Julien Cochuyt, Cyrille Bougot, Leonard de Ruijter
 
 from abc import ABCMeta, abstractmethod
+from collections import deque
 from enum import IntEnum
 from typing import Callable, TYPE_CHECKING, Optional
+import time
 import weakref
 import garbageHandler
 from logHandler import log
 import config
 import controlTypes
 import api
+import synthDriverHandler
 import systemUtils
 import textInfos
 import queueHandler
@@ -60,6 +63,66 @@ def initialize(
 	)
 
 
+class _ReadAheadWindow:
+	"""The amount of speech, in characters, which say all keeps queued ahead of the line being spoken.
+	Text is read ahead until the lines waiting to be spoken reach the target length.
+	The target doubles whenever the synthesizer runs out of speech, or is about to, while reading,
+	and halves whenever say all is canceled, as the speech read ahead is then wasted.
+	The window is kept across say all sessions, so that it adapts to how fast text is produced.
+
+	The window also records the gaps during which the synthesizer was idle while say all was reading,
+	i.e. the time between the synthesizer finishing all its speech and say all queuing more speech.
+	"""
+
+	MIN_LENGTH = 200
+	"""The minimum target length, roughly a few sentences."""
+	INITIAL_LENGTH = 500
+	MAX_LENGTH = 8000
+	"""The maximum target length, roughly a few minutes of speech."""
+
+	def __init__(self, clock: Callable[[], float] = time.perf_counter):
+		"""
+		@param clock: Gets the current time in seconds, used to measure idle gaps.
+		"""
+		self._clock = clock
+		self.targetLength = self.INITIAL_LENGTH
+		self._idleSince: float | None = None
+		self.resetIdleGaps()
+
+	def grow(self) -> None:
+		self.targetLength = min(self.targetLength * 2, self.MAX_LENGTH)
+
+	def shrink(self) -> None:
+		self.targetLength = max(self.targetLength // 2, self.MIN_LENGTH)
+
+	def resetIdleGaps(self) -> None:
+		"""Resets the idle gap statistics, e.g. when a new say all session starts."""
+		self._idleSince = None
+		self.idleGapCount = 0
+		self.totalIdleTime = 0.0
+		self.longestIdleGap = 0.0
+
+	def synthIdle(self) -> None:
+		"""Notes that the synthesizer has finished speaking all the speech it was given.
+		This may be called from any thread.
+		"""
+		self._idleSince = self._clock()
+
+	def speechQueued(self) -> None:
+		"""Notes that say all has sent speech to the synthesizer.
+		This ends the idle gap, if any, in which case the window grows.
+		"""
+		idleSince = self._idleSince
+		if idleSince is None:
+			return
+		self._idleSince = None
+		gap = self._clock() - idleSince
+		self.idleGapCount += 1
+		self.totalIdleTime += gap
+		self.longestIdleGap = max(self.longestIdleGap, gap)
+		self.grow()
+
+
 class _SayAllHandler:
 	def __init__(
 		self,
@@ -76,6 +139,7 @@ def __init__(
 		self._speakObject = speakObject
 		self._getTextInfoSpeech = getTextInfoSpeech
 		self._makeSpeakTextInfoState = SpeakTextInfoState
+		self.readAheadWindow = _ReadAheadWindow()
 
 	def stop(self):
 		"""
@@ -83,6 +147,9 @@ def stop(self):
 		"""
 		active = self._getActiveSayAll()
 		if active:
+			if isinstance(active, _TextReader) and active.reader:
+				# Reading is canceled, so the text read ahead of the speech was read for nothing.
+				self.readAheadWindow.shrink()
 			active.stop()
 		self.speechWithoutPausesInstance.reset()
 
@@ -214,19 +281,22 @@ class _TextReader(_Reader):
 	2. L{nextLine} is called to read the first line.
 	3. When it speaks a line, L{nextLine} request that L{lineReached} be called
 		when we start speaking this line, providing the position and state at this point.
-	4. When we start speaking a line, L{lineReached} is called
+	4. Until the speech waiting to be spoken fills the L{_ReadAheadWindow},
+		L{nextLine} queues a call to itself to read ahead.
+	5. When we start speaking a line, L{lineReached} is called
 		and moves the cursor to that line.
-	5. L{lineReached} calls L{nextLine}.
-	6. If there are more lines, L{nextLine} works as per steps 3 and 4.
-	7. Otherwise, if the object doesn't support page turns, we're finished.
-	8. If the object does support page turns,
+	6. If the window is no longer filled, L{lineReached} calls L{nextLine}.
+	7. If there are more lines, L{nextLine} works as per steps 3 to 5.
+	8. Otherwise, if the object doesn't support page turns, we're finished.
+	9. If the object does support page turns,
 		we request that L{turnPage} be called when speech is finished.
-	9. L{turnPage} tries to turn the page.
-	10. If there are no more pages, we're finished.
-	11. If there is another page, L{turnPage} calls L{nextLine}.
+	10. L{turnPage} tries to turn the page.
+	11. If there are no more pages, we're finished.
+	12. If there is another page, L{turnPage} calls L{nextLine}.
 	"""
 
 	MAX_BUFFERED_LINES = 10
+	"""The maximum number of lines read in a row without a natural pause, after which speech is forced."""
 
 	def __init__(self, handler: _SayAllHandler):
 		self.reader = None
@@ -236,8 +306,18 @@ def __init__(self, handler: _SayAllHandler):
 		# #10899: SayAll profile can't be activated earlier because they may not be anything to read
 		self.trigger.enter()
 		self.speakTextInfoState = SayAllHandler._makeSpeakTextInfoState(self.reader.obj)
+		#: The number of lines read in a row without a natural pause, which are buffered but not spoken yet.
 		self.numBufferedLines = 0
 		self.initialIteration = True
+		self.readAheadWindow = self.handler.readAheadWindow
+		self.readAheadWindow.resetIdleGaps()
+		#: The lengths of the lines which have been read but not reached yet, in reading order.
+		self._pendingLineLengths: deque[int] = deque()
+		self._pendingLength = 0
+		self._isNextLineQueued = False
+		#: Whether there is no more text to read, in which case the reader is finishing.
+		self._reachedEnd = False
+		synthDriverHandler.synthDoneSpeaking.register(self._onSynthDoneSpeaking)
 
 	@abstractmethod
 	def getInitialTextInfo(self) -> textInfos.TextInfo: ...
@@ -307,8 +387,12 @@ def nextLine(self):
 			self.finish()
 			return
 
+		if self._reachedEnd:
+			return
+
 		if not self.initialIteration or not self.shouldReadInitialPosition():
 			if not self.nextLineImpl():
+				self._reachedEnd = True
 				return
 		self.initialIteration = False
 		bookmark = self.reader.bookmark
@@ -338,38 +422,65 @@ def _onLineReached(obj=self.reader.obj, state=state):
 		)
 		seq = list(_flattenNestedSequences(speechGen))
 		seq.insert(0, cb)
+		lineLength = sum(len(item) for item in seq if isinstance(item, str))
+		self._pendingLineLengths.append(lineLength)
+		self._pendingLength += lineLength
 		# Speak the speech sequence.
 		spoke = self.handler.speechWithoutPausesInstance.speakWithoutPauses(seq)
 		# Update the textInfo state ready for when speaking the next line.
 		self.speakTextInfoState = state.copy()
 
 		if not self.collapseLineImpl():
+			self._reachedEnd = True
 			return
 
-		if not spoke:
+		if spoke:
+			self.numBufferedLines = 0
+		else:
 			# This line didn't include a natural pause, so nothing was spoken.
 			self.numBufferedLines += 1
-			if self.numBufferedLines < self.MAX_BUFFERED_LINES:
-				# Move on to the next line.
-				# We queue this to allow the user a chance to stop say all.
-				queueHandler.queueFunction(queueHandler.eventQueue, self.nextLine)
-			else:
+			if self.numBufferedLines >= self.MAX_BUFFERED_LINES:
 				# We don't want to buffer too much.
 				# Force speech. lineReached will resume things when speech catches up.
 				self.handler.speechWithoutPausesInstance.speakWithoutPauses(None)
-				# The first buffered line has now started speaking.
-				self.numBufferedLines -= 1
+				self.numBufferedLines = 0
+				spoke = True
+		if spoke:
+			self.readAheadWindow.speechQueued()
+		if self.numBufferedLines or self._pendingLength < self.readAheadWindow.targetLength:
+			# Move on to the next line.
+			# We queue this to allow the user a chance to stop say all.
+			self._queueNextLine()
+
+	def _queueNextLine(self) -> None:
+		if self._isNextLineQueued:
+			return
+		self._isNextLineQueued = True
+		queueHandler.queueFunction(queueHandler.eventQueue, self._nextQueuedLine)
+
+	def _nextQueuedLine(self) -> None:
+		self._isNextLineQueued = False
+		self.nextLine()
 
 	def lineReached(self, obj, bookmark, state):
 		# We've just started speaking this line, so move the cursor there.
 		state.updateObj()
 		updater = obj.makeTextInfo(bookmark)
 		self.updateCaret(updater)
-		if self.numBufferedLines == 0:
-			# This was the last line spoken, so move on.
+		if self._pendingLineLengths:
+			self._pendingLength -= self._pendingLineLengths.popleft()
+		if self._reachedEnd:
+			return
+		if self._isNextLineQueued:
+			return
+		if not self._pendingLineLengths:
+			# This was the last line read, so the synthesizer is about to catch up with reading.
+			self.readAheadWindow.grow()
+		if self._pendingLength < self.readAheadWindow.targetLength:
 			self.nextLine()
-		else:
-			self.numBufferedLines -= 1
+
+	def _onSynthDoneSpeaking(self, synth: synthDriverHandler.SynthDriver) -> None:
+		self.readAheadWindow.synthIdle()
 
 	def turnPage(self):
 		try:
@@ -380,6 +491,7 @@ def turnPage(self):
 			self.stop()
 			return
 		self.reader = self.reader.obj.makeTextInfo(textInfos.POSITION_FIRST)
+		self._reachedEnd = False
 		self.nextLine()
 
 	def finish(self):
@@ -401,6 +513,13 @@ def stop(self):
 		if not self.reader:
 			return
 		self.reader = None
+		synthDriverHandler.synthDoneSpeaking.unregister(self._onSynthDoneSpeaking)
+		window = self.readAheadWindow
+		log.debug(
+			f"Say all read ahead up to {window.targetLength} characters, "
+			f"synthesizer was idle {window.idleGapCount} times for {window.totalIdleTime:.3f}s "
+			f"(longest {window.longestIdleGap:.3f}s)",
+		)
 		self.trigger.exit()
 		self.trigger = None
 		super().stop()
@@ -41,6 +41,7 @@
 	CharacterModeCommand,
 )
 from .shortcutKeys import getKeyboardShortcutsSpeech
+from .fieldSpeechCache import FieldSpeechCache, UnfreezableError, freezeFieldValue
 
 from . import types
 from .types import (
@@ -938,7 +939,7 @@ def _objectSpeech_calculateAllowedProps(
 	if reason != OutputReason.QUERY:
 		allowProperties["rowCount"] = False
 		allowProperties["columnCount"] = False
-	formatConf = config.conf["documentFormatting"]
+	formatConf = config.conf.getSectionSnapshot("documentFormatting")
 	if not formatConf["reportTableCellCoords"]:
 		allowProperties["cellCoordsText"] = False
 		# rowNumber and columnNumber might be needed even if we're not reporting coordinates.
@@ -1505,7 +1506,7 @@ def getTextInfoSpeech(  # noqa: C901
 		speakTextInfoState = None
 	extraDetail = unit in (textInfos.UNIT_CHARACTER, textInfos.UNIT_WORD)
 	if not formatConfig:
-		formatConfig = config.conf["documentFormatting"]
+		formatConfig = config.conf.getSectionSnapshot("documentFormatting")
 	formatConfig = formatConfig.copy()
 	if extraDetail:
 		formatConfig["extraDetail"] = True
@@ -2205,10 +2206,20 @@ def _shouldSpeakContentFirst(
 	)
 
 
-# C901 'getControlFieldSpeech' is too complex
-# Note: when working on getControlFieldSpeech, look for opportunities to simplify
-# and move logic out into smaller helper functions.
-def getControlFieldSpeech(  # noqa: C901
+_controlFieldSpeechCache = FieldSpeechCache()
+"""Caches the speech for control fields, see L{getControlFieldSpeech}."""
+_formatFieldSpeechCache = FieldSpeechCache()
+"""Caches the speech for format fields, see L{getFormatFieldSpeech}."""
+
+
+def _getFieldSpeechCacheState() -> tuple[int, str]:
+	"""Gets the state on which the cached field speech depends.
+	Field speech is affected by the configuration and translated to the NVDA language.
+	"""
+	return (config.conf.snapshotGeneration, languageHandler.getLanguage())
+
+
+def getControlFieldSpeech(
 	attrs: textInfos.ControlField,
 	ancestorAttrs: List[textInfos.Field],
 	fieldType: str,
@@ -2219,7 +2230,7 @@ def getControlFieldSpeech(  # noqa: C901
 	if attrs.get("isHidden"):
 		return []
 	if not formatConfig:
-		formatConfig = config.conf["documentFormatting"]
+		formatConfig = config.conf.getSectionSnapshot("documentFormatting")
 
 	presCat = attrs.getPresentationCategory(
 		ancestorAttrs,
@@ -2227,6 +2238,37 @@ def getControlFieldSpeech(  # noqa: C901
 		reason=reason,
 		extraDetail=extraDetail,
 	)
+	if presCat != attrs.PRESCAT_LAYOUT and attrs.get("table-id"):
+		# The speech for tables depends on the previously reported table and cell,
+		# which is tracked in the speech state by getPropertiesSpeech.
+		return _getControlFieldSpeech(attrs, fieldType, formatConfig, presCat, extraDetail, reason)
+	try:
+		# formatConfig only affects the speech for tables, otherwise it is accounted for by presCat.
+		key = (type(attrs), freezeFieldValue(attrs), fieldType, presCat, extraDetail, reason)
+	except UnfreezableError:
+		return _getControlFieldSpeech(attrs, fieldType, formatConfig, presCat, extraDetail, reason)
+	_controlFieldSpeechCache.validate(_getFieldSpeechCacheState())
+	sequence = _controlFieldSpeechCache.get(key)
+	if sequence is None:
+		sequence = _getControlFieldSpeech(attrs, fieldType, formatConfig, presCat, extraDetail, reason)
+		_controlFieldSpeechCache.add(key, sequence)
+	return sequence
+
+
+# C901 '_getControlFieldSpeech' is too complex
+# Note: when working on _getControlFieldSpeech, look for opportunities to simplify
+# and move logic out into smaller helper functions.
+def _getControlFieldSpeech(  # noqa: C901
+	attrs: textInfos.ControlField,
+	fieldType: str,
+	formatConfig: Dict[str, bool],
+	presCat: str,
+	extraDetail: bool,
+	reason: Optional[OutputReason],
+) -> SpeechSequence:
+	"""Gets the speech for a control field, see L{getControlFieldSpeech}.
+	@param presCat: The presentation category of the field.
+	"""
 	childControlCount = int(attrs.get("_childcontrolcount", "0"))
 	role = attrs.get("role", controlTypes.Role.UNKNOWN)
 	if reason in [OutputReason.FOCUS, OutputReason.QUICKNAV] or attrs.get("alwaysReportName", False):
@@ -2537,10 +2579,7 @@ def getControlFieldSpeech(  # noqa: C901
 		return []
 
 
-# C901 'getFormatFieldSpeech' is too complex
-# Note: when working on getFormatFieldSpeech, look for opportunities to simplify
-# and move logic out into smaller helper functions.
-def getFormatFieldSpeech(  # noqa: C901
+def getFormatFieldSpeech(
 	attrs: textInfos.Field,
 	attrsCache: Optional[textInfos.Field] = None,
 	formatConfig: Optional[Dict[str, bool]] = None,
@@ -2549,8 +2588,64 @@ def getFormatFieldSpeech(  # noqa: C901
 	extraDetail: bool = False,
 	initialFormat: bool = False,
 ) -> SpeechSequence:
+	formatConfigSnapshot = config.conf.getSectionSnapshot("documentFormatting")
 	if not formatConfig:
-		formatConfig = config.conf["documentFormatting"]
+		formatConfig = formatConfigSnapshot
+	_formatFieldSpeechCache.validate(_getFieldSpeechCacheState())
+	try:
+		key = (
+			freezeFieldValue(attrs),
+			freezeFieldValue(attrsCache),
+			# The snapshot is already accounted for by the cache state.
+			None
+			if formatConfig is formatConfigSnapshot
+			else _formatFieldSpeechCache.getFormatConfigKey(formatConfig),
+			reason,
+			unit,
+			extraDetail,
+			initialFormat,
+		)
+	except (UnfreezableError, TypeError):
+		return _getFormatFieldSpeech(
+			attrs,
+			attrsCache,
+			formatConfig,
+			reason,
+			unit,
+			extraDetail,
+			initialFormat,
+		)
+	sequence = _formatFieldSpeechCache.get(key)
+	if sequence is None:
+		sequence = _getFormatFieldSpeech(
+			attrs,
+			attrsCache,
+			formatConfig,
+			reason,
+			unit,
+			extraDetail,
+			initialFormat,
+		)
+		_formatFieldSpeechCache.add(key, sequence)
+	elif attrsCache is not None:
+		attrsCache.clear()
+		attrsCache.update(attrs)
+	return sequence
+
+
+# C901 '_getFormatFieldSpeech' is too complex
+# Note: when working on _getFormatFieldSpeech, look for opportunities to simplify
+# and move logic out into smaller helper functions.
+def _getFormatFieldSpeech(  # noqa: C901
+	attrs: textInfos.Field,
+	attrsCache: Optional[textInfos.Field],
+	formatConfig: Dict[str, bool],
+	reason: Optional[OutputReason],
+	unit: Optional[str],
+	extraDetail: bool,
+	initialFormat: bool,
+) -> SpeechSequence:
+	"""Gets the speech for a format field, see L{getFormatFieldSpeech}."""
 	textList = []
 	if formatConfig["reportTables"]:
 		tableInfo = attrs.get("table-info")
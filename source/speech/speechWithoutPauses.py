@@ -5,6 +5,7 @@
 # Julien Cochuyt
 
 import re
+from itertools import islice
 
 from .commands import (
 	# Commands that are used in this file.
@@ -145,38 +146,43 @@ def _getSpeech(
 		speechSequence: SpeechSequence,
 	) -> SpeechSequence:
 		"""
+		Speech up to and including the last phrase or sentence boundary in the sequence is returned,
+		along with any speech which was pending.
+		The rest of the sequence is kept pending, to be spoken once a boundary is found.
 		@return: May be an empty sequence
 		"""
-		finalSpeechSequence: SpeechSequence = []  # To be spoken now
-		pendingSpeechSequence: speechSequence = []  # To be saved off for speaking later
-		# Scan the given speech and place all completed phrases in finalSpeechSequence to be spoken,
-		# And place the final incomplete phrase in pendingSpeechSequence
-		for index in range(len(speechSequence) - 1, -1, -1):
-			item = speechSequence[index]
+		# Scan the sequence once, noting the strings which may contain a pause
+		# along with the last language change before each of them.
+		# Only these candidates need to be matched against the pause expression.
+		candidates: list[tuple[int, int]] = []
+		lastLangChangeIndex = -1
+		for index, item in enumerate(speechSequence):
 			if isinstance(item, str):
-				m = self.re_last_pause.match(item)
-				if m:
-					before, after = m.groups()
-					if after:
-						pendingSpeechSequence.append(after)
-					if before:
-						finalSpeechSequence.extend(self._flushPendingSpeech())
-						finalSpeechSequence.extend(speechSequence[0:index])
-						finalSpeechSequence.append(before)
-						# Apply the last language change to the pending sequence.
-						# This will need to be done for any other speech change commands introduced in future.
-						for changeIndex in range(index - 1, -1, -1):
-							change = speechSequence[changeIndex]
-							if not isinstance(change, LangChangeCommand):
-								continue
-							pendingSpeechSequence.append(change)
-							break
-						break
-				else:
-					pendingSpeechSequence.append(item)
-			else:
-				pendingSpeechSequence.append(item)
-		if pendingSpeechSequence:
-			pendingSpeechSequence.reverse()
-			self._pendingSpeechSequence.extend(pendingSpeechSequence)
+				if "." in item or "!" in item or "?" in item:
+					candidates.append((index, lastLangChangeIndex))
+			elif isinstance(item, LangChangeCommand):
+				lastLangChangeIndex = index
+		# The last candidate containing a pause ends the speech to be spoken now.
+		for pauseIndex, langChangeIndex in reversed(candidates):
+			match = self.re_last_pause.match(speechSequence[pauseIndex])
+			if match:
+				break
+		else:
+			# No complete phrase, keep the whole sequence pending.
+			self._pendingSpeechSequence.extend(speechSequence)
+			return []
+		before, after = match.groups()
+		# The pending speech is only ever appended to,
+		# so it can be handed over as the start of the speech to be spoken now.
+		finalSpeechSequence = self._flushPendingSpeech()
+		finalSpeechSequence.extend(islice(speechSequence, pauseIndex))
+		finalSpeechSequence.append(before)
+		pendingSpeechSequence = self._pendingSpeechSequence
+		# Apply the last language change to the pending sequence.
+		# This will need to be done for any other speech change commands introduced in future.
+		if langChangeIndex >= 0:
+			pendingSpeechSequence.append(speechSequence[langChangeIndex])
+		if after:
+			pendingSpeechSequence.append(after)
+		pendingSpeechSequence.extend(islice(speechSequence, pauseIndex + 1, None))
 		return finalSpeechSequence
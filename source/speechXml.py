@@ -10,9 +10,11 @@
 L{SsmlConverter} is an implementation for conversion to SSML.
 """
 
+import functools
+import io
 import re
 from collections import OrderedDict, namedtuple
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Iterable
 from xml.parsers import expat
 
 import textUtils
@@ -108,10 +110,28 @@ def toNvdaLang(xmlLang: str) -> str:
 
 def _escapeXml(text):
 	text = text.translate(XML_ESCAPES)
+	if text.isascii() and text.isprintable():
+		# Printable ASCII contains no invalid characters, so the expensive search can be skipped.
+		return text
 	text = RE_INVALID_XML_CHARS.sub(REPLACEMENT_CHAR, text)
 	return text
 
 
+def _formatOpenTag(tag: str, attrs: Iterable[tuple[str, str]], empty: bool = False) -> str:
+	# Attribute values could be ints, floats etc, not just strings.
+	# Therefore coerce the value to a string, as well as escaping xml characters.
+	attrsXml = "".join(f' {attr}="{_escapeXml(str(val))}"' for attr, val in attrs)
+	return f"<{tag}{attrsXml}{'/>' if empty else '>'}"
+
+
+@functools.lru_cache(maxsize=256)
+def _formatCachedOpenTag(tag: str, attrs: tuple[tuple[str, str], ...]) -> str:
+	"""Formats an opening tag whose attributes only take a few values, such as prosody and language tags.
+	@param attrs: The attributes and their values, which must already be strings.
+	"""
+	return _formatOpenTag(tag, attrs)
+
+
 class XmlBalancer:
 	"""Generates balanced XML given a set of commands.
 	NVDA speech sequences are linear, but XML is hierarchical, which makes conversion challenging.
@@ -119,11 +139,12 @@ class XmlBalancer:
 	In XML, resetting to default generally requires closing the tag, but that also requires closing the outer tag.
 	This class transparently handles these issues, balancing the XML as appropriate.
 	To use, create an instance and call the L{generateXml} method.
+	An instance can be reused for several conversions, but not for conversions on several threads at once.
 	"""
 
 	def __init__(self):
 		#: The converted output as it is built.
-		self._out = []
+		self._out = io.StringIO()
 		#: A stack of open tags which enclose the entire output.
 		self._enclosingAllTags = []
 		#: Whether any tags have changed since last time they were output.
@@ -135,26 +156,35 @@ def __init__(self):
 		#: A tag (and its attributes) which should directly enclose all text henceforth.
 		self._tagEnclosingText = (None, None)
 
+	def reset(self):
+		"""Discards the output and tags of the previous conversion."""
+		self._out.seek(0)
+		self._out.truncate()
+		self._enclosingAllTags.clear()
+		self._tagsChanged = False
+		self._openTags.clear()
+		self._tags.clear()
+		self._tagEnclosingText = (None, None)
+
 	def _text(self, text):
 		tag, attrs = self._tagEnclosingText
 		if tag:
-			self._openTag(tag, attrs)
-		self._out.append(_escapeXml(text))
+			self._openCachedTag(tag, attrs)
+		self._out.write(_escapeXml(text))
 		if tag:
 			self._closeTag(tag)
 
 	def _openTag(self, tag, attrs, empty=False):
-		self._out.append("<%s" % tag)
-		for attr, val in attrs.items():
-			self._out.append(' %s="' % attr)
-			# Attribute values could be ints, floats etc, not just strings.
-			# Therefore coerce the value to a string, as well as escaping xml characters.
-			self._out.append(_escapeXml(str(val)))
-			self._out.append('"')
-		self._out.append("/>" if empty else ">")
+		self._out.write(_formatOpenTag(tag, attrs.items(), empty))
+
+	def _openCachedTag(self, tag, attrs):
+		"""Opens a tag which is likely to be output again with the same attributes, such as a prosody tag.
+		The formatted tag is cached, so that its attribute values needn't be escaped every time.
+		"""
+		self._out.write(_formatCachedOpenTag(tag, tuple((attr, str(val)) for attr, val in attrs.items())))
 
 	def _closeTag(self, tag):
-		self._out.append("</%s>" % tag)
+		self._out.write(f"</{tag}>")
 
 	def _setAttr(self, tag, attr, val):
 		attrs = self._tags.get(tag)
@@ -183,18 +213,19 @@ def _outputTags(self):
 			self._closeTag(tag)
 		del self._openTags[:]
 		for tag, attrs in self._tags.items():
-			self._openTag(tag, attrs)
+			self._openCachedTag(tag, attrs)
 			self._openTags.append(tag)
 		self._tagsChanged = False
 
 	def generateXml(self, commands) -> str:
 		"""Generate XML from a sequence of balancer commands and text."""
+		self.reset()
 		for command in commands:
 			if isinstance(command, str):
 				self._outputTags()
 				self._text(command)
 			elif isinstance(command, EncloseAllCommand):
-				self._openTag(command.tag, command.attrs)
+				self._openCachedTag(command.tag, command.attrs)
 				self._enclosingAllTags.append(command.tag)
 			elif isinstance(command, SetAttrCommand):
 				self._setAttr(command.tag, command.attr, command.val)
@@ -215,7 +246,7 @@ def generateXml(self, commands) -> str:
 			self._closeTag(tag)
 		for tag in self._enclosingAllTags:
 			self._closeTag(tag)
-		return "".join(self._out)
+		return self._out.getvalue()
 
 
 class SpeechXmlConverter:
@@ -236,8 +267,13 @@ class SpeechXmlConverter:
 	Subclasses may wish to extend L{generateBalancerCommands}
 	to produce additional XmlBalancer commands at the start or end;
 	e.g. to add an L{EncloseAllCommand} at the start.
+	A converter reuses its balancer, so it should be reused for subsequent utterances,
+	but it must not convert on several threads at once.
 	"""
 
+	#: The balancer used by L{convertToXml}, created on first use.
+	_balancer: XmlBalancer | None = None
+
 	def generateBalancerCommands(self, speechSequence):
 		"""Generate appropriate XmlBalancer commands for a given speech sequence.
 		@rtype: generator
@@ -260,9 +296,13 @@ def generateBalancerCommands(self, speechSequence):
 
 	def convertToXml(self, speechSequence):
 		"""Convenience method to convert a speech sequence to XML using L{XmlBalancer}."""
-		bal = XmlBalancer()
+		if self._balancer is None:
+			self._balancer = XmlBalancer()
+		if isinstance(speechSequence, list) and all(isinstance(item, str) for item in speechSequence):
+			# A sequence of text without commands is converted as a single string.
+			speechSequence = ["".join(speechSequence)]
 		balCommands = self.generateBalancerCommands(speechSequence)
-		return bal.generateXml(balCommands)
+		return self._balancer.generateXml(balCommands)
 
 
 class SsmlConverter(SpeechXmlConverter):
@@ -324,6 +364,13 @@ def convertPhonemeCommand(self, command):
 		return StandAloneTagCommand("phoneme", {"alphabet": "ipa", "ph": command.ipa}, command.text)
 
 
+@functools.lru_cache(maxsize=64)
+def _getParseFuncName(tagName: str) -> str:
+	"""Gets the name of the L{SpeechXmlParser} method which parses a tag, e.g. C{parseSayAs} for C{say-as}."""
+	processedTagName = "".join(tagName.title().split("-"))
+	return f"parse{processedTagName}"
+
+
 class SpeechXmlParser:
 	"""Base class for parsing of NVDA speech sequences from XML.
 	This class converts XML to an NVDA speech sequence.
@@ -341,8 +388,7 @@ class SpeechXmlParser:
 	_speechSequence: SpeechSequence
 
 	def _elementHandler(self, tagName: str, attrs: dict | None = None):
-		processedTagName = "".join(tagName.title().split("-"))
-		funcName = f"parse{processedTagName}"
+		funcName = _getParseFuncName(tagName)
 		if (func := getattr(self, funcName, None)) is None:
 			log.debugWarning(f"Unsupported tag: {tagName}")
 			return
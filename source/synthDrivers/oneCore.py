@@ -239,6 +239,9 @@ def __init__(self):
 		self._dll.ocSpeech_getVoices.restype = NVDAHelper.bstrReturn
 		self._dll.ocSpeech_getCurrentVoiceId.restype = ctypes.c_wchar_p
 		self._player = None
+		#: The converter of the previous utterance, reused while the language and prosody are unchanged.
+		self._ssmlConverter: Optional[_OcSsmlConverter] = None
+		self._ssmlConverterKey: Optional[tuple] = None
 		# Initialize state.
 		self._queuedSpeech: List[Union[str, Tuple[Callable[[ctypes.POINTER, float], None], float]]] = []
 
@@ -293,17 +296,32 @@ def cancel(self):
 		if self._player:
 			self._player.stop()
 
-	def speak(self, speechSequence: SpeechSequence) -> None:
+	def _getSsmlConverter(self) -> _OcSsmlConverter:
+		"""Gets a converter for the current voice, reusing the previous one if its settings are unchanged."""
+		language = self.language
+		availableLanguages = frozenset(self.availableLanguages)
+		if self.supportsProsodyOptions:
+			key = (language, availableLanguages)
+		else:
+			key = (language, availableLanguages, self._rate, self._pitch, self._volume)
+		if key == self._ssmlConverterKey:
+			return self._ssmlConverter
 		if self.supportsProsodyOptions:
-			conv = _OcSsmlConverter(self.language, self.availableLanguages)
+			conv = _OcSsmlConverter(language, availableLanguages)
 		else:
 			conv = _OcPreAPI5SsmlConverter(
-				self.language,
-				self.availableLanguages,
+				language,
+				availableLanguages,
 				self._rate,
 				self._pitch,
 				self._volume,
 			)
+		self._ssmlConverter = conv
+		self._ssmlConverterKey = key
+		return conv
+
+	def speak(self, speechSequence: SpeechSequence) -> None:
+		conv = self._getSsmlConverter()
 		text = conv.convertToXml(speechSequence)
 		# #7495: Calling WaveOutOpen blocks for ~100 ms if called from the callback
 		# when the SSML includes marks.
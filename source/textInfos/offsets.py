@@ -5,6 +5,9 @@
 # Copyright (C) 2006-2024 NV Access Limited, Babbage B.V., Leonard de Ruijter
 
 from abc import abstractmethod
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate
 import re
 import ctypes
 import unicodedata
@@ -16,6 +19,7 @@
 import textUtils
 from dataclasses import dataclass
 from typing import (
+	Generator,
 	Optional,
 	Tuple,
 	Dict,
@@ -90,6 +94,87 @@ def findEndOfLine(text, offset, lineLength=None):
 	return end + 1
 
 
+#: The first letters of the Unicode categories of characters which make up words:
+#: letters, marks and numbers.
+_WORD_CATEGORIES = "LMN"
+#: The number of characters matched at once when searching backwards for the start of a word.
+_WORD_SEARCH_WINDOW = 256
+#: The first character outside the Basic Multilingual Plane.
+_FIRST_ASTRAL_CHARACTER = "\U00010000"
+
+
+@lru_cache(maxsize=1)
+def _getBmpWordCharacters() -> tuple[bytes, re.Pattern]:
+	"""Finds the characters in the Basic Multilingual Plane which make up words,
+	i.e. which are letters, marks or numbers.
+	This is done once, the first time words are searched.
+	@return: A bitmap with a bit set for each word character,
+		the first character being the least significant bit,
+		and a pattern matching runs of word characters.
+	"""
+	isWordCharacter = bytes(
+		[category[0] in _WORD_CATEGORIES for category in map(unicodedata.category, map(chr, range(0x10000)))],
+	)
+	bits = isWordCharacter[::-1].translate(bytes.maketrans(b"\x00\x01", b"01"))
+	bitmap = int(bits, 2).to_bytes(0x10000 // 8, "little")
+	ranges = "".join(
+		f"{re.escape(chr(run.start()))}-{re.escape(chr(run.end() - 1))}"
+		for run in re.finditer(b"\x01+", isWordCharacter)
+	)
+	return bitmap, re.compile(f"[{ranges}]*")
+
+
+def _isWordCharacter(char: str) -> bool:
+	"""Whether a character is a letter, mark or number, i.e. part of a word."""
+	code = ord(char)
+	if code < 0x10000:
+		return bool(_getBmpWordCharacters()[0][code >> 3] >> (code & 7) & 1)
+	return unicodedata.category(char)[0] in _WORD_CATEGORIES
+
+
+def _findEndOfWordCharacters(text: str, offset: int) -> int:
+	"""Finds the end of the run of word characters starting at an offset.
+	@return: The offset of the first character after the run.
+	"""
+	pattern = _getBmpWordCharacters()[1]
+	category = unicodedata.category
+	textLength = len(text)
+	while True:
+		runStart = offset
+		offset = pattern.match(text, offset).end()
+		# The pattern only matches characters in the Basic Multilingual Plane.
+		while offset < textLength:
+			char = text[offset]
+			if char < _FIRST_ASTRAL_CHARACTER or category(char)[0] not in _WORD_CATEGORIES:
+				break
+			offset += 1
+		if offset == runStart:
+			return offset
+
+
+def _findStartOfWordCharacters(text: str, offset: int) -> int:
+	"""Finds the start of the run of word characters ending before an offset.
+	The text is matched backwards in reversed windows,
+	so that long words are matched without stepping over each character.
+	@return: The offset of the first character of the run.
+	"""
+	pattern = _getBmpWordCharacters()[1]
+	category = unicodedata.category
+	while offset > 0:
+		runEnd = offset
+		window = text[max(offset - _WORD_SEARCH_WINDOW, 0) : offset][::-1]
+		offset -= pattern.match(window).end()
+		# The pattern only matches characters in the Basic Multilingual Plane.
+		while offset > 0:
+			char = text[offset - 1]
+			if char < _FIRST_ASTRAL_CHARACTER or category(char)[0] not in _WORD_CATEGORIES:
+				break
+			offset -= 1
+		if offset == runEnd:
+			break
+	return offset
+
+
 def findStartOfWord(text, offset, lineLength=None):
 	"""Searches backwards through the given text from the given offset, until it finds the offset that is the start of the word. It checks to see if a character is alphanumeric, or is another symbol , or is white space.
 	@param text: the text to search
@@ -105,12 +190,9 @@ def findStartOfWord(text, offset, lineLength=None):
 		return offset
 	while offset > 0 and text[offset].isspace():
 		offset -= 1
-	if unicodedata.category(text[offset])[0] not in "LMN":
+	if not _isWordCharacter(text[offset]):
 		return offset
-	else:
-		while offset > 0 and unicodedata.category(text[offset - 1])[0] in "LMN":
-			offset -= 1
-	return offset
+	return _findStartOfWordCharacters(text, offset)
 
 
 def findEndOfWord(text, offset, lineLength=None):
@@ -126,16 +208,85 @@ def findEndOfWord(text, offset, lineLength=None):
 	"""
 	if offset >= len(text):
 		return offset + 1
-	if unicodedata.category(text[offset])[0] in "LMN":
-		while offset < len(text) and unicodedata.category(text[offset])[0] in "LMN":
-			offset += 1
-	elif unicodedata.category(text[offset])[0] not in "LMNZ":
+	if _isWordCharacter(text[offset]):
+		offset = _findEndOfWordCharacters(text, offset)
+	elif unicodedata.category(text[offset])[0] != "Z":
 		offset += 1
 	while offset < len(text) and text[offset].isspace():
 		offset += 1
 	return offset
 
 
+def _iterLineChunks(text: str, start: int, end: int) -> Generator[str, None, None]:
+	"""Splits a range of text into lines in one pass over the text.
+	The lines are the same as those found by L{findStartOfLine} and L{findEndOfLine},
+	clipped to the range.
+	@param text: The text to split.
+	@param start: The offset at which the range starts.
+	@param end: The offset at which the range ends (exclusive).
+	@return: The text of each line in the range.
+	"""
+	offset = start
+	while offset < end:
+		lineStart = findStartOfLine(text, offset)
+		lineEnd = findEndOfLine(text, offset)
+		if lineEnd <= offset:
+			log.debugWarning("Could not move to the end of the line, breaking")
+			break
+		yield text[max(lineStart, start) : min(lineEnd, end)]
+		offset = lineEnd
+
+
+@lru_cache(maxsize=8)
+def _getLineBoundaries(text: str, wideOffsets: bool) -> tuple[int, ...] | None:
+	"""Finds the offsets at which all the lines of a text start in one pass,
+	with lines as found by L{findStartOfLine} and L{findEndOfLine}.
+	The boundaries are cached per text, so they are only found again once a story changes.
+	@param text: The text to search.
+	@param wideOffsets: Whether to return UTF-16 offsets rather than str offsets.
+	@return: The offsets at which the lines start, followed by the length of the text,
+		or C{None} if the text contains carriage returns which aren't followed by a line feed.
+		The line containing an offset in such text depends on the direction it is searched in.
+	"""
+	if text.count("\r") != text.count("\r\n"):
+		return None
+	lines = text.split("\n")
+	if wideOffsets and not text.isascii():
+		lengths = [
+			len(line.encode(textUtils.WCHAR_ENCODING, errors="surrogatepass")) // 2 + 1 for line in lines
+		]
+	else:
+		lengths = [len(line) + 1 for line in lines]
+	# The last line isn't ended by a line feed.
+	lengths[-1] -= 1
+	boundaries = [0, *accumulate(lengths)]
+	if lengths[-1] == 0:
+		# The text is empty or ends with a line feed, which doesn't start another line.
+		boundaries.pop()
+	return tuple(boundaries)
+
+
+def _getOffsetsFromBoundaries(boundaries: tuple[int, ...], offset: int) -> tuple[int, int]:
+	"""Gets the offsets of the unit containing an offset from the boundaries of all units.
+	Offsets past the end are considered to be in the last unit.
+	@param boundaries: The boundaries, as returned by L{OffsetsTextInfo._getUnitBoundaries}.
+	@param offset: The offset.
+	@return: The start and end offsets of the unit.
+	"""
+	if len(boundaries) == 1:
+		return (0, 0)
+	index = min(max(bisect_right(boundaries, offset), 1), len(boundaries) - 1)
+	return (boundaries[index - 1], boundaries[index])
+
+
+#: The methods which L{OffsetsTextInfo} uses to get the offsets of units which are based on lines.
+_LINE_UNIT_OFFSETS_METHODS: dict[str, str] = {
+	textInfos.UNIT_LINE: "_getLineOffsets",
+	textInfos.UNIT_PARAGRAPH: "_getParagraphOffsets",
+	textInfos.UNIT_READINGCHUNK: "_getReadingChunkOffsets",
+}
+
+
 class OffsetsTextInfo(textInfos.TextInfo):
 	"""An abstract TextInfo for text implementations which represent ranges using numeric offsets relative to the start of the text.
 	In such implementations, the start of the text is represented by 0 and the end is the length of the entire text.
@@ -631,6 +782,95 @@ def getTextWithFields(self, formatConfig: Optional[Dict] = None) -> textInfos.Te
 	def _get_text(self):
 		return self._getTextRange(self._startOffset, self._endOffset)
 
+	def _usesStoryTextLineOffsets(self, unit: str) -> bool:
+		"""Whether the offsets of a unit are the line offsets which this class finds in the story text,
+		i.e. subclasses don't retrieve them some other way.
+		@param unit: The unit.
+		"""
+		methodName = _LINE_UNIT_OFFSETS_METHODS.get(unit)
+		if methodName is None:
+			return False
+		cls = type(self)
+		return all(
+			getattr(cls, name) is getattr(OffsetsTextInfo, name)
+			for name in ("collapse", "expand", "_getUnitOffsets", "_getLineOffsets", methodName)
+		)
+
+	def _getUnitBoundaries(
+		self,
+		unit: str,
+		start: int = 0,
+		end: int | None = None,
+	) -> tuple[int, ...] | None:
+		"""Gets the offsets of all the boundaries of a unit over a range in one call,
+		rather than finding the unit containing each offset in turn.
+		The story text is searched once and the boundaries are cached until it changes.
+		This is only supported for units based on lines whose offsets this class finds in the story text.
+		@param unit: The unit.
+		@param start: The start of the range.
+		@param end: The end of the range (exclusive), C{None} for the end of the story.
+		@return: The start of the unit containing the start of the range,
+			the boundaries in the range and the end of the unit containing the end of the range,
+			or C{None} if the boundaries can't be found in one call.
+		"""
+		if not self._usesStoryTextLineOffsets(unit):
+			return None
+		if self.encoding == textUtils.WCHAR_ENCODING:
+			wideOffsets = True
+		elif (
+			self.encoding is None
+			or self.encoding == "utf_32_le"
+			or self.encoding == textUtils.USER_ANSI_CODE_PAGE
+		):
+			wideOffsets = False
+		else:
+			return None
+		try:
+			boundaries = _getLineBoundaries(self._getStoryText(), wideOffsets)
+		except NotImplementedError:
+			return None
+		if boundaries is None or len(boundaries) == 1 or (start == 0 and end is None):
+			return boundaries
+		lastIndex = len(boundaries) - 1
+		startIndex = min(max(bisect_right(boundaries, start) - 1, 0), lastIndex - 1)
+		endIndex = (
+			lastIndex if end is None else min(max(bisect_left(boundaries, end), startIndex + 1), lastIndex)
+		)
+		return boundaries[startIndex : endIndex + 1]
+
+	def getTextInChunks(self, unit):
+		"""Retrieve the text of this instance in chunks of a given unit.
+		If the unit offsets are found in the story text,
+		the story text is only retrieved once and split into chunks in one pass,
+		rather than being retrieved again for every chunk.
+		@param unit: The unit at which chunks should be split.
+		@return: Chunks of text.
+		@rtype: generator of str
+		"""
+		if not self._usesStoryTextLineOffsets(unit):
+			yield from super().getTextInChunks(unit)
+			return
+		if self._startOffset >= self._endOffset:
+			return
+		try:
+			text = self._getStoryText()
+		except NotImplementedError:
+			yield from super().getTextInChunks(unit)
+			return
+		if self.encoding == textUtils.WCHAR_ENCODING:
+			offsetConverter = textUtils.WideStringOffsetConverter(text)
+			start, end = offsetConverter.encodedToStrOffsets(self._startOffset, self._endOffset)
+		elif (
+			self.encoding is None
+			or self.encoding == "utf_32_le"
+			or self.encoding == textUtils.USER_ANSI_CODE_PAGE
+		):
+			start, end = self._startOffset, self._endOffset
+		else:
+			yield from super().getTextInChunks(unit)
+			return
+		yield from _iterLineChunks(text, start, end)
+
 	def unitIndex(self, unit):
 		if unit == textInfos.UNIT_LINE:
 			return self._lineNumFromOffset(self._startOffset)
@@ -638,6 +878,9 @@ def unitIndex(self, unit):
 			raise NotImplementedError
 
 	def unitCount(self, unit):
+		boundaries = self._getUnitBoundaries(unit)
+		if boundaries is not None:
+			return len(boundaries) - 1
 		if unit == textInfos.UNIT_LINE:
 			return self._getLineCount()
 		else:
@@ -649,6 +892,12 @@ def unitCount(self, unit):
 	Furthermore, review cursor is able to reach the last, empty line in some controls, like Scintilla. (#18348)
 	"""
 
+	minBatchMoveCount: int = 16
+	"""
+	When moving by at least this many units,
+	L{move} finds the boundaries of all units at once if supported, see L{_getUnitBoundaries}.
+	"""
+
 	def move(self, unit, direction, endPoint=None):
 		if direction == 0:
 			return 0
@@ -659,6 +908,15 @@ def move(self, unit, direction, endPoint=None):
 		else:
 			self.collapse()
 			offset = self._startOffset
+		getUnitOffsets = self._getUnitOffsets
+		if abs(direction) >= self.minBatchMoveCount:
+			# Find the boundaries of all units at once, rather than searching from each offset in turn.
+			boundaries = self._getUnitBoundaries(unit)
+			if boundaries is not None:
+
+				def getUnitOffsets(unit: str, offset: int) -> tuple[int, int]:
+					return _getOffsetsFromBoundaries(boundaries, offset)
+
 		lastOffset = None
 		count = 0
 		lowLimit = 0
@@ -680,7 +938,7 @@ def move(self, unit, direction, endPoint=None):
 			lastOffset = offset
 			if direction < 0 and offset > lowLimit:
 				offset -= 1
-			newStart, newEnd = self._getUnitOffsets(unit, offset)
+			newStart, newEnd = getUnitOffsets(unit, offset)
 			if direction < 0:
 				offset = newStart
 			elif direction > 0:
@@ -6,7 +6,11 @@
 """Utilities to generate and play tones"""
 
 import atexit
+import math
+import struct
+from array import array
 from ctypes import create_string_buffer
+from functools import lru_cache
 
 import config
 import extensionPoints
@@ -14,6 +18,10 @@
 from logHandler import log
 
 SAMPLE_RATE = 44100
+#: The amplitude of a tone at full volume, as used by the native beep generator.
+_AMPLITUDE = 14000
+#: The sample rate which the native beep generator always uses.
+_NATIVE_SAMPLE_RATE = 44100
 
 player = None
 
@@ -53,6 +61,61 @@ def terminate():
 """
 
 
+def _toFloat32(value: float) -> float:
+	"""Rounds a value to single precision, as when passed to native code as a C{float}."""
+	return struct.unpack("f", struct.pack("f", value))[0]
+
+
+def _generateBeep(hz: float, length: int, left: int, right: int, sampleRate: int) -> bytes:
+	"""Generates a tone in Python, with the same output as C{generateBeep} in nvdaHelperLocal.
+	The tone is 16 bit stereo, lasting a whole number of cycles.
+	@param hz: pitch in hz of the tone
+	@param length: length of the tone in ms, before rounding up to a whole number of cycles
+	@param left: volume of the left channel (0 to 100)
+	@param right: volume of the right channel (0 to 100)
+	@param sampleRate: the number of samples per second
+	@return: The interleaved samples.
+	"""
+	# The native generator divides in single precision.
+	hz = _toFloat32(hz)
+	samplesPerCycleExact = _toFloat32(sampleRate / hz)
+	samplesPerCycle = int(samplesPerCycleExact)
+	totalSamples = int((length / 1000.0) / (1.0 / sampleRate))
+	totalSamples += samplesPerCycle - (totalSamples % samplesPerCycle)
+	sinFreq = (2.0 * math.pi) / samplesPerCycleExact
+	sin = math.sin
+	# The phase restarts every second.
+	samples = [
+		min(max(sin(sampleNum * sinFreq) * 2.0, -1.0), 1.0)
+		for sampleNum in range(min(totalSamples, sampleRate))
+	]
+	if totalSamples > sampleRate:
+		samples = (samples * (totalSamples // sampleRate + 1))[:totalSamples]
+	buf = array("h", bytes(totalSamples * 4))
+	for channelStart, volume in ((0, left), (1, right)):
+		pan = (volume / 100.0) * _AMPLITUDE
+		# int truncates towards 0, like a cast to short.
+		buf[channelStart::2] = array("h", [int(sample * pan) for sample in samples])
+	return buf.tobytes()
+
+
+@lru_cache(maxsize=64)
+def _getBeepBuffer(hz: float, length: int, left: int, right: int, sampleRate: int) -> bytes:
+	"""Gets the samples of a tone, caching them as the same tones are often played repeatedly,
+	e.g. for progress bar updates.
+	The native generator in nvdaHelperLocal is used if it is loaded, otherwise the tone is generated in Python.
+	See L{_generateBeep} for the parameters.
+	"""
+	from NVDAHelper import generateBeep
+
+	if generateBeep is None or sampleRate != _NATIVE_SAMPLE_RATE:
+		return _generateBeep(hz, length, left, right, sampleRate)
+	bufSize = generateBeep(None, hz, length, left, right)
+	buf = create_string_buffer(bufSize)
+	generateBeep(buf, hz, length, left, right)
+	return buf.raw
+
+
 def beep(
 	hz: float,
 	length: int,
@@ -81,10 +144,6 @@ def beep(
 		return
 	if not player:
 		return
-	from NVDAHelper import generateBeep
-
-	bufSize = generateBeep(None, hz, length, left, right)
-	buf = create_string_buffer(bufSize)
-	generateBeep(buf, hz, length, left, right)
+	buf = _getBeepBuffer(float(hz), int(length), int(left), int(right), SAMPLE_RATE)
 	player.stop()
-	player.feed(buf.raw)
+	player.feed(buf)
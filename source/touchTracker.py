@@ -6,6 +6,7 @@
 import threading
 import time
 from collections import OrderedDict
+from operator import itemgetter
 
 # Possible actions (single trackers)
 action_tap = "tap"
@@ -240,6 +241,11 @@ class TrackerManager(object):
 	def __init__(self):
 		self.singleTouchTrackersByID = OrderedDict()
 		self.multiTouchTrackers: list[MultiTouchTracker] = []
+		# Trackers can only be merged with queued trackers for the same action, or a hold with a queued tap.
+		# So that only these are compared when queuing a tracker,
+		# queued trackers are also indexed by action, along with the order in which they were queued.
+		self._queuedTrackersByAction: dict[str, list[tuple[int, MultiTouchTracker]]] = {}
+		self._queuedTrackerCount = 0
 		self.curHoverStack = []
 		self.numUnknownTrackers = 0
 		self._lock = threading.Lock()
@@ -354,10 +360,11 @@ def makeMergedTrackerIfPossible(self, oldTracker, newTracker):
 			mergedTracker.childTrackers = childTrackers
 		elif (
 			self.numUnknownTrackers == 0
+			and newTracker.action == oldTracker.action
 			and newTracker.pluralTimeout is not None
+			and oldTracker.pluralTimeout is not None
 			and newTracker.startTime >= oldTracker.endTime
 			and newTracker.startTime < oldTracker.pluralTimeout
-			and newTracker.action == oldTracker.action
 			and oldTracker.numFingers == newTracker.numFingers
 		):
 			# The new and old action are   the same and allow pluralising and have the same number of fingers and there are no other unknown trackers left and they do not overlap in time
@@ -404,20 +411,40 @@ def makeMergedTrackerIfPossible(self, oldTracker, newTracker):
 
 	def processAndQueueMultiTouchTracker(self, tracker):
 		"""Queues the given tracker, replacing old trackers with a multiFingered plural action where possible"""
-		# Reverse iterate through the existing queued trackers comparing the given tracker to each of them
+		# Reverse iterate through the existing queued trackers which could be merged with the given tracker,
+		# comparing the given tracker to each of them.
 		# as L{emitTrackers} constantly dequeues, the queue only contains trackers newer than multiTouchTimeout, though may contain more if there are still unknown singleTouchTrackers around.
-		for index in range(len(self.multiTouchTrackers)):
-			index = len(self.multiTouchTrackers) - 1 - index
-			delayedTracker = self.multiTouchTrackers[index]
+		candidates = self._queuedTrackersByAction.get(tracker.action, [])
+		if tracker.action == action_hold:
+			# A tap followed by a hold is a tapAndHold.
+			candidates = sorted(
+				candidates + self._queuedTrackersByAction.get(action_tap, []),
+				key=itemgetter(0),
+			)
+		for _queueIndex, delayedTracker in reversed(candidates):
 			mergedTracker = self.makeMergedTrackerIfPossible(delayedTracker, tracker)
 			if mergedTracker:
 				# The trackers were successfully merged
 				# remove the old one from the queue, and queue the merged one for possible further matching
-				del self.multiTouchTrackers[index]
+				self._dequeueTracker(delayedTracker)
 				self.processAndQueueMultiTouchTracker(mergedTracker)
 				return
-		else:
-			self.multiTouchTrackers.append(tracker)
+		self._queuedTrackerCount += 1
+		self.multiTouchTrackers.append(tracker)
+		self._queuedTrackersByAction.setdefault(tracker.action, []).append(
+			(self._queuedTrackerCount, tracker),
+		)
+
+	def _dequeueTracker(self, tracker: MultiTouchTracker):
+		"""Removes a tracker from the queue of trackers waiting to be emitted."""
+		self.multiTouchTrackers.remove(tracker)
+		queued = self._queuedTrackersByAction[tracker.action]
+		for index, (_queueIndex, queuedTracker) in enumerate(queued):
+			if queuedTracker is tracker:
+				del queued[index]
+				break
+		if not queued:
+			del self._queuedTrackersByAction[tracker.action]
 
 	pendingEmitInterval: float | None = None
 	"""If set: how long to wait before calling emitTrackers again as trackers are still in the queue"""
@@ -452,7 +479,7 @@ def emitTrackers(self):
 					# All trackers can be emitted with no delay except for tap which must wait for the timeout (to detect plural taps)
 					trackerTimeout = tracker.pluralTimeout - t if tracker.pluralTimeout is not None else 0
 					if trackerTimeout <= 0:
-						self.multiTouchTrackers.remove(tracker)
+						self._dequeueTracker(tracker)
 						# isolated holds should not be emitted as they are covered by hover downs later
 						if tracker.action == action_hold:
 							continue
@@ -0,0 +1,39 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Micro-benchmarks for performance sensitive code paths.
+Benchmark modules have a C{bench_} prefix, so they are not collected with the unit tests.
+Run them with:
+C{rununittests.bat -p "bench_*.py"}
+Results are written to the console, bypassing the buffering of test output.
+"""
+
+import sys
+import time
+import unittest
+from collections.abc import Callable
+
+
+class BenchmarkTestCase(unittest.TestCase):
+	"""Base class for benchmarks."""
+
+	def timeIt(self, label: str, func: Callable[[], object], number: int) -> float:
+		"""Call a function a number of times and report how long it took.
+		@param label: Describes what is measured in the report.
+		@param func: The function to call.
+		@param number: How many times to call the function.
+		@return: The number of calls per second.
+		"""
+		start = time.perf_counter()
+		for _ in range(number):
+			func()
+		elapsed = time.perf_counter() - start
+		rate = number / elapsed if elapsed else float("inf")
+		self.report(f"{label}: {number} calls in {elapsed:.4f}s ({rate:,.0f} calls/s)")
+		return rate
+
+	def report(self, message: str) -> None:
+		sys.__stdout__.write(f"{self.id()}: {message}\n")
+		sys.__stdout__.flush()
@@ -0,0 +1,80 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Benchmarks for enumerating installed add-ons."""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import addonHandler
+from . import BenchmarkTestCase
+
+
+class BenchAddonEnumeration(BenchmarkTestCase):
+	"""Times loading the manifests of 100 synthetic add-ons, serially and in parallel."""
+
+	NUMBER_OF_ADDONS = 100
+	NUMBER = 10
+
+	def setUp(self):
+		self._tempDir = tempfile.TemporaryDirectory()
+		self.addonPaths = []
+		for i in range(self.NUMBER_OF_ADDONS):
+			addonPath = os.path.join(self._tempDir.name, f"addon{i:03}")
+			os.makedirs(os.path.join(addonPath, "locale", "fr"))
+			with open(os.path.join(addonPath, addonHandler.MANIFEST_FILENAME), "w", encoding="utf-8") as f:
+				f.write(
+					f"name = addon{i:03}\n"
+					"summary = Synthetic add-on\n"
+					'description = """A synthetic add-on used to benchmark add-on enumeration."""\n'
+					"author = NV Access\n"
+					"version = 1.0.0\n"
+					"minimumNVDAVersion = 2023.1\n"
+					"lastTestedNVDAVersion = 2024.1\n",
+				)
+			with open(
+				os.path.join(addonPath, "locale", "fr", addonHandler.MANIFEST_FILENAME),
+				"w",
+				encoding="utf-8",
+			) as f:
+				f.write("summary = Module synthétique\n")
+			self.addonPaths.append(addonPath)
+		self._index = addonHandler._AddonManifestIndex()
+		indexPatcher = patch.object(addonHandler, "_manifestIndex", self._index)
+		indexPatcher.start()
+		self.addCleanup(indexPatcher.stop)
+		languagePatcher = patch("languageHandler.getLanguage", return_value="fr")
+		languagePatcher.start()
+		self.addCleanup(languagePatcher.stop)
+
+	def tearDown(self):
+		self._tempDir.cleanup()
+
+	def _loadSerially(self):
+		self._index.clear()
+		for addonPath in self.addonPaths:
+			addonHandler._loadAddon(addonPath)
+
+	def _loadInParallel(self):
+		self._index.clear()
+		addonHandler._loadAddons(self.addonPaths)
+
+	def _loadIndexed(self):
+		addonHandler._loadAddons(self.addonPaths)
+
+	def test_serial(self):
+		self.timeIt(f"Load {self.NUMBER_OF_ADDONS} add-ons serially", self._loadSerially, self.NUMBER)
+
+	def test_parallel(self):
+		self.timeIt(f"Load {self.NUMBER_OF_ADDONS} add-ons in parallel", self._loadInParallel, self.NUMBER)
+
+	def test_parallelIndexed(self):
+		self._loadInParallel()
+		self.timeIt(
+			f"Load {self.NUMBER_OF_ADDONS} indexed add-ons in parallel",
+			self._loadIndexed,
+			self.NUMBER,
+		)
@@ -0,0 +1,106 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Benchmarks for braille display drivers talking to simulated displays.
+Baum packets are escaped, whereas Handy Tech extended packets have a length and a terminator.
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from statistics import mean
+from unittest.mock import patch
+
+import wx
+from brailleDisplayDrivers import baum, handyTech
+from ..brailleDisplaySimulator import (
+	SimulatedBaumDevice,
+	SimulatedDisplayTestMixin,
+	SimulatedHandyTechDevice,
+)
+from . import BenchmarkTestCase
+
+
+class _BenchSimulatedDisplay(SimulatedDisplayTestMixin):
+	"""Times a driver handling key presses and writing cells, on a simulated serial connection."""
+
+	KEY_PRESS_COUNT = 1000
+	WRITE_COUNT = 1000
+
+	def _reportLatencies(self, label: str, latencies: list[float]):
+		self.report(f"{label}: mean {mean(latencies) * 1e6:.1f}us, max {max(latencies) * 1e6:.1f}us")
+
+	def test_keyPressToGesture(self):
+		device = self.device
+		stream = self.makeKeyPress()
+		with self.connect():
+			latencies = []
+			for _press in range(self.KEY_PRESS_COUNT):
+				start = time.perf_counter()
+				device.send(stream)
+				latencies.append(self.recorder.gestures[-1][0] - start)
+			self.assertEqual(len(self.recorder.gestures), self.KEY_PRESS_COUNT)
+			self._reportLatencies("key packet to executeGesture", latencies)
+			self.timeIt(
+				f"{self.KEY_PRESS_COUNT} key presses in 1 byte reads",
+				lambda: device.replay(stream * self.KEY_PRESS_COUNT),
+				1,
+			)
+
+	def test_writeCellsToWire(self):
+		device = self.device
+		frames = [[(index + frame) % 256 for index in range(self.numCells)] for frame in range(2)]
+		with self.connectWriter() as writeCells:
+			latencies = []
+			bytesWritten = device.bytesWritten
+			for write in range(self.WRITE_COUNT):
+				start = time.perf_counter()
+				writeCells(frames[write % 2])
+				latencies.append(device.writes[-1][0] - start)
+			self._reportLatencies("cells to bytes on wire", latencies)
+			self.report(f"{(device.bytesWritten - bytesWritten) / self.WRITE_COUNT:.1f} bytes per write")
+
+			def writeFrames():
+				for write in range(self.WRITE_COUNT):
+					writeCells(frames[write % 2])
+
+			rate = self.timeIt(f"{self.WRITE_COUNT} writes of {self.numCells} cells", writeFrames, 5)
+			self.report(f"{rate * self.WRITE_COUNT:,.0f} writes/s")
+
+
+class BenchBaum(_BenchSimulatedDisplay, BenchmarkTestCase):
+	"""Writes cells through the braille handler, which skips identical writes."""
+
+	driverClass = baum.BrailleDisplayDriver
+	numCells = 80
+
+	def makeDevice(self) -> SimulatedBaumDevice:
+		return SimulatedBaumDevice(numCells=self.numCells, deviceId="VarioConnect 80")
+
+	def makeKeyPress(self) -> bytes:
+		return self.device.keyPressAndRelease(self.device.DISPLAY_KEYS, b"\x01")
+
+
+class BenchHandyTech(_BenchSimulatedDisplay, BenchmarkTestCase):
+	"""Handy Tech displays acknowledge braille packets, which the simulated display doesn't,
+	so cells are written to the driver directly rather than through the braille handler.
+	"""
+
+	driverClass = handyTech.BrailleDisplayDriver
+
+	def makeDevice(self) -> SimulatedHandyTechDevice:
+		return SimulatedHandyTechDevice(numCells=self.numCells)
+
+	def makeKeyPress(self) -> bytes:
+		return self.device.keyPressAndRelease(handyTech.KEY_LEFT)
+
+	def makePatchers(self) -> list:
+		# The driver creates a message window on the main thread, which needs a wx app.
+		return super().makePatchers() + [patch.object(wx, "CallAfter")]
+
+	@contextmanager
+	def connectWriter(self) -> Iterator[Callable[[list[int]], None]]:
+		with self.connect() as driver:
+			yield driver.display
@@ -0,0 +1,64 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Benchmarks for the logHandler module."""
+
+import logging
+import os
+import queue
+import tempfile
+
+import logHandler
+from . import BenchmarkTestCase
+
+
+class BenchLogHandlers(BenchmarkTestCase):
+	"""Compares the cost of a log call for the caller, with synchronous and asynchronous file logging."""
+
+	NUMBER = 20000
+
+	def setUp(self):
+		self._tempDir = tempfile.TemporaryDirectory()
+		self.logger = logHandler.Logger("benchLogger")
+		self.logger.setLevel(logging.DEBUG)
+		self.logger.propagate = False
+		self.formatter = logHandler.Formatter(
+			fmt="{levelname!s} - {codepath!s} ({asctime}) - {threadName} ({thread}):\n{message}",
+			style="{",
+		)
+
+	def tearDown(self):
+		self._tempDir.cleanup()
+
+	def _logSomething(self):
+		self.logger.debug("Speaking %r", ["Hello", "world"])
+
+	def test_fileHandler(self):
+		handler = logHandler.FileHandler(os.path.join(self._tempDir.name, "sync.log"), encoding="utf-8")
+		handler.setFormatter(self.formatter)
+		self.logger.addHandler(handler)
+		try:
+			self.timeIt("FileHandler", self._logSomething, self.NUMBER)
+		finally:
+			self.logger.removeHandler(handler)
+			handler.close()
+
+	def test_queueHandler(self):
+		fileHandler = logHandler._BatchedFileHandler(
+			os.path.join(self._tempDir.name, "async.log"),
+			encoding="utf-8",
+		)
+		fileHandler.setFormatter(self.formatter)
+		listener = logHandler._BatchingQueueListener(queue.Queue(), fileHandler)
+		listener.start()
+		handler = logHandler.QueueHandler(listener.queue)
+		handler.setFormatter(self.formatter)
+		self.logger.addHandler(handler)
+		try:
+			self.timeIt("QueueHandler", self._logSomething, self.NUMBER)
+		finally:
+			self.logger.removeHandler(handler)
+			listener.stop()
+			fileHandler.close()
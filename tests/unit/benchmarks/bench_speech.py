@@ -0,0 +1,59 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Benchmarks for generating speech for documents."""
+
+from unittest.mock import patch
+
+import config
+import speech
+import textInfos
+from controlTypes import OutputReason
+from speech.speech import _controlFieldSpeechCache, _formatFieldSpeechCache
+from ..textProvider import FieldsTextProvider
+from . import BenchmarkTestCase
+
+
+class BenchFieldSpeech(BenchmarkTestCase):
+	"""Times speaking a synthetic document with many control and format fields,
+	with and without caching the field speech.
+	"""
+
+	PARAGRAPH_COUNT = 400
+	NUMBER = 5
+
+	def setUp(self):
+		self.provider = FieldsTextProvider(self.PARAGRAPH_COUNT)
+		self.formatConfig = dict(config.conf.getSectionSnapshot("documentFormatting"))
+		self.formatConfig.update(
+			reportFontName=True,
+			reportFontSize=True,
+			reportColor=True,
+			reportFontAttributes=True,
+			reportPage=True,
+			reportSpellingErrors=True,
+		)
+		for cache in (_controlFieldSpeechCache, _formatFieldSpeechCache):
+			cache.clear()
+			self.addCleanup(cache.clear)
+
+	def _speakDocument(self):
+		info = self.provider.makeTextInfo(textInfos.POSITION_ALL)
+		for _sequence in speech.getTextInfoSpeech(
+			info,
+			useCache=False,
+			formatConfig=self.formatConfig,
+			reason=OutputReason.SAYALL,
+		):
+			pass
+
+	def test_sayAllDocument(self):
+		with (
+			patch.object(_controlFieldSpeechCache, "maxSize", 0),
+			patch.object(_formatFieldSpeechCache, "maxSize", 0),
+		):
+			uncachedRate = self.timeIt("uncached", self._speakDocument, self.NUMBER)
+		cachedRate = self.timeIt("cached", self._speakDocument, self.NUMBER)
+		self.report(f"speedup: {cachedRate / uncachedRate:.2f}x")
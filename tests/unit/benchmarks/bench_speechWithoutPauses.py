@@ -0,0 +1,103 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Benchmarks for splitting speech at phrase boundaries."""
+
+from random import Random
+
+from speech.commands import CallbackCommand, EndUtteranceCommand, LangChangeCommand
+from speech.speechWithoutPauses import SpeechWithoutPauses
+from speech.types import SpeechSequence
+from . import BenchmarkTestCase
+
+_WORDS = (
+	"the",
+	"house",
+	"stood",
+	"at",
+	"edge",
+	"of",
+	"a",
+	"quiet",
+	"village",
+	"where",
+	"nobody",
+	"ever",
+	"locked",
+	"their",
+	"doors",
+)
+
+
+def _makeNovel(wordCount: int, lineLength: int = 80) -> list[str]:
+	"""Makes the lines of a synthetic novel, with sentences running across lines.
+	@param wordCount: The number of words in the novel.
+	@param lineLength: The maximum number of characters on a line.
+	@return: The lines of the novel.
+	"""
+	random = Random(0)
+	lines = []
+	line = []
+	lineLen = 0
+	sentenceLength = random.randrange(4, 30)
+	for index in range(wordCount):
+		word = random.choice(_WORDS)
+		sentenceLength -= 1
+		if sentenceLength == 0:
+			word += random.choice((".", ".", ",", "?", "!", '."'))
+			sentenceLength = random.randrange(4, 30)
+		if lineLen + len(word) > lineLength:
+			lines.append(" ".join(line) + " ")
+			line = []
+			lineLen = 0
+		line.append(word)
+		lineLen += len(word) + 1
+	lines.append(" ".join(line))
+	return lines
+
+
+class BenchSpeechWithoutPauses(BenchmarkTestCase):
+	"""Times splitting a novel length document into phrases, as say all does."""
+
+	WORD_COUNT = 100_000
+	NUMBER = 5
+
+	def setUp(self):
+		self.lines = _makeNovel(self.WORD_COUNT)
+		callbackCommand = CallbackCommand(name="dummy", callback=None)
+		lang = LangChangeCommand("en")
+		langDefault = LangChangeCommand(None)
+		self.lineSequences: list[SpeechSequence] = [
+			[callbackCommand, lang, line, langDefault] for line in self.lines
+		]
+		self.documentSequence: SpeechSequence = []
+		for index, sequence in enumerate(self.lineSequences):
+			self.documentSequence.extend(sequence)
+			# Break the document into paragraphs.
+			if index % 20 == 19:
+				self.documentSequence.append(EndUtteranceCommand())
+		self.spokenCount = 0
+
+	def _speak(self, sequence: SpeechSequence):
+		self.spokenCount += 1
+
+	def _speakByLine(self):
+		speechWithoutPauses = SpeechWithoutPauses(self._speak)
+		for sequence in self.lineSequences:
+			speechWithoutPauses.speakWithoutPauses(sequence)
+		speechWithoutPauses.speakWithoutPauses(None)
+
+	def _speakDocument(self):
+		speechWithoutPauses = SpeechWithoutPauses(self._speak)
+		speechWithoutPauses.speakWithoutPauses(self.documentSequence)
+		speechWithoutPauses.speakWithoutPauses(None)
+
+	def test_speakNovelByLine(self):
+		rate = self.timeIt(f"{len(self.lines)} lines", self._speakByLine, self.NUMBER)
+		self.report(f"{rate * self.WORD_COUNT:,.0f} words/s")
+
+	def test_speakNovelAsOneSequence(self):
+		rate = self.timeIt(f"{len(self.documentSequence)} items", self._speakDocument, self.NUMBER)
+		self.report(f"{rate * self.WORD_COUNT:,.0f} words/s")
@@ -0,0 +1,156 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Benchmarks for converting speech sequences to SSML, as done by synthesizers for every utterance."""
+
+import speechXml
+from speech.commands import (
+	BreakCommand,
+	CharacterModeCommand,
+	IndexCommand,
+	LangChangeCommand,
+	PitchCommand,
+	VolumeCommand,
+)
+from speech.types import SpeechSequence
+from . import BenchmarkTestCase
+
+WORDS = (
+	"The quick brown fox jumps over the lazy dog.",
+	'NVDA reads the focused <button> & its "name".',
+	"Café crème, naïve façade — déjà vu.",
+	"Press Enter to activate, or Tab to move on.",
+)
+
+
+def makeSpeechSequences() -> list[SpeechSequence]:
+	"""Makes speech sequences like those spoken while reading a document,
+	moving by character and moving focus in a multilingual document.
+	"""
+	sequences = []
+	index = 0
+	for paragraph in range(50):
+		# Say all: sentences separated by indexes.
+		sequence = []
+		for sentence in WORDS:
+			index += 1
+			sequence += [IndexCommand(index), sentence]
+		sequences.append(sequence)
+		# Moving by character, with capital letters at a higher pitch.
+		for char in "NvDa":
+			if char.isupper():
+				sequences.append(
+					[
+						PitchCommand(multiplier=1.3),
+						CharacterModeCommand(True),
+						char,
+						CharacterModeCommand(False),
+					],
+				)
+			else:
+				sequences.append([CharacterModeCommand(True), char, CharacterModeCommand(False)])
+		# Moving focus: text only.
+		sequences.append(["button", "OK", WORDS[paragraph % len(WORDS)]])
+		# Language changes and emphasis.
+		sequences.append(
+			[
+				LangChangeCommand("de_DE"),
+				"Guten Tag",
+				BreakCommand(100),
+				LangChangeCommand(None),
+				VolumeCommand(multiplier=0.8),
+				"Good day",
+				VolumeCommand(),
+				"again",
+			],
+		)
+	return sequences
+
+
+def _referenceEscapeXml(text: str) -> str:
+	text = text.translate(speechXml.XML_ESCAPES)
+	return speechXml.RE_INVALID_XML_CHARS.sub(speechXml.REPLACEMENT_CHAR, text)
+
+
+class _ListOutput(list):
+	"""Output built as a list of strings, as the balancer did before it wrote to a L{io.StringIO}."""
+
+	write = list.append
+
+	def getvalue(self) -> str:
+		return "".join(self)
+
+
+class _ReferenceXmlBalancer(speechXml.XmlBalancer):
+	"""The balancer as it was before tags were cached, which formats and escapes every tag and text."""
+
+	def __init__(self):
+		super().__init__()
+		self._out = _ListOutput()
+
+	def _text(self, text):
+		tag, attrs = self._tagEnclosingText
+		if tag:
+			self._openTag(tag, attrs)
+		self._out.append(_referenceEscapeXml(text))
+		if tag:
+			self._closeTag(tag)
+
+	def _openTag(self, tag, attrs, empty=False):
+		self._out.append("<%s" % tag)
+		for attr, val in attrs.items():
+			self._out.append(' %s="' % attr)
+			self._out.append(_referenceEscapeXml(str(val)))
+			self._out.append('"')
+		self._out.append("/>" if empty else ">")
+
+	_openCachedTag = _openTag
+
+	def reset(self):
+		# A new balancer was created for every utterance, so there is nothing to reset.
+		pass
+
+
+def referenceConvertToXml(converter: speechXml.SpeechXmlConverter, speechSequence: SpeechSequence) -> str:
+	"""Converts a speech sequence as done before converters were reused, with a new balancer every time."""
+	return _ReferenceXmlBalancer().generateXml(converter.generateBalancerCommands(speechSequence))
+
+
+class BenchSsmlConverter(BenchmarkTestCase):
+	"""Times converting speech sequences to SSML with a new balancer per utterance and with a reused converter."""
+
+	NUMBER = 20
+
+	def setUp(self):
+		self.sequences = makeSpeechSequences()
+
+	def test_convertToXml(self):
+		converter = speechXml.SsmlConverter("en_US")
+		reference = [referenceConvertToXml(converter, sequence) for sequence in self.sequences]
+		self.assertEqual([converter.convertToXml(sequence) for sequence in self.sequences], reference)
+
+		def convertReference():
+			# Converters used to be created for every utterance.
+			for sequence in self.sequences:
+				referenceConvertToXml(speechXml.SsmlConverter("en_US"), sequence)
+
+		def convert():
+			for sequence in self.sequences:
+				converter.convertToXml(sequence)
+
+		label = f"{len(self.sequences)} utterances"
+		referenceRate = self.timeIt(f"{label}, new balancer per utterance", convertReference, self.NUMBER)
+		rate = self.timeIt(f"{label}, reused converter", convert, self.NUMBER)
+		self.report(f"speedup: {rate / referenceRate:.2f}x")
+
+	def test_convertFromXml(self):
+		converter = speechXml.SsmlConverter("en_US")
+		ssml = [converter.convertToXml(sequence) for sequence in self.sequences]
+
+		def parse():
+			for xml in ssml:
+				speechXml.SsmlParser().convertFromXml(xml)
+
+		self.timeIt(f"parsing {len(ssml)} utterances", parse, self.NUMBER)
@@ -0,0 +1,78 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Benchmarks for finding units in text."""
+
+import unicodedata
+
+from textInfos.offsets import findEndOfWord, findStartOfWord
+from . import BenchmarkTestCase
+
+
+def _findStartOfWordByCategory(text: str, offset: int) -> int:
+	"""Finds the start of a word looking up the category of each character, for comparison."""
+	if offset >= len(text):
+		return offset
+	while offset > 0 and text[offset].isspace():
+		offset -= 1
+	if unicodedata.category(text[offset])[0] not in "LMN":
+		return offset
+	while offset > 0 and unicodedata.category(text[offset - 1])[0] in "LMN":
+		offset -= 1
+	return offset
+
+
+def _findEndOfWordByCategory(text: str, offset: int) -> int:
+	"""Finds the end of a word looking up the category of each character, for comparison."""
+	if offset >= len(text):
+		return offset + 1
+	if unicodedata.category(text[offset])[0] in "LMN":
+		while offset < len(text) and unicodedata.category(text[offset])[0] in "LMN":
+			offset += 1
+	elif unicodedata.category(text[offset])[0] not in "LMNZ":
+		offset += 1
+	while offset < len(text) and text[offset].isspace():
+		offset += 1
+	return offset
+
+
+class BenchWordOffsets(BenchmarkTestCase):
+	"""Times finding the word around offsets in long lines which are a single word."""
+
+	LINE_LENGTH = 4000
+	NUMBER = 200
+
+	lines = {
+		"base64": ("QUJDRGVmZ2hpams0NTY3ODkw" * LINE_LENGTH)[:LINE_LENGTH],
+		"CJK": ("漢字仮名交じり文" * LINE_LENGTH)[:LINE_LENGTH],
+		"astral": ("𝒜𝒞𝒟" * LINE_LENGTH)[:LINE_LENGTH],
+	}
+
+	def _timeWordOffsets(self, findStart, findEnd, label: str):
+		rates = []
+		for name, line in self.lines.items():
+			offsets = range(0, len(line), len(line) // 8)
+
+			def findWords():
+				for offset in offsets:
+					findStart(line, offset)
+					findEnd(line, offset)
+
+			rates.append(self.timeIt(f"{label} {name}", findWords, self.NUMBER))
+		return rates
+
+	def test_longSingleWordLines(self):
+		for name, line in self.lines.items():
+			for offset in (0, len(line) // 2, len(line) - 1):
+				self.assertEqual(
+					findStartOfWord(line, offset), _findStartOfWordByCategory(line, offset), name
+				)
+				self.assertEqual(findEndOfWord(line, offset), _findEndOfWordByCategory(line, offset), name)
+		categoryRates = self._timeWordOffsets(
+			_findStartOfWordByCategory, _findEndOfWordByCategory, "category"
+		)
+		tableRates = self._timeWordOffsets(findStartOfWord, findEndOfWord, "table")
+		for name, categoryRate, tableRate in zip(self.lines, categoryRates, tableRates):
+			self.report(f"{name} speedup: {tableRate / categoryRate:.1f}x")
@@ -0,0 +1,48 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Benchmarks for generating tones."""
+
+import tones
+from ..test_tones import _nativeBeep
+from . import BenchmarkTestCase
+
+
+class BenchBeep(BenchmarkTestCase):
+	"""Times generating the beeps of a progress bar going from 0 to 100 percent, ten times."""
+
+	NUMBER = 10
+	#: The pitches of progress bar beeps, as reported for each percentage.
+	PITCHES = [110 * 2 ** (percentage / 25.0) for percentage in range(101)]
+	LENGTH = 40
+
+	def _beepProgressBar(self, generate):
+		for hz in self.PITCHES:
+			generate(hz, self.LENGTH, 50, 50)
+
+	def test_progressBarBeeps(self):
+		pythonRate = self.timeIt(
+			"Python",
+			lambda: self._beepProgressBar(
+				lambda *args: tones._generateBeep(*args, tones.SAMPLE_RATE),
+			),
+			self.NUMBER,
+		)
+		tones._getBeepBuffer.cache_clear()
+		self.addCleanup(tones._getBeepBuffer.cache_clear)
+		cachedRate = self.timeIt(
+			"cached",
+			lambda: self._beepProgressBar(
+				lambda *args: tones._getBeepBuffer(*args, tones.SAMPLE_RATE),
+			),
+			self.NUMBER,
+		)
+		self.report(f"cached speedup over Python: {cachedRate / pythonRate:.1f}x")
+		try:
+			nativeRate = self.timeIt("native", lambda: self._beepProgressBar(_nativeBeep), self.NUMBER)
+		except AttributeError:
+			self.report("nvdaHelperLocal isn't loaded")
+		else:
+			self.report(f"cached speedup over native: {cachedRate / nativeRate:.1f}x")
@@ -0,0 +1,38 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Benchmarks for merging touches into gestures, replaying recorded touch sessions."""
+
+import hashlib
+
+from ..touchReplay import TouchEvent, flickStorm, randomSession, replay
+from . import BenchmarkTestCase
+
+
+class BenchTrackerManager(BenchmarkTestCase):
+	"""Times replaying touch sessions through a tracker manager,
+	checking that the gestures emitted are those which were recorded when the session was first replayed.
+	"""
+
+	#: The number of gestures emitted for each session, and the SHA-256 digest of their descriptions.
+	#: The "storm" digest was recorded before trackers were indexed by action.
+	#: Replaying the "random" session used to raise a C{TypeError} when a tap followed a queued flick,
+	#: so its digest was recorded with the fix which compares actions before plural timeouts.
+	EXPECTED = {
+		"random": (32885, "3e9981952365181f16a34488ebb2b600f3354920ac961791c068e1312022c249"),
+		"storm": (664, "2d37dd776f6555dc29d3b6cfc762ee3daf8f9caa5f9011a7e20c1dc48ba45175"),
+	}
+
+	def _replay(self, name: str, events: list[TouchEvent]):
+		gestures = replay(events)
+		digest = hashlib.sha256("\n".join(gestures).encode()).hexdigest()
+		self.assertEqual((len(gestures), digest), self.EXPECTED[name])
+		self.timeIt(f"{name}: {len(events)} touch events", lambda: replay(events), 3)
+
+	def test_randomSession(self):
+		self._replay("random", randomSession(5, 2000, maxFingers=10))
+
+	def test_flickStorm(self):
+		self._replay("storm", flickStorm(1, 3000))
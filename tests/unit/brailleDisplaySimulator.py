@@ -0,0 +1,339 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Simulated braille displays for testing braille display drivers without hardware.
+A L{SimulatedDevice} is connected to a driver through L{FakeIo}, an in-memory replacement for L{hwIo.IoBase}.
+The device replays recorded byte streams to the driver and records the bytes the driver writes to it.
+See L{connectDriver}, or L{SimulatedDisplayTestMixin} for test cases.
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from typing import Type
+from unittest.mock import patch
+
+import bdDetect
+import braille
+import hwIo
+import inputCore
+
+
+class SimulatedDevice:
+	"""A braille display at the other end of a L{FakeIo}.
+	Subclasses respond to requests from the driver by overriding L{handleWrite}.
+	"""
+
+	#: The connection to the driver, set once the driver opened it.
+	io: "FakeIo | None" = None
+
+	def __init__(self):
+		#: The bytes the driver wrote, with the time at which each write was made.
+		self.writes: list[tuple[float, bytes]] = []
+		self.bytesWritten = 0
+		#: Chunks of a replayed stream which haven't been sent yet.
+		self._chunks: deque[bytes] = deque()
+
+	def handleWrite(self, data: bytes):
+		"""Called when the driver writes to the device.
+		The base implementation does nothing.
+		@param data: The bytes written.
+		"""
+
+	def send(self, data: bytes):
+		"""Sends bytes to the driver.
+		@param data: The bytes, which may contain any number of whole or partial packets.
+		"""
+		self.io.receive(data)
+
+	def replay(self, stream: bytes, chunkSize: int | None = None):
+		"""Sends a recorded byte stream to the driver.
+		@param stream: The bytes recorded from the device.
+		@param chunkSize: If provided, the stream is sent in chunks of this size,
+			as they would be received from a slow connection.
+		"""
+		if chunkSize is None:
+			self.send(stream)
+			return
+		self._chunks.extend(stream[start : start + chunkSize] for start in range(0, len(stream), chunkSize))
+		while self._chunks:
+			self.send(self._chunks.popleft())
+
+
+class FakeIo(hwIo.IoBase):
+	"""An in-memory connection between a driver and a L{SimulatedDevice}.
+	This doesn't use any Windows API, nor the I/O thread.
+	Received bytes are passed to C{onReceive} on the thread which sent them,
+	in chunks of C{onReceiveSize} bytes for serial connections, or one packet at a time for HID.
+	The rest of a packet can be read synchronously with L{read}, as with L{hwIo.Serial}.
+	"""
+
+	def __init__(
+		self,
+		device: SimulatedDevice,
+		onReceive: Callable[[bytes], None],
+		onReceiveSize: int = 1,
+		isHid: bool = False,
+	):
+		# IoBase.__init__ opens Windows handles, so it is deliberately not called.
+		self._device = device
+		self._onReceive = onReceive
+		self._readSize = onReceiveSize
+		self._isHid = isHid
+		self._pending = bytearray()
+		self._received = False
+		self.isClosed = False
+		device.io = self
+
+	def receive(self, data: bytes):
+		"""Called by the device to send bytes to the driver."""
+		if self.isClosed:
+			return
+		self._received = True
+		if self._isHid:
+			self._notifyReceive(bytes(data))
+			return
+		self._pending += data
+		while self._pending and self._onReceive:
+			chunk = bytes(self._pending[: self._readSize])
+			del self._pending[: self._readSize]
+			self._notifyReceive(chunk)
+
+	def read(self, size: int = 1) -> bytes:
+		# As a real read waits for more bytes to arrive, receive the next chunks of a replayed stream.
+		chunks = self._device._chunks
+		while len(self._pending) < size and chunks:
+			self._pending += chunks.popleft()
+		data = bytes(self._pending[:size])
+		del self._pending[:size]
+		return data
+
+	def write(self, data: bytes):
+		if not isinstance(data, bytes):
+			raise TypeError("Expected argument 'data' to be of type 'bytes'")
+		device = self._device
+		device.writes.append((time.perf_counter(), data))
+		device.bytesWritten += len(data)
+		device.handleWrite(data)
+
+	def waitForRead(self, timeout: int | float) -> bool:
+		# Bytes are received synchronously, so there is nothing to wait for.
+		received = self._received
+		self._received = False
+		return received
+
+	def close(self):
+		self._onReceive = None
+		self.isClosed = True
+
+
+def _escapeBaum(data: bytes) -> bytes:
+	return data.replace(b"\x1b", b"\x1b\x1b")
+
+
+class SimulatedBaumDevice(SimulatedDevice):
+	"""A Baum display connected via serial, which answers requests to turn its protocol on."""
+
+	PROTOCOL_ONOFF = 0x15
+	CELL_COUNT = 0x01
+	DEVICE_ID = 0x84
+	DISPLAY_KEYS = 0x24
+	ROUTING_KEY = 0x27
+	BRAILLE_KEYS = 0x33
+
+	def __init__(self, numCells: int = 40, deviceId: str = "VarioConnect 40"):
+		super().__init__()
+		self.numCells = numCells
+		self.deviceId = deviceId
+
+	@classmethod
+	def packet(cls, command: int, arg: bytes) -> bytes:
+		"""Builds a packet as sent by the display.
+		@param command: The type of the packet.
+		@param arg: The unescaped argument.
+		"""
+		return b"\x1b" + _escapeBaum(bytes([command]) + arg)
+
+	def handleWrite(self, data: bytes):
+		if data == b"\x1b" + bytes([self.PROTOCOL_ONOFF, 1]):
+			self.send(
+				self.packet(self.CELL_COUNT, bytes([self.numCells]))
+				+ self.packet(self.DEVICE_ID, self.deviceId.encode("latin-1").ljust(16)),
+			)
+
+	def keyPressAndRelease(self, command: int, keys: bytes) -> bytes:
+		"""Builds the packets the display sends when keys are pressed together and released.
+		@param command: The key group.
+		@param keys: The argument of the key group, with the bits of the pressed keys set.
+		"""
+		return self.packet(command, keys) + self.packet(command, bytes(len(keys)))
+
+	def routingPressAndRelease(self, index: int) -> bytes:
+		"""Builds the packets the display sends when a routing key is pressed and released.
+		@param index: The 0 based index of the routing key.
+		"""
+		return self.packet(self.ROUTING_KEY, bytes([index + 1])) + self.packet(self.ROUTING_KEY, b"\x00")
+
+
+class SimulatedHandyTechDevice(SimulatedDevice):
+	"""A Handy Tech display connected via serial, which answers the reset and protocol properties requests.
+	Unlike Baum packets, extended packets have a length byte and a terminator, and nothing is escaped.
+	Braille packets aren't acknowledged.
+	"""
+
+	PKT_OK = 0xFE
+	PKT_RESET = 0xFF
+	PKT_EXTENDED = 0x79
+	EXTPKT_BRAILLE = 0x01
+	EXTPKT_KEY = 0x04
+	EXTPKT_GET_PROTOCOL_PROPERTIES = 0xC1
+	TERMINATOR = 0x16
+	KEY_RELEASE_MASK = 0x80
+
+	def __init__(self, numCells: int = 40, modelId: int = 0x84):
+		"""
+		@param numCells: The number of cells reported in the protocol properties.
+		@param modelId: The model identifier, a Basic Braille 40 by default.
+		"""
+		super().__init__()
+		self.numCells = numCells
+		self.modelId = modelId
+
+	def extendedPacket(self, packetType: int, data: bytes) -> bytes:
+		"""Builds an extended packet as sent by the display.
+		@param packetType: The type of the extended packet.
+		@param data: The data following the type.
+		"""
+		return bytes(
+			[self.PKT_EXTENDED, self.modelId, len(data) + 1, packetType, *data, self.TERMINATOR],
+		)
+
+	def handleWrite(self, data: bytes):
+		if data == bytes([self.PKT_RESET]):
+			self.send(bytes([self.PKT_OK, self.modelId]))
+		elif data == self.extendedPacket(self.EXTPKT_GET_PROTOCOL_PROPERTIES, b""):
+			self.send(self.extendedPacket(self.EXTPKT_GET_PROTOCOL_PROPERTIES, bytes([0, 0, self.numCells])))
+
+	def keyPressAndRelease(self, key: int) -> bytes:
+		"""Builds the packets the display sends when a key is pressed and released.
+		@param key: The key code.
+		"""
+		return self.extendedPacket(self.EXTPKT_KEY, bytes([key])) + self.extendedPacket(
+			self.EXTPKT_KEY,
+			bytes([key | self.KEY_RELEASE_MASK]),
+		)
+
+
+class GestureRecorder:
+	"""Replaces L{inputCore.manager}, recording the gestures executed by drivers and when they were executed."""
+
+	def __init__(self):
+		self.gestures: list[tuple[float, inputCore.InputGesture]] = []
+
+	def executeGesture(self, gesture: inputCore.InputGesture):
+		self.gestures.append((time.perf_counter(), gesture))
+
+
+@contextmanager
+def connectDriver(
+	driverClass: Type[braille.BrailleDisplayDriver],
+	device: SimulatedDevice,
+	protocolType: bdDetect.ProtocolType = bdDetect.ProtocolType.SERIAL,
+) -> Iterator[braille.BrailleDisplayDriver]:
+	"""Creates a driver connected to a simulated device, terminating it on exit.
+	@param driverClass: The class of the driver to create.
+	@param device: The device to connect the driver to.
+	@param protocolType: How the device is connected.
+	@return: The driver, whose constructor already talked to the device.
+	"""
+	isHid = protocolType == bdDetect.ProtocolType.HID
+
+	def openIo(*args, onReceive: Callable[[bytes], None], **kwargs) -> FakeIo:
+		return FakeIo(device, onReceive, onReceiveSize=1, isHid=isHid)
+
+	with ExitStack() as stack:
+		stack.enter_context(patch.object(hwIo, "Serial", openIo))
+		stack.enter_context(patch.object(hwIo, "Hid", openIo))
+		port = bdDetect.DeviceMatch(protocolType, "simulated", "COM1", {})
+		driver = driverClass(port=port)
+		# As done by the braille handler when switching displays.
+		driver.initSettings()
+		try:
+			yield driver
+		finally:
+			driver.terminate()
+
+
+@contextmanager
+def displayOnHandler(driver: braille.BrailleDisplayDriver) -> Iterator[braille.BrailleHandler]:
+	"""Makes L{braille.handler} write to a driver.
+	Writes which would be made on the I/O thread are made synchronously.
+	@param driver: The driver of the display.
+	@return: The braille handler.
+	"""
+	handler = braille.handler
+	with (
+		patch.object(handler, "display", driver),
+		patch.object(handler, "_writeCellsInBackground", lambda: handler._bgThreadExecutor(0)),
+	):
+		handler.invalidateDisplayedCells()
+		try:
+			yield handler
+		finally:
+			handler.invalidateDisplayedCells()
+
+
+class SimulatedDisplayTestMixin:
+	"""Sets up a simulated display and records gestures for a L{unittest.TestCase} of a driver.
+	Subclasses provide the driver, the device and the keys to press.
+	"""
+
+	#: The class of the driver talking to the simulated display.
+	driverClass: Type[braille.BrailleDisplayDriver]
+	#: The number of cells of the simulated display.
+	numCells: int = 40
+	#: The id of the gesture executed for the keys pressed by L{makeKeyPress}.
+	keyGestureId: str
+
+	def makeDevice(self) -> SimulatedDevice:
+		"""Creates the simulated display, with L{numCells} cells."""
+		raise NotImplementedError
+
+	def makeKeyPress(self) -> bytes:
+		"""Builds the packets the display sends when keys are pressed and released."""
+		raise NotImplementedError
+
+	def makeRoutingPress(self, index: int) -> bytes:
+		"""Builds the packets the display sends when a routing key is pressed and released.
+		@param index: The 0 based index of the routing key.
+		"""
+		raise NotImplementedError
+
+	def makePatchers(self) -> list:
+		"""Creates the patchers started for each test.
+		The base implementation replaces L{inputCore.manager} with L{recorder}.
+		"""
+		return [patch.object(inputCore, "manager", self.recorder)]
+
+	def setUp(self):
+		super().setUp()
+		self.device = self.makeDevice()
+		self.recorder = GestureRecorder()
+		for patcher in self.makePatchers():
+			patcher.start()
+			self.addCleanup(patcher.stop)
+
+	def connect(self) -> AbstractContextManager[braille.BrailleDisplayDriver]:
+		"""Connects a driver to the simulated display. See L{connectDriver}."""
+		return connectDriver(self.driverClass, self.device)
+
+	@contextmanager
+	def connectWriter(self) -> Iterator[Callable[[list[int]], None]]:
+		"""Connects a driver to the simulated display, and makes L{braille.handler} write to it.
+		@return: A function which writes cells through the handler.
+		"""
+		with self.connect() as driver, displayOnHandler(driver) as handler:
+			yield handler._writeCells
@@ -6,7 +6,10 @@
 
 """Unit tests for the contentRecog module."""
 
+import ctypes
 import unittest
+from random import Random
+
 import contentRecog
 import textInfos
 from locationHelper import RectLTWH
@@ -172,3 +175,244 @@ def test_boundingRectFromOffsetAtBottom(self):
 	def test_copyTextInfo(self):
 		copy = self.textInfo.copy()
 		self.assertEqual(copy, self.textInfo)
+
+	def test_offsetFromPoint(self):
+		self.assertEqual(self.textInfo._getOffsetFromPoint(115, 210), self.WORD2_START)
+		self.assertEqual(self.textInfo._getOffsetFromPoint(100, 220), self.WORD3_START)
+
+	def test_offsetFromPointOutsideWords(self):
+		with self.assertRaises(LookupError):
+			self.textInfo._getOffsetFromPoint(50, 50)
+
+
+class TestLinesWordsResultLookups(unittest.TestCase):
+	"""Tests looking up offsets and points in a large LinesWordsResult against linear searches."""
+
+	LINE_COUNT = 30
+	WORDS_PER_LINE = 20
+
+	def setUp(self):
+		random = Random(0)
+		data = []
+		for lineIndex in range(self.LINE_COUNT):
+			line = []
+			x = random.randrange(10)
+			for _wordIndex in range(self.WORDS_PER_LINE):
+				length = random.randrange(1, 10)
+				width = length * 7
+				line.append({"x": x, "y": lineIndex * 20, "width": width, "height": 18, "text": "w" * length})
+				x += width + random.randrange(2, 8)
+			data.append(line)
+		info = contentRecog.RecogImageInfo(0, 0, 2000, 2000, 1)
+		self.result = contentRecog.LinesWordsResult(data, info)
+		self.textInfo = self.result.makeTextInfo(FakeNVDAObject(), textInfos.POSITION_FIRST)
+
+	def test_wordAndLineOffsets(self):
+		words = self.result.words
+		lines = self.result.lines
+		for offset in range(self.result.textLen):
+			wordIndex = max(index for index, word in enumerate(words) if word.offset <= offset)
+			wordEnd = words[wordIndex + 1].offset if wordIndex + 1 < len(words) else self.result.textLen
+			self.assertEqual(self.textInfo._getWordOffsets(offset), (words[wordIndex].offset, wordEnd))
+			word = words[wordIndex]
+			self.assertEqual(
+				self.textInfo._getBoundingRectFromOffset(offset),
+				RectLTWH(word.left, word.top, word.width, word.height),
+			)
+			lineIndex = next((index for index, end in enumerate(lines) if end > offset), len(lines) - 1)
+			lineStart = lines[lineIndex - 1] if lineIndex else 0
+			self.assertEqual(self.textInfo._getLineOffsets(offset), (lineStart, lines[lineIndex]))
+
+	def test_wordFromPoint(self):
+		random = Random(1)
+		for _point in range(2000):
+			x = random.randrange(-5, 1200)
+			y = random.randrange(-5, self.LINE_COUNT * 20 + 5)
+			expected = next(
+				(
+					index
+					for index, word in enumerate(self.result.words)
+					if word.left <= x < word.left + word.width and word.top <= y < word.top + word.height
+				),
+				None,
+			)
+			self.assertEqual(self.result.getWordIndexFromPoint(x, y), expected, (x, y))
+
+
+#: The size of the synthetic images recognized by L{FakeRowsRecognizer}.
+IMAGE_WIDTH = 8
+IMAGE_HEIGHT = 200
+
+
+def makePixels(lines: dict[int, int]) -> ctypes.Array:
+	"""Makes a synthetic image for L{FakeRowsRecognizer}.
+	@param lines: Maps the top row of each line of text to a number identifying its text.
+		Each line is 10 rows high, and lines should be at least 20 rows apart.
+	"""
+	pixels = (ctypes.c_uint32 * IMAGE_WIDTH * IMAGE_HEIGHT)()
+	for top, value in lines.items():
+		for y in range(top, top + 10):
+			for x in range(IMAGE_WIDTH):
+				pixels[y][x] = value
+	return pixels
+
+
+class FakeRowsRecognizer(contentRecog.ContentRecognizer):
+	"""Recognizes each run of rows whose first pixel isn't 0 as a line with a single word.
+	The text of the word is given by the value of the pixel.
+	"""
+
+	def __init__(self):
+		#: The image info passed to each call to L{recognize}.
+		self.recognized: list[contentRecog.RecogImageInfo] = []
+
+	def recognize(self, pixels, imageInfo, onResult):
+		self.recognized.append(imageInfo)
+		data = []
+		lineTop = None
+		for y in range(len(pixels) + 1):
+			value = pixels[y][0] if y < len(pixels) else 0
+			if value and lineTop is None:
+				lineTop = y
+			elif not value and lineTop is not None:
+				word = {"x": 0, "y": lineTop, "width": IMAGE_WIDTH, "height": y - lineTop}
+				data.append([dict(word, text=f"line{pixels[lineTop][0]}")])
+				lineTop = None
+		onResult(contentRecog.LinesWordsResult(data, imageInfo))
+
+	def cancel(self):
+		pass
+
+
+class FakeSmallImageRecognizer(FakeRowsRecognizer):
+	"""Like L{FakeRowsRecognizer}, but asks for images less than L{minHeight} rows high to be enlarged."""
+
+	def __init__(self, minHeight: int):
+		super().__init__()
+		self.minHeight = minHeight
+
+	def getResizeFactor(self, width, height):
+		if height < self.minHeight:
+			return 2
+		return 1
+
+
+class TestResultRefresher(unittest.TestCase):
+	def setUp(self):
+		self.recognizer = self._makeRecognizer()
+		self.imageInfo = contentRecog.RecogImageInfo(10, 20, IMAGE_WIDTH, IMAGE_HEIGHT, 1)
+		self.refresher = contentRecog.ResultRefresher(self.recognizer, self.imageInfo)
+		self.lines = {top: index + 1 for index, top in enumerate(range(0, IMAGE_HEIGHT, 20))}
+		self.result = self._refresh(makePixels(self.lines), None)
+
+	def _makeRecognizer(self) -> FakeRowsRecognizer:
+		return FakeRowsRecognizer()
+
+	def _refresh(self, pixels, result):
+		results = []
+		self.refresher.recognize(pixels, result, results.append)
+		self.assertEqual(len(results), 1)
+		return results[0]
+
+	def _recognizeWhole(self, pixels):
+		results = []
+		FakeRowsRecognizer().recognize(pixels, self.imageInfo, results.append)
+		return results[0]
+
+	def test_firstRecognitionWholeImage(self):
+		self.assertEqual(len(self.recognizer.recognized), 1)
+		self.assertEqual(self.recognizer.recognized[0].recogHeight, IMAGE_HEIGHT)
+		self.assertEqual(self.result.text.splitlines()[:2], ["line1", "line2"])
+
+	def test_unchangedImageNotRecognized(self):
+		result = self._refresh(makePixels(self.lines), self.result)
+		self.assertIs(result, self.result)
+		self.assertEqual(len(self.recognizer.recognized), 1)
+
+	def test_changedLineRecognizedAlone(self):
+		self.lines[100] = 42
+		pixels = makePixels(self.lines)
+		result = self._refresh(pixels, self.result)
+		rowsInfo = self.recognizer.recognized[-1]
+		self.assertLess(rowsInfo.recogHeight, IMAGE_HEIGHT)
+		self.assertLessEqual(rowsInfo.screenTop, 20 + 100)
+		self.assertEqual(result.text, self._recognizeWhole(pixels).text)
+		self.assertIn("line42", result.text)
+		# Words keep their screen coordinates.
+		self.assertEqual(result.words, self._recognizeWhole(pixels).words)
+
+	def test_newLineRecognized(self):
+		lines = {top: value for top, value in self.lines.items() if top != 60}
+		result = self._refresh(makePixels(lines), self.result)
+		self.assertNotIn("line4\n", result.text)
+		self.lines[60] = 7
+		pixels = makePixels(self.lines)
+		result = self._refresh(pixels, result)
+		self.assertLess(self.recognizer.recognized[-1].recogHeight, IMAGE_HEIGHT)
+		self.assertEqual(result.text, self._recognizeWhole(pixels).text)
+
+	def test_largeChangeRecognizesWholeImage(self):
+		lines = {top: value + 10 for top, value in self.lines.items()}
+		result = self._refresh(makePixels(lines), self.result)
+		self.assertEqual(self.recognizer.recognized[-1].recogHeight, IMAGE_HEIGHT)
+		self.assertEqual(result.text.splitlines()[0], "line11")
+
+	def test_caretMovesWithText(self):
+		text = self.result.text
+		caretAfter = text.index("line8")
+		caretBefore = text.index("line2")
+		self.lines[100] = 123456
+		result = self._refresh(makePixels(self.lines), self.result)
+		self.assertEqual(result.text[self.refresher.mapOffset(caretAfter) :][:5], "line8")
+		self.assertEqual(self.refresher.mapOffset(caretBefore), caretBefore)
+		caretInChange = text.index("line6") + 2
+		self.assertEqual(self.refresher.mapOffset(caretInChange), caretInChange)
+
+	def test_mapOffsetAfterWholeRecognition(self):
+		self._refresh(makePixels({0: 5}), self.result)
+		self.assertEqual(self.refresher.mapOffset(30), 30)
+
+
+class TestResultRefresherWithResizing(TestResultRefresher):
+	"""Runs the refresher tests with a recognizer which would enlarge the rows of a single line."""
+
+	def _makeRecognizer(self) -> FakeRowsRecognizer:
+		return FakeSmallImageRecognizer(minHeight=50)
+
+	def test_rowsPaddedToRecognizerHeight(self):
+		self.lines[100] = 42
+		pixels = makePixels(self.lines)
+		result = self._refresh(pixels, self.result)
+		rowsInfo = self.recognizer.recognized[-1]
+		self.assertGreaterEqual(rowsInfo.recogHeight, 50)
+		self.assertLess(rowsInfo.recogHeight, IMAGE_HEIGHT)
+		self.assertEqual(rowsInfo.resizeFactor, 1)
+		self.assertEqual(result.text, self._recognizeWhole(pixels).text)
+
+	def test_wholeImageRecognizedIfRowsCantBePadded(self):
+		self.recognizer.minHeight = IMAGE_HEIGHT
+		self.lines[100] = 42
+		pixels = makePixels(self.lines)
+		result = self._refresh(pixels, self.result)
+		self.assertEqual(self.recognizer.recognized[-1].recogHeight, IMAGE_HEIGHT)
+		self.assertEqual(result.text, self._recognizeWhole(pixels).text)
+
+
+class TestImageChangeDetector(unittest.TestCase):
+	def test_changedRows(self):
+		detector = contentRecog.ImageChangeDetector(bandHeight=16)
+		pixels = makePixels({0: 1})
+		self.assertEqual(detector.update(pixels), (0, IMAGE_HEIGHT))
+		self.assertIsNone(detector.update(pixels))
+		pixels[40][3] = 9
+		pixels[70][0] = 9
+		self.assertEqual(detector.update(pixels), (32, 80))
+		pixels[199][0] = 9
+		self.assertEqual(detector.update(pixels), (192, IMAGE_HEIGHT))
+
+	def test_reset(self):
+		detector = contentRecog.ImageChangeDetector()
+		pixels = makePixels({})
+		detector.update(pixels)
+		detector.reset()
+		self.assertEqual(detector.update(pixels), (0, IMAGE_HEIGHT))
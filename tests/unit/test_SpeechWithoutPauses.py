@@ -6,6 +6,7 @@
 """Unit tests for SpeechWithoutPauses"""
 
 import unittest
+from random import Random
 from typing import List
 
 from speech.types import SpeechSequence
@@ -224,3 +225,40 @@ def createInputSequences():
 			newSpeech.append(f"spoke:{spoke}")
 
 		self.assertMultiLineEqual(repr(newSpeech), expectedSpeech, "generated new speech vs expected")
+
+	def test_randomSequencesMatchOldImpl(self):
+		"""Compares both implementations on many sequences mixing phrases, pauses and commands."""
+		random = Random(0)
+		callbackCommand = CallbackCommand(name="dummy", callback=None)
+		items = [
+			"plain words ",
+			"a sentence. ",
+			"a sentence. And more",
+			"ends with a question?",
+			'a quote." ',
+			"pi is 3.14 ",
+			"...",
+			" . ",
+			"",
+			callbackCommand,
+			LangChangeCommand("en"),
+			LangChangeCommand("fr"),
+			LangChangeCommand(None),
+			EndUtteranceCommand(),
+		]
+
+		def createInputSequences():
+			rand = Random(random.random())
+			return [[rand.choice(items) for _ in range(rand.randrange(8))] for _ in range(6)] + [None]
+
+		for _case in range(200):
+			sequences = createInputSequences()
+			oldSpeech = resetSpeakDest()
+			old_speakWithoutPauses._pendingSpeechSequence = []
+			for seq in sequences:
+				oldSpeech.append(f"spoke:{old_speakWithoutPauses(seq)}")
+			newSpeech = resetSpeakDest()
+			_speakWithoutPauses = SpeechWithoutPauses(speak)
+			for seq in sequences:
+				newSpeech.append(f"spoke:{_speakWithoutPauses.speakWithoutPauses(seq)}")
+			self.assertEqual(repr(newSpeech), repr(oldSpeech), f"input: {sequences!r}")
@@ -0,0 +1,109 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for loading add-ons and inspecting add-on bundles in parallel."""
+
+import hashlib
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+import addonHandler
+
+
+def _createManifest(name: str) -> str:
+	return (
+		f"name = {name}\n"
+		f"summary = {name} summary\n"
+		"author = NV Access\n"
+		"version = 1.0\n"
+		"minimumNVDAVersion = 2023.1\n"
+		"lastTestedNVDAVersion = 2024.1\n"
+	)
+
+
+class TestLoadAddons(unittest.TestCase):
+	ADDON_NAMES = ["addon%02d" % i for i in range(20)]
+
+	def setUp(self):
+		tempDir = tempfile.TemporaryDirectory()
+		self.addCleanup(tempDir.cleanup)
+		self.addonsDir = tempDir.name
+		for name in self.ADDON_NAMES:
+			addonPath = os.path.join(self.addonsDir, name)
+			os.mkdir(addonPath)
+			with open(os.path.join(addonPath, addonHandler.MANIFEST_FILENAME), "w", encoding="utf-8") as f:
+				f.write(_createManifest(name))
+		indexPatcher = patch.object(addonHandler, "_manifestIndex", addonHandler._AddonManifestIndex())
+		indexPatcher.start()
+		self.addCleanup(indexPatcher.stop)
+		addonHandler._manifestIndex.clear()
+
+	def test_addonsLoadedInPathOrder(self):
+		paths = [os.path.join(self.addonsDir, name) for name in reversed(self.ADDON_NAMES)]
+		addons = addonHandler._loadAddons(paths)
+		self.assertEqual([addon.path for addon in addons], paths)
+		self.assertEqual([addon.name for addon in addons], list(reversed(self.ADDON_NAMES)))
+
+	def test_invalidAddonsReportedIndividually(self):
+		invalidNames = {"addon03", "addon11"}
+		for name in invalidNames:
+			with open(os.path.join(self.addonsDir, name, addonHandler.MANIFEST_FILENAME), "w") as f:
+				f.write("name = broken\n")
+		paths = [os.path.join(self.addonsDir, name) for name in self.ADDON_NAMES]
+		with patch.object(addonHandler.log, "error") as logError:
+			addons = addonHandler._loadAddons(paths)
+		self.assertEqual(
+			[addon is None for addon in addons],
+			[name in invalidNames for name in self.ADDON_NAMES],
+		)
+		loggedPaths = {call.args[1] for call in logError.call_args_list}
+		self.assertEqual(loggedPaths, {os.path.join(self.addonsDir, name) for name in invalidNames})
+
+	def test_addonDirsListedInFileSystemOrder(self):
+		os.mkdir(os.path.join(self.addonsDir, "empty"))
+		os.mkdir(os.path.join(self.addonsDir, "removed" + addonHandler.DELETEDIR_SUFFIX))
+		with patch.object(addonHandler.log, "error"):
+			addonDirs = addonHandler._getAddonDirsFromPath(self.addonsDir)
+		expected = [
+			os.path.join(self.addonsDir, p) for p in os.listdir(self.addonsDir) if p in self.ADDON_NAMES
+		]
+		self.assertEqual(addonDirs, expected)
+
+
+class TestInspectAddonBundles(unittest.TestCase):
+	def setUp(self):
+		tempDir = tempfile.TemporaryDirectory()
+		self.addCleanup(tempDir.cleanup)
+		self.bundlePaths = []
+		for i in range(5):
+			bundlePath = os.path.join(tempDir.name, f"addon{i}.{addonHandler.BUNDLE_EXTENSION}")
+			with zipfile.ZipFile(bundlePath, "w") as z:
+				z.writestr(addonHandler.MANIFEST_FILENAME, _createManifest(f"addon{i}"))
+			self.bundlePaths.append(bundlePath)
+		self.invalidPath = os.path.join(tempDir.name, f"invalid.{addonHandler.BUNDLE_EXTENSION}")
+		with open(self.invalidPath, "wb") as f:
+			f.write(b"not a zip file")
+
+	def test_bundlesInspectedInOrder(self):
+		paths = [*self.bundlePaths[:2], self.invalidPath, *self.bundlePaths[2:]]
+		with patch.object(addonHandler.log, "error") as logError:
+			results = addonHandler._inspectAddonBundles(paths)
+		self.assertEqual([result.path for result in results], paths)
+		self.assertEqual(
+			[result.bundle.name if result.bundle else None for result in results],
+			["addon0", "addon1", None, "addon2", "addon3", "addon4"],
+		)
+		self.assertTrue(all(result.sha256 is None for result in results))
+		logError.assert_called_once()
+		self.assertEqual(logError.call_args.args[1], self.invalidPath)
+
+	def test_checksums(self):
+		results = addonHandler._inspectAddonBundles(self.bundlePaths, computeChecksums=True)
+		for path, result in zip(self.bundlePaths, results):
+			with open(path, "rb") as f:
+				self.assertEqual(result.sha256, hashlib.sha256(f.read()).hexdigest())
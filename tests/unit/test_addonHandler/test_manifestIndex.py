@@ -0,0 +1,152 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for the persisted index of add-on manifests."""
+
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import addonHandler
+from addonHandler import _AddonManifestIndex, AddonError
+
+
+_MANIFEST = """name = testAddon
+summary = Test add-on
+description = A test add-on.
+author = NV Access
+version = 1.0
+minimumNVDAVersion = 2023.1
+lastTestedNVDAVersion = 2024.1
+
+[brailleTables]
+[[test.utb]]
+displayName = Test table
+"""
+
+_TRANSLATED_MANIFEST = """summary = Module de test
+"""
+
+
+class TestAddonManifestIndex(unittest.TestCase):
+	def setUp(self):
+		tempDir = tempfile.TemporaryDirectory()
+		self.addCleanup(tempDir.cleanup)
+		self.addonPath = os.path.join(tempDir.name, "addons", "testAddon")
+		os.makedirs(self.addonPath)
+		self.indexPath = os.path.join(tempDir.name, addonHandler.manifestIndexFilename)
+		self._writeFile(addonHandler.MANIFEST_FILENAME, _MANIFEST)
+		for patcher in (
+			patch.object(_AddonManifestIndex, "indexPath", self.indexPath),
+			patch("NVDAState.shouldWriteToDisk", return_value=True),
+			patch("languageHandler.getLanguage", return_value="fr"),
+		):
+			patcher.start()
+			self.addCleanup(patcher.stop)
+		readPatcher = patch.object(addonHandler, "_readAddonManifest", wraps=addonHandler._readAddonManifest)
+		self.readManifest = readPatcher.start()
+		self.addCleanup(readPatcher.stop)
+
+	def _writeFile(self, relativePath: str, content: str, mtimeOffset: int = 0):
+		path = os.path.join(self.addonPath, relativePath)
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		with open(path, "w", encoding="utf-8") as f:
+			f.write(content)
+		if mtimeOffset:
+			# Ensure the change is visible even on file systems with a coarse modification time.
+			stat = os.stat(path)
+			os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtimeOffset))
+
+	def test_unchangedManifestParsedOnce(self):
+		index = _AddonManifestIndex()
+		first = index.getManifest(self.addonPath)
+		second = index.getManifest(self.addonPath)
+		self.assertEqual(self.readManifest.call_count, 1)
+		self.assertEqual(first.dict(), second.dict())
+		self.assertIsNone(second.errors)
+		self.assertEqual(second["minimumNVDAVersion"], (2023, 1, 0))
+		self.assertEqual(second["brailleTables"]["test.utb"]["displayName"], "Test table")
+		self.assertFalse(second["brailleTables"]["test.utb"]["contracted"])
+
+	def test_indexedManifestIsNotShared(self):
+		index = _AddonManifestIndex()
+		index.getManifest(self.addonPath)["summary"] = "changed"
+		self.assertEqual(index.getManifest(self.addonPath)["summary"], "Test add-on")
+
+	def test_changedManifestParsedAgain(self):
+		index = _AddonManifestIndex()
+		index.getManifest(self.addonPath)
+		self._writeFile(addonHandler.MANIFEST_FILENAME, _MANIFEST.replace("1.0", "1.1"), mtimeOffset=10**9)
+		manifest = index.getManifest(self.addonPath)
+		self.assertEqual(self.readManifest.call_count, 2)
+		self.assertEqual(manifest["version"], "1.1")
+
+	def test_addedTranslationParsedAgain(self):
+		index = _AddonManifestIndex()
+		self.assertEqual(index.getManifest(self.addonPath)["summary"], "Test add-on")
+		self._writeFile(os.path.join("locale", "fr", addonHandler.MANIFEST_FILENAME), _TRANSLATED_MANIFEST)
+		self.assertEqual(index.getManifest(self.addonPath)["summary"], "Module de test")
+		self.assertEqual(self.readManifest.call_count, 2)
+
+	def test_languageChangeParsedAgain(self):
+		self._writeFile(os.path.join("locale", "fr", addonHandler.MANIFEST_FILENAME), _TRANSLATED_MANIFEST)
+		index = _AddonManifestIndex()
+		self.assertEqual(index.getManifest(self.addonPath)["summary"], "Module de test")
+		with patch("languageHandler.getLanguage", return_value="en"):
+			self.assertEqual(index.getManifest(self.addonPath)["summary"], "Test add-on")
+		self.assertEqual(self.readManifest.call_count, 2)
+
+	def test_savedIndexLoaded(self):
+		self._writeFile(os.path.join("locale", "fr", addonHandler.MANIFEST_FILENAME), _TRANSLATED_MANIFEST)
+		index = _AddonManifestIndex()
+		expected = index.getManifest(self.addonPath).dict()
+		index.save()
+		manifest = _AddonManifestIndex().getManifest(self.addonPath)
+		self.assertEqual(self.readManifest.call_count, 1)
+		self.assertEqual(manifest.dict(), expected)
+		self.assertEqual(manifest._translatedConfig["summary"], "Module de test")
+
+	def test_indexFromOtherNVDAVersionDiscarded(self):
+		index = _AddonManifestIndex()
+		index.getManifest(self.addonPath)
+		index.save()
+		with patch("buildVersion.version", "0.0.0"):
+			_AddonManifestIndex().getManifest(self.addonPath)
+		self.assertEqual(self.readManifest.call_count, 2)
+
+	def test_corruptIndexIgnored(self):
+		with open(self.indexPath, "wb") as f:
+			f.write(b"not a pickle")
+		manifest = _AddonManifestIndex().getManifest(self.addonPath)
+		self.assertEqual(manifest["name"], "testAddon")
+
+	def test_invalidManifestNotIndexed(self):
+		self._writeFile(addonHandler.MANIFEST_FILENAME, "name = testAddon\n")
+		index = _AddonManifestIndex()
+		for _attempt in range(2):
+			with self.assertRaises(AddonError):
+				index.getManifest(self.addonPath)
+		self.assertEqual(self.readManifest.call_count, 2)
+
+	def test_pruneRemovesUnavailableAddons(self):
+		index = _AddonManifestIndex()
+		index.getManifest(self.addonPath)
+		index.prune([])
+		index.save()
+		with open(self.indexPath, "rb") as f:
+			self.assertEqual(pickle.load(f)["entries"], {})
+
+	def test_unchangedIndexNotWritten(self):
+		index = _AddonManifestIndex()
+		index.getManifest(self.addonPath)
+		index.prune([self.addonPath])
+		index.save()
+		os.remove(self.indexPath)
+		index.getManifest(self.addonPath)
+		index.prune([self.addonPath])
+		index.save()
+		self.assertFalse(os.path.exists(self.indexPath))
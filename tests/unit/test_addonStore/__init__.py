@@ -0,0 +1 @@
+"""Set of unit tests for the `addonStore` package."""
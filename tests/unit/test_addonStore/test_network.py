@@ -0,0 +1,225 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for the addonStore.network module, using a local HTTP server in place of the add-on store."""
+
+import hashlib
+import http.server
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from addonStore import network
+
+
+class _StoreRequestHandler(http.server.BaseHTTPRequestHandler):
+	"""Serves L{_StoreServer.content} with support for ETag and range requests."""
+
+	server: "_StoreServer"
+
+	def log_message(self, format, *args):
+		pass
+
+	def do_GET(self):
+		server = self.server
+		server.requestHeaders.append(dict(self.headers))
+		if server.failWith is not None:
+			self.send_response(server.failWith)
+			self.send_header("Content-Length", "0")
+			self.end_headers()
+			server.failWith = None
+			return
+		content = server.content
+		etag = f'"{hashlib.sha256(content).hexdigest()[:16]}"'
+		if self.headers.get("If-None-Match") == etag:
+			self.send_response(304)
+			self.send_header("ETag", etag)
+			self.end_headers()
+			return
+		start = 0
+		rangeHeader = self.headers.get("Range")
+		ifRange = self.headers.get("If-Range")
+		if rangeHeader and (ifRange is None or ifRange == etag):
+			start = int(rangeHeader.removeprefix("bytes=").rstrip("-"))
+			if start >= len(content):
+				self.send_response(416)
+				self.send_header("Content-Range", f"bytes */{len(content)}")
+				self.send_header("Content-Length", "0")
+				self.end_headers()
+				return
+			self.send_response(206)
+			self.send_header("Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}")
+		else:
+			self.send_response(200)
+		self.send_header("ETag", etag)
+		self.send_header("Content-Length", str(len(content) - start))
+		self.end_headers()
+		body = content[start:]
+		if server.interruptAfter is not None:
+			# Simulate a dropped connection.
+			self.wfile.write(body[: server.interruptAfter])
+			server.interruptAfter = None
+			self.close_connection = True
+			return
+		self.wfile.write(body)
+
+
+class _StoreServer(http.server.ThreadingHTTPServer):
+	def __init__(self):
+		super().__init__(("127.0.0.1", 0), _StoreRequestHandler)
+		self.content = b""
+		self.interruptAfter: int | None = None
+		"""When set, the next response is interrupted after this many bytes of content."""
+		self.failWith: int | None = None
+		"""When set, the next response has this error status."""
+		self.requestHeaders: list[dict[str, str]] = []
+
+	@property
+	def url(self) -> str:
+		return f"http://127.0.0.1:{self.server_address[1]}/addon.nvda-addon"
+
+
+class _FakeModel:
+	addonId = "test"
+
+	def __init__(self, url: str):
+		self.URL = url
+
+
+class _FakeListItem:
+	def __init__(self, url: str):
+		self.model = _FakeModel(url)
+
+
+class _NetworkTestCase(unittest.TestCase):
+	def setUp(self):
+		self.server = _StoreServer()
+		self._serverThread = threading.Thread(target=self.server.serve_forever, daemon=True)
+		self._serverThread.start()
+		self._tempDir = tempfile.TemporaryDirectory()
+
+	def tearDown(self):
+		network._closeSession()
+		self.server.shutdown()
+		self.server.server_close()
+		self._tempDir.cleanup()
+
+
+class Test_getIfModified(_NetworkTestCase):
+	def test_notModified(self):
+		self.server.content = b"data"
+		response = network._getIfModified(self.server.url, None, timeout=5)
+		self.assertEqual(response.status_code, requests.codes.OK)
+		self.assertEqual(response.content, b"data")
+		etag = response.headers["ETag"]
+		response = network._getIfModified(self.server.url, etag, timeout=5)
+		self.assertEqual(response.status_code, requests.codes.not_modified)
+		self.assertEqual(response.content, b"")
+
+	def test_modified(self):
+		self.server.content = b"data"
+		etag = network._getIfModified(self.server.url, None, timeout=5).headers["ETag"]
+		self.server.content = b"new data"
+		response = network._getIfModified(self.server.url, etag, timeout=5)
+		self.assertEqual(response.status_code, requests.codes.OK)
+		self.assertEqual(response.content, b"new data")
+
+	def test_sessionReused(self):
+		self.assertIs(network._getSession(), network._getSession())
+
+
+class Test_downloadAddonToPath(_NetworkTestCase):
+	CONTENT = os.urandom(1_000_000)
+
+	def setUp(self):
+		super().setUp()
+		self.server.content = self.CONTENT
+		with patch.object(network.NVDAState, "shouldWriteToDisk", return_value=False):
+			self.downloader = network.AddonFileDownloader()
+		self.listItem = _FakeListItem(self.server.url)
+		self.downloader.progress[self.listItem] = 0
+		self.path = os.path.join(self._tempDir.name, "addon.download")
+
+	def tearDown(self):
+		self.downloader._executor.shutdown(wait=False)
+		self.downloader._executor = None
+		super().tearDown()
+
+	def _download(self) -> str | None:
+		with patch.object(network.NVDAState, "shouldWriteToDisk", return_value=True):
+			return self.downloader._downloadAddonToPath(self.listItem, self.path)
+
+	def _assertResumed(self, requestHeaders: dict[str, str]):
+		# Only whole chunks received before the interruption are written.
+		chunkSize = 128000
+		self.assertEqual(requestHeaders["Range"], f"bytes={300_000 // chunkSize * chunkSize}-")
+
+	def _readDownload(self) -> bytes:
+		with open(self.path, "rb") as f:
+			return f.read()
+
+	def test_checksumComputedWhileStreaming(self):
+		self.assertEqual(self._download(), hashlib.sha256(self.CONTENT).hexdigest())
+		self.assertEqual(self._readDownload(), self.CONTENT)
+		self.assertNotIn("Range", self.server.requestHeaders[0])
+
+	def test_resumedAfterInterruption(self):
+		self.server.interruptAfter = 300_000
+		self.assertEqual(self._download(), hashlib.sha256(self.CONTENT).hexdigest())
+		self.assertEqual(self._readDownload(), self.CONTENT)
+		self.assertEqual(len(self.server.requestHeaders), 2)
+		self._assertResumed(self.server.requestHeaders[1])
+
+	def test_resumedOnRetry(self):
+		with patch.object(network.AddonFileDownloader, "MAX_DOWNLOAD_ATTEMPTS", 1):
+			self.server.interruptAfter = 300_000
+			with self.assertRaises(requests.exceptions.RequestException):
+				self._download()
+			self.assertEqual(self._download(), hashlib.sha256(self.CONTENT).hexdigest())
+		self.assertEqual(self._readDownload(), self.CONTENT)
+		self._assertResumed(self.server.requestHeaders[1])
+
+	def test_restartedWhenChanged(self):
+		with patch.object(network.AddonFileDownloader, "MAX_DOWNLOAD_ATTEMPTS", 1):
+			self.server.interruptAfter = 300_000
+			with self.assertRaises(requests.exceptions.RequestException):
+				self._download()
+		newContent = os.urandom(500_000)
+		self.server.content = newContent
+		self.assertEqual(self._download(), hashlib.sha256(newContent).hexdigest())
+		self.assertEqual(self._readDownload(), newContent)
+
+	def test_cancelled(self):
+		del self.downloader.progress[self.listItem]
+		self.assertIsNone(self._download())
+
+	def test_resumedAfterServerError(self):
+		self.server.failWith = 503
+		self.assertEqual(self._download(), hashlib.sha256(self.CONTENT).hexdigest())
+		self.assertEqual(self._readDownload(), self.CONTENT)
+		self.assertEqual(len(self.server.requestHeaders), 2)
+
+	def test_clientErrorNotRetried(self):
+		self.server.failWith = 404
+		with self.assertRaises(requests.exceptions.HTTPError):
+			self._download()
+		self.assertEqual(len(self.server.requestHeaders), 1)
+
+	def test_restartedWhenRangeNotSatisfiable(self):
+		# A partial download from a server which provided no validator, of a file which has since become shorter.
+		with open(self.path, "wb") as f:
+			f.write(os.urandom(len(self.CONTENT) + 10))
+		self.downloader._partialDownloads[self.path] = network._PartialDownload(
+			self.server.url,
+			size=len(self.CONTENT) + 10,
+		)
+		self.assertEqual(self._download(), hashlib.sha256(self.CONTENT).hexdigest())
+		self.assertEqual(self._readDownload(), self.CONTENT)
+		self.assertEqual(len(self.server.requestHeaders), 2)
+		self.assertNotIn("Range", self.server.requestHeaders[1])
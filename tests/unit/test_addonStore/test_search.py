@@ -0,0 +1,126 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for searching the add-ons listed in the add-on store."""
+
+import unittest
+from unittest.mock import patch
+
+from addonStore.models.addon import (
+	AddonStoreModel,
+	_copyAddonGUICollection,
+	_createAddonGUICollection,
+)
+from addonStore.models.channel import Channel
+from addonStore.models.version import MajorMinorPatch
+from addonStore.search import _AddonSearchIndex, _getSearchTexts
+
+
+def _createStoreModel(
+	addonId: str,
+	displayName: str,
+	description: str = "",
+	publisher: str = "NV Access",
+) -> AddonStoreModel:
+	return AddonStoreModel(
+		addonId=addonId,
+		displayName=displayName,
+		description=description,
+		publisher=publisher,
+		addonVersionName="1.0",
+		channel=Channel.STABLE,
+		homepage=None,
+		license="GPL v2",
+		licenseURL=None,
+		sourceURL="https://example.com/source",
+		URL=f"https://example.com/{addonId}.nvda-addon",
+		sha256="0" * 64,
+		addonVersionNumber=MajorMinorPatch(1, 0, 0),
+		minNVDAVersion=MajorMinorPatch(2023, 1, 0),
+		lastTestedVersion=MajorMinorPatch(2024, 1, 0),
+		reviewURL=None,
+		submissionTime=None,
+	)
+
+
+_MODELS = {
+	model.addonId: model
+	for model in (
+		_createStoreModel("clock", "Clock and calendar", "Announces the time and date.", "Hrvoje Katić"),
+		_createStoreModel("emoticons", "Emoticons", "Inserts EMOJIS and emoticons."),
+		_createStoreModel("wordNav", "Word Navigation", "Navigates by word in any application.", "mltony"),
+		_createStoreModel("clipContentsDesigner", "Clip Contents Designer", "Adds text to the clipboard."),
+		_createStoreModel("straße", "Straßen", "Größe der Straße.", "Der Fuß"),
+	)
+}
+
+
+def _searchNaively(term: str) -> frozenset[str]:
+	term = term.casefold()
+	return frozenset(
+		addonId for addonId, model in _MODELS.items() if any(term in text for text in _getSearchTexts(model))
+	)
+
+
+class TestAddonSearchIndex(unittest.TestCase):
+	def setUp(self):
+		self.index = _AddonSearchIndex(_MODELS)
+
+	def test_matchesNaiveSearch(self):
+		terms = [
+			"",
+			"c",
+			"cl",
+			"clo",
+			"clock",
+			"CLIP",
+			"ation",
+			"emojis",
+			"mlt",
+			"strasse",
+			"fuss",
+			"xyz",
+			"o d",
+		]
+		for term in terms:
+			with self.subTest(term=term):
+				self.assertEqual(_AddonSearchIndex(_MODELS).search(term), _searchNaively(term))
+
+	def test_searchesAllFields(self):
+		self.assertEqual(self.index.search("katić"), {"clock"})
+		self.assertEqual(self.index.search("clipboard"), {"clipContentsDesigner"})
+		self.assertEqual(self.index.search("wordnav"), {"wordNav"})
+		self.assertEqual(self.index.search("and c"), {"clock"})
+
+	def test_extendedTermNarrowsPreviousMatches(self):
+		self.assertEqual(self.index.search("cl"), {"clock", "clipContentsDesigner"})
+		with patch.object(
+			self.index, "_getCandidates", side_effect=AssertionError("Index was searched again")
+		):
+			self.assertEqual(self.index.search("cli"), {"clipContentsDesigner"})
+			self.assertEqual(self.index.search("clip"), {"clipContentsDesigner"})
+			self.assertEqual(self.index.search("eclip"), frozenset())
+
+	def test_changedTermSearchesIndex(self):
+		self.assertEqual(self.index.search("clip"), {"clipContentsDesigner"})
+		self.assertEqual(self.index.search("cl"), {"clock", "clipContentsDesigner"})
+		self.assertEqual(self.index.search("word"), {"wordNav"})
+
+	def test_emptyIndex(self):
+		self.assertEqual(_AddonSearchIndex({}).search("clock"), frozenset())
+
+
+class TestCopyAddonGUICollection(unittest.TestCase):
+	def test_copyIsIndependent(self):
+		collection = _createAddonGUICollection()
+		collection[Channel.STABLE].update(_MODELS)
+		copied = _copyAddonGUICollection(collection)
+		copied[Channel.STABLE]["other"] = _createStoreModel("other", "Other")
+		del copied[Channel.STABLE]["clock"]
+		self.assertEqual(set(collection[Channel.STABLE]), set(_MODELS))
+		self.assertNotIn("clock", copied[Channel.STABLE])
+		self.assertIn("WORDNAV", copied[Channel.STABLE])
+		self.assertIs(copied[Channel.STABLE]["wordNav"], collection[Channel.STABLE]["wordNav"])
+		self.assertEqual(copied.keys(), collection.keys())
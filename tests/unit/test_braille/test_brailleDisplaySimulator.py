@@ -0,0 +1,98 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for braille display drivers talking to simulated displays."""
+
+import unittest
+from unittest.mock import patch
+
+import wx
+from brailleDisplayDrivers import baum, handyTech
+from ..brailleDisplaySimulator import (
+	SimulatedBaumDevice,
+	SimulatedDisplayTestMixin,
+	SimulatedHandyTechDevice,
+)
+
+
+class _SimulatedDisplayTests(SimulatedDisplayTestMixin):
+	"""Tests shared by all simulated displays."""
+
+	def test_connect(self):
+		with self.connect() as driver:
+			self.assertEqual(driver.numCells, self.numCells)
+		self.assertTrue(self.device.io.isClosed)
+
+	def test_keys(self):
+		device = self.device
+		stream = self.makeKeyPress() + self.makeRoutingPress(5)
+		for chunkSize in (None, 1, 3):
+			self.recorder.gestures.clear()
+			with self.subTest(chunkSize=chunkSize):
+				with self.connect():
+					device.replay(stream, chunkSize)
+				gestures = [gesture for _time, gesture in self.recorder.gestures]
+				self.assertEqual([gesture.id for gesture in gestures], [self.keyGestureId, "routing"])
+				self.assertEqual(gestures[1].routingIndex, 5)
+
+
+class TestSimulatedBaum(_SimulatedDisplayTests, unittest.TestCase):
+	driverClass = baum.BrailleDisplayDriver
+	keyGestureId = "d2"
+
+	def makeDevice(self) -> SimulatedBaumDevice:
+		return SimulatedBaumDevice(numCells=self.numCells)
+
+	def makeKeyPress(self) -> bytes:
+		return self.device.keyPressAndRelease(self.device.DISPLAY_KEYS, b"\x02")
+
+	def makeRoutingPress(self, index: int) -> bytes:
+		return self.device.routingPressAndRelease(index)
+
+	def test_deviceId(self):
+		with self.connect() as driver:
+			self.assertEqual(driver._deviceID, "VarioConnect 40")
+
+	def test_writeCells(self):
+		cells = [0x1B] + [index for index in range(1, 40)]
+		with self.connectWriter() as writeCells:
+			bytesWritten = self.device.bytesWritten
+			writeCells(cells)
+			writeCells(cells)
+			# The escape byte in the cells is doubled.
+			self.assertEqual(self.device.writes[-1][1], b"\x1b\x01\x1b" + bytes(cells))
+			self.assertEqual(self.device.bytesWritten - bytesWritten, 43)
+
+
+class TestSimulatedHandyTech(_SimulatedDisplayTests, unittest.TestCase):
+	driverClass = handyTech.BrailleDisplayDriver
+	keyGestureId = "left"
+
+	def makeDevice(self) -> SimulatedHandyTechDevice:
+		return SimulatedHandyTechDevice(numCells=self.numCells)
+
+	def makeKeyPress(self) -> bytes:
+		return self.device.keyPressAndRelease(handyTech.KEY_LEFT)
+
+	def makeRoutingPress(self, index: int) -> bytes:
+		return self.device.keyPressAndRelease(handyTech.KEY_ROUTING + index)
+
+	def makePatchers(self) -> list:
+		# The driver creates a message window on the main thread, which needs a wx app.
+		return super().makePatchers() + [patch.object(wx, "CallAfter")]
+
+	def test_model(self):
+		with self.connect() as driver:
+			self.assertEqual(driver._model.name, "Basic Braille 40")
+
+	def test_writeCells(self):
+		cells = [0x16] + [index for index in range(1, 40)]
+		with self.connect() as driver:
+			driver.display(cells)
+			# Unlike Baum, nothing is escaped, as the packet has a length.
+			self.assertEqual(
+				self.device.writes[-1][1],
+				self.device.extendedPacket(self.device.EXTPKT_BRAILLE, bytes(cells)),
+			)
@@ -0,0 +1,209 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for skipping redundant braille writes and writing only the cells which changed."""
+
+import unittest
+from unittest.mock import patch
+
+import braille
+from braille import _getChangedCellsSpan
+
+
+class FakeDriver(braille.BrailleDisplayDriver):
+	"""A 40 cell display which counts the bytes written to it, one byte per cell."""
+
+	name = "fakeWriteCells"
+	description = "Fake display for testing writes"
+	isThreadSafe = False
+
+	def __init__(self):
+		super().__init__()
+		self.numCells = 40
+		self.bytesWritten = 0
+		self.writes: list[tuple[int, int]] = []
+		self.cells: list[int] = [0] * 40
+
+	def display(self, cells: list[int]):
+		self.bytesWritten += len(cells)
+		self.writes.append((0, len(cells)))
+		self.cells = list(cells)
+
+	def displayChangedCells(self, cells: list[int], start: int, end: int):
+		self.bytesWritten += end - start
+		self.writes.append((start, end))
+		self.cells[start:end] = cells[start:end]
+
+
+class PartialFakeDriver(FakeDriver):
+	supportsPartialUpdate = True
+
+
+class TestGetChangedCellsSpan(unittest.TestCase):
+	def test_noChange(self):
+		self.assertEqual(_getChangedCellsSpan([1, 2, 3], [1, 2, 3]), (0, 0))
+
+	def test_oneCell(self):
+		self.assertEqual(_getChangedCellsSpan([1, 2, 3], [1, 5, 3]), (1, 2))
+
+	def test_edges(self):
+		self.assertEqual(_getChangedCellsSpan([1, 2, 3, 4], [5, 2, 3, 6]), (0, 4))
+
+
+class TestWriteCells(unittest.TestCase):
+	def setUp(self):
+		handler = braille.handler
+		assert handler is not None
+		self.handler = handler
+		self.cells = [index % 256 for index in range(40)]
+
+	def _useDriver(self, driver: FakeDriver):
+		patcher = patch.object(self.handler, "display", driver)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+		self.handler.invalidateDisplayedCells()
+		self.addCleanup(self.handler.invalidateDisplayedCells)
+
+	def test_identicalWritesSkipped(self):
+		driver = FakeDriver()
+		self._useDriver(driver)
+		self.handler._writeCells(self.cells)
+		self.handler._writeCells(list(self.cells))
+		self.assertEqual(driver.bytesWritten, 40)
+		self.assertEqual(len(driver.writes), 1)
+
+	def test_modifiedCellsListWritten(self):
+		driver = FakeDriver()
+		self._useDriver(driver)
+		self.handler._writeCells(self.cells)
+		# The handler must not keep a reference to cells the caller changes later.
+		self.cells[3] = 0xFF
+		self.handler._writeCells(self.cells)
+		self.assertEqual(driver.cells, self.cells)
+		self.assertEqual(len(driver.writes), 2)
+
+	def test_changedSpanWritten(self):
+		driver = PartialFakeDriver()
+		self._useDriver(driver)
+		self.handler._writeCells(self.cells)
+		newCells = list(self.cells)
+		newCells[10] = 0xFF
+		self.handler._writeCells(newCells)
+		self.assertEqual(driver.writes, [(0, 40), (10, 11)])
+		self.assertEqual(driver.bytesWritten, 41)
+		self.assertEqual(driver.cells, newCells)
+
+	def test_fullWriteWithoutPartialSupport(self):
+		driver = FakeDriver()
+		self._useDriver(driver)
+		self.handler._writeCells(self.cells)
+		newCells = list(self.cells)
+		newCells[10] = 0xFF
+		self.handler._writeCells(newCells)
+		self.assertEqual(driver.writes, [(0, 40), (0, 40)])
+
+	def test_invalidateForcesFullWrite(self):
+		driver = PartialFakeDriver()
+		self._useDriver(driver)
+		self.handler._writeCells(self.cells)
+		self.handler.invalidateDisplayedCells()
+		self.handler._writeCells(self.cells)
+		self.assertEqual(driver.writes, [(0, 40), (0, 40)])
+
+	def test_newDisplayWritten(self):
+		firstDriver = PartialFakeDriver()
+		self._useDriver(firstDriver)
+		self.handler._writeCells(self.cells)
+		secondDriver = PartialFakeDriver()
+		with patch.object(self.handler, "display", secondDriver):
+			self.handler._writeCells(self.cells)
+		self.assertEqual(secondDriver.writes, [(0, 40)])
+
+	def test_cursorBlinkChangesOnlyCursorCell(self):
+		driver = PartialFakeDriver()
+		self._useDriver(driver)
+		self.handler._writeCells(self.cells)
+		for _blink in range(10):
+			blinkedCells = list(self.cells)
+			# Dots 7 and 8.
+			blinkedCells[5] |= 0xC0
+			self.handler._writeCells(blinkedCells)
+			self.handler._writeCells(self.cells)
+		self.assertEqual(driver.bytesWritten, 40 + 20)
+
+
+class ThreadSafeFakeDriver(PartialFakeDriver):
+	"""A display written to on the background thread.
+	Calls L{onDisplay}, if set, while cells are being written.
+	"""
+
+	isThreadSafe = True
+
+	def __init__(self):
+		super().__init__()
+		self.onDisplay = None
+
+	def displayChangedCells(self, cells: list[int], start: int, end: int):
+		super().displayChangedCells(cells, start, end)
+		if self.onDisplay:
+			onDisplay = self.onDisplay
+			self.onDisplay = None
+			onDisplay()
+
+
+class TestWriteCellsInBackground(unittest.TestCase):
+	"""Writes to a thread safe display, running the queued background writes on demand."""
+
+	def setUp(self):
+		handler = braille.handler
+		assert handler is not None
+		self.handler = handler
+		self.cells = [index % 256 for index in range(40)]
+
+	def _useDriver(self, driver: ThreadSafeFakeDriver):
+		patcher = patch.object(self.handler, "display", driver)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+		self.handler.invalidateDisplayedCells()
+		self.addCleanup(self.handler.invalidateDisplayedCells)
+		self.pendingWrites = 0
+
+		def writeCellsInBackground():
+			self.pendingWrites += 1
+
+		patcher = patch.object(self.handler, "_writeCellsInBackground", writeCellsInBackground)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+		self.addCleanup(setattr, self.handler, "queuedWrite", None)
+
+	def _runBackgroundWrites(self):
+		while self.pendingWrites:
+			self.pendingWrites -= 1
+			self.handler._bgThreadExecutor(0)
+
+	def test_identicalWritesSkipped(self):
+		driver = ThreadSafeFakeDriver()
+		self._useDriver(driver)
+		self.handler._writeCells(self.cells)
+		self._runBackgroundWrites()
+		self.handler._writeCells(list(self.cells))
+		self.assertEqual(self.pendingWrites, 0)
+		self.assertEqual(driver.writes, [(0, 40)])
+
+	def test_writeDuringBackgroundWrite(self):
+		"""Tests writing the cells shown before a background write which is still in progress,
+		as when the cursor blinks.
+		"""
+		driver = ThreadSafeFakeDriver()
+		self._useDriver(driver)
+		self.handler._writeCells(self.cells)
+		self._runBackgroundWrites()
+		blinkedCells = list(self.cells)
+		blinkedCells[5] |= 0xC0
+		self.handler._writeCells(blinkedCells)
+		driver.onDisplay = lambda: self.handler._writeCells(self.cells)
+		self._runBackgroundWrites()
+		self.assertEqual(driver.cells, self.cells)
+		self.assertEqual(driver.writes, [(0, 40), (5, 6), (5, 6)])
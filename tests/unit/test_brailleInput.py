@@ -0,0 +1,197 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for back-translation of braille input."""
+
+import threading
+import unittest
+from unittest.mock import patch
+
+import brailleInput
+import queueHandler
+from brailleInput import LOUIS_DOTS_IO_START, BackTranslator
+
+#: The cells of a few letters.
+CELLS = {"a": 0x01, "b": 0x03, "c": 0x09, "l": 0x07, "w": 0x3A, " ": 0}
+LETTERS = {cells: letter for letter, cells in CELLS.items()}
+
+
+def toCells(text: str) -> list[int]:
+	return [CELLS[letter] for letter in text]
+
+
+class StubTable:
+	"""A back-translation function for a stub contracted table.
+	Each cell is a letter, except that "alw" at the end of a word is a contraction for "always".
+	Records the text of each translation.
+	"""
+
+	def __init__(self):
+		self.translated: list[str] = []
+
+	def __call__(self, tables: list[str], data: str, mode: int) -> str:
+		text = "".join(LETTERS[ord(char) - LOUIS_DOTS_IO_START] for char in data)
+		self.translated.append(text)
+		return " ".join(("always" if word == "alw" else word) for word in text.split(" "))
+
+
+class TestBackTranslator(unittest.TestCase):
+	TABLES = ["stub.ctb"]
+
+	def setUp(self):
+		self.table = StubTable()
+		self.translator = BackTranslator(self.table)
+
+	def _translate(self, text: str) -> str:
+		return self.translator.translate(self.TABLES, toCells(text), 0)
+
+	def test_contraction(self):
+		self.assertEqual(self._translate("al"), "al")
+		self.assertEqual(self._translate("alw"), "always")
+
+	def test_cached(self):
+		self._translate("alw")
+		self._translate("alwa")
+		# As after erasing the last cell.
+		self.assertEqual(self._translate("alw"), "always")
+		self.assertEqual(self.table.translated, ["alw", "alwa"])
+
+	def test_cacheKeyIncludesMode(self):
+		self.translator.translate(self.TABLES, toCells("ab"), 0)
+		self.translator.translate(self.TABLES, toCells("ab"), 1)
+		self.assertEqual(len(self.table.translated), 2)
+
+	def test_incrementalFromWordBoundary(self):
+		self.translator.incremental = True
+		self.assertEqual(self._translate("alw cab"), "always cab")
+		self.assertEqual(self.table.translated, ["alw ", "cab"])
+		self.assertEqual(self._translate("alw cabl"), "always cabl")
+		self.assertEqual(self._translate("alw cabl alw"), "always cabl always")
+		self.assertEqual(self.table.translated, ["alw ", "cab", "cabl", "cabl ", "alw"])
+
+	def test_blankAtEndNotBoundary(self):
+		self.translator.incremental = True
+		self.assertEqual(self._translate("alw "), "always ")
+		self.assertEqual(self.table.translated, ["alw "])
+
+	def test_notIncrementalByDefault(self):
+		self._translate("alw cab")
+		self._translate("alw cabl")
+		self.assertEqual(self.table.translated, ["alw cab", "alw cabl"])
+
+	def test_cacheSize(self):
+		self.translator.cacheSize = 2
+		for text in ("a", "b", "c"):
+			self._translate(text)
+		self._translate("a")
+		self.assertEqual(self.table.translated, ["a", "b", "c", "a"])
+
+	def test_translateInBackground(self):
+		queued = []
+		done = threading.Event()
+
+		def queueFunction(queue, func, *args):
+			self.assertIs(queue, queueHandler.eventQueue)
+			self.assertIsNot(threading.current_thread(), threading.main_thread())
+			queued.append((func, args))
+			if len(queued) == 2:
+				done.set()
+
+		self.addCleanup(self.translator.terminate)
+		with patch.object(queueHandler, "queueFunction", queueFunction):
+			cells = toCells("al")
+			self.translator.translateInBackground(self.TABLES, cells, 0, "first")
+			# The cells are copied, so the caller can keep changing them.
+			cells.append(CELLS["w"])
+			self.translator.translateInBackground(self.TABLES, cells, 0, "second")
+			self.assertTrue(done.wait(5))
+		self.assertEqual(queued, [("first", ("al",)), ("second", ("always",))])
+
+
+class TestReportContractedCell(unittest.TestCase):
+	def setUp(self):
+		handler = brailleInput.handler
+		assert handler is not None
+		self.handler = handler
+		self.table = StubTable()
+		self.translator = BackTranslator(self.table)
+		self.addCleanup(self.translator.terminate)
+		for patcher in (
+			patch.object(handler, "_backTranslator", self.translator),
+			patch.object(brailleInput.BrailleInputHandler, "useContractedForCurrentFocus", True),
+		):
+			patcher.start()
+			self.addCleanup(patcher.stop)
+		self.addCleanup(handler.flushBuffer)
+		handler.flushBuffer()
+
+	def _translateInBackground(self, pos: int, onTranslated=None) -> list:
+		"""Requests a background translation and waits for the function queued for the main thread."""
+		queued = []
+		done = threading.Event()
+
+		def queueFunction(queue, func, *args):
+			queued.append((func, args))
+			done.set()
+
+		with patch.object(queueHandler, "queueFunction", queueFunction):
+			self.handler._translateForReportContractedCell(pos, onTranslated)
+			self.assertTrue(done.wait(5))
+		return queued
+
+	def test_bufferTextUpdatedOnMainThread(self):
+		self.handler.bufferBraille = toCells("alw")
+		reported = []
+		queued = self._translateInBackground(2, lambda oldText, newText: reported.append((oldText, newText)))
+		self.assertEqual(self.handler.bufferText, "")
+		for func, args in queued:
+			func(*args)
+		self.assertEqual(self.handler.bufferText, "always")
+		self.assertEqual(reported, [("", "always")])
+
+	def test_reportedAfterFlush(self):
+		"""Tests that a cell is still reported if the word was ended before the cell was translated."""
+		self.handler.bufferBraille = toCells("alw")
+		reported = []
+		queued = self._translateInBackground(2, lambda oldText, newText: reported.append((oldText, newText)))
+		self.handler.flushBuffer()
+		for func, args in queued:
+			func(*args)
+		self.assertEqual(self.handler.bufferText, "")
+		self.assertEqual(reported, [("", "always")])
+
+	def test_reportedAfterFlushFollowsPreviousCell(self):
+		"""Tests that a cell translated after the word was ended is compared with the cell before it."""
+		self.handler.bufferBraille = toCells("alw")
+		reported = []
+
+		def onTranslated(oldText: str, newText: str):
+			reported.append((oldText, newText))
+
+		queued = self._translateInBackground(1, onTranslated)
+		queued += self._translateInBackground(2, onTranslated)
+		self.handler.flushBuffer()
+		for func, args in queued:
+			func(*args)
+		self.assertEqual(reported, [("", "al"), ("al", "always")])
+
+	def test_erasedCellNotReported(self):
+		self.handler.bufferBraille = toCells("alw")
+		reported = []
+		queued = self._translateInBackground(2, lambda oldText, newText: reported.append((oldText, newText)))
+		self.handler.bufferBraille = toCells("al")
+		for func, args in queued:
+			func(*args)
+		self.assertEqual(reported, [])
+
+	def test_toggleModifiersWithTranslationPending(self):
+		"""Tests that the word is sent before a modifier is toggled, even if its translation wasn't handled yet."""
+		self.handler.bufferBraille = toCells("alw")
+		self.handler.untranslatedCursorPos = 3
+		self._translateInBackground(2)
+		self.assertEqual(self.handler.bufferText, "")
+		with patch.object(self.handler, "_translate") as translate:
+			self.handler.toggleModifiers(["control"])
+		translate.assert_called_once_with(True)
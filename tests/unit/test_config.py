@@ -920,6 +920,57 @@ def test_updateToDifferentValue(self):
 		self.assertEqual(self.profile, {"someBool": False})
 
 
+class Config_ConfigManager_getSectionSnapshot(unittest.TestCase):
+	def setUp(self):
+		self.manager = ConfigManager()
+
+	def test_matchesSection(self):
+		snapshot = self.manager.getSectionSnapshot("documentFormatting")
+		self.assertEqual(dict(snapshot), self.manager["documentFormatting"].dict())
+
+	def test_sharedUntilChanged(self):
+		snapshot = self.manager.getSectionSnapshot("documentFormatting")
+		generation = self.manager.snapshotGeneration
+		self.assertIs(self.manager.getSectionSnapshot("documentFormatting"), snapshot)
+		self.assertEqual(self.manager.snapshotGeneration, generation)
+
+	def test_readOnly(self):
+		snapshot = self.manager.getSectionSnapshot("documentFormatting")
+		with self.assertRaises(TypeError):
+			snapshot["reportFontName"] = True
+		copied = snapshot.copy()
+		copied["reportFontName"] = not snapshot["reportFontName"]
+		self.assertIsNot(copied["reportFontName"], snapshot["reportFontName"])
+
+	def test_subsectionsReadOnly(self):
+		snapshot = self.manager.getSectionSnapshot("braille")
+		with self.assertRaises(TypeError):
+			snapshot["auto"]["excludedDisplays"] = []
+
+	def test_rebuiltOnWrite(self):
+		snapshot = self.manager.getSectionSnapshot("documentFormatting")
+		generation = self.manager.snapshotGeneration
+		newValue = not snapshot["reportFontName"]
+		self.manager["documentFormatting"]["reportFontName"] = newValue
+		self.assertGreater(self.manager.snapshotGeneration, generation)
+		newSnapshot = self.manager.getSectionSnapshot("documentFormatting")
+		self.assertIsNot(newSnapshot, snapshot)
+		self.assertEqual(newSnapshot["reportFontName"], newValue)
+		self.assertEqual(snapshot["reportFontName"], not newValue)
+
+	def test_unchangedWriteKeepsSnapshot(self):
+		snapshot = self.manager.getSectionSnapshot("documentFormatting")
+		self.manager["documentFormatting"]["reportFontName"] = snapshot["reportFontName"]
+		self.assertIs(self.manager.getSectionSnapshot("documentFormatting"), snapshot)
+
+	def test_rebuiltOnProfileSwitch(self):
+		snapshot = self.manager.getSectionSnapshot("documentFormatting")
+		generation = self.manager.snapshotGeneration
+		self.manager._handleProfileSwitch(shouldNotify=False)
+		self.assertGreater(self.manager.snapshotGeneration, generation)
+		self.assertIsNot(self.manager.getSectionSnapshot("documentFormatting"), snapshot)
+
+
 _DevicesT: typing.TypeAlias = dict[DEVICE_STATE, list[AudioOutputDevice]]
 
 
@@ -6,7 +6,9 @@
 """Unit tests for the hwIo module."""
 
 import unittest
+from random import Random
 import hwIo
+from hwIo.packetFramer import PacketFramer, lengthFromByte, lengthFromTable
 import threading
 
 
@@ -43,3 +45,122 @@ def apc(param: int) -> None:
 		# Wait for atmost 2 seconds for the event to be set
 		self.assertTrue(self.event.wait(2))
 		self.assertEqual(paramContainer.param, 42)
+
+
+def _fsChecksum(body: bytes) -> int | None:
+	"""Checksum of Freedom Scientific info and extended key packets, which are the only ones with a payload."""
+	if body[0] not in (0x80, 0x82):
+		return None
+	return -sum(body) & 0xFF
+
+
+def _fsLength(data: bytearray, start: int) -> int | None:
+	if start + 1 >= len(data):
+		return None
+	if data[start] in (0x80, 0x82):
+		return 4 + data[start + 1]
+	return 4
+
+
+class TestPacketFramer(unittest.TestCase):
+	"""Tests extracting packets from byte streams received in chunks of any size."""
+
+	def _assertFramedInAnyChunks(self, framerArgs: dict, stream: bytes, expectedPackets: list[bytes]):
+		"""Checks that the packets in a stream are found however it is split into chunks."""
+		chunkings = [[stream], list(stream[i : i + 1] for i in range(len(stream)))]
+		chunkings.extend([stream[:split], stream[split:]] for split in range(1, len(stream)))
+		random = Random(0)
+		for _attempt in range(50):
+			splits = sorted(random.sample(range(1, len(stream)), min(5, len(stream) - 1)))
+			chunkings.append([stream[start:end] for start, end in zip([0] + splits, splits + [len(stream)])])
+		for chunks in chunkings:
+			packets = []
+			framer = PacketFramer(packets.append, **framerArgs)
+			for chunk in chunks:
+				framer.feed(chunk)
+			self.assertEqual(packets, expectedPackets, chunks)
+
+	def test_escapedPackets(self):
+		"""Baum style packets, starting with an escape byte which is doubled in the body."""
+		stream = b"\x1b\x01\x28" + b"\x1b\x24\x1b\x1b\x00" + b"\x1b\x22\x04"
+		self._assertFramedInAnyChunks(
+			dict(
+				getLength=lengthFromTable({0x01: 1, 0x22: 1, 0x24: 2}),
+				header=b"\x1b",
+				escape=0x1B,
+			),
+			stream,
+			[b"\x01\x28", b"\x24\x1b\x00", b"\x22\x04"],
+		)
+
+	def test_bytesBeforeHeaderIgnored(self):
+		stream = b"\xff\xfe" + b"\x1b\x01\x28" + b"\x00" + b"\x1b\x01\x14"
+		self._assertFramedInAnyChunks(
+			dict(getLength=lengthFromTable({0x01: 1}), header=b"\x1b", escape=0x1B),
+			stream,
+			[b"\x01\x28", b"\x01\x14"],
+		)
+
+	def test_interruptedEscapedPacketDropped(self):
+		stream = b"\x1b\x24\x01" + b"\x1b\x01\x28"
+		self._assertFramedInAnyChunks(
+			dict(getLength=lengthFromTable({0x01: 1, 0x24: 2}), header=b"\x1b", escape=0x1B),
+			stream,
+			[b"\x01\x28"],
+		)
+
+	def test_lengthAndTerminator(self):
+		"""Handy Tech style extended packets, with a length byte and a terminator."""
+		stream = b"\x79\x36\x02\xa0\x01\x16" + b"\x79\x36\x03\xa1\x02\x03\x16"
+		self._assertFramedInAnyChunks(
+			dict(getLength=lengthFromByte(1), header=b"\x79", terminator=b"\x16"),
+			stream,
+			[b"\x36\x02\xa0\x01", b"\x36\x03\xa1\x02\x03"],
+		)
+
+	def test_wrongTerminatorDropped(self):
+		stream = b"\x79\x36\x01\xa0\x00" + b"\x79\x36\x01\xa1\x16"
+		self._assertFramedInAnyChunks(
+			dict(getLength=lengthFromByte(1), header=b"\x79", terminator=b"\x16"),
+			stream,
+			[b"\x36\x01\xa1"],
+		)
+
+	def test_checksum(self):
+		"""Freedom Scientific style packets, some with a payload and checksum."""
+		info = b"\x80\x03\x00\x00abc"
+		key = b"\x03\x01\x02\x00"
+		stream = info + bytes([_fsChecksum(info)]) + key
+		self._assertFramedInAnyChunks(
+			dict(getLength=_fsLength, getChecksum=_fsChecksum),
+			stream,
+			[info, key],
+		)
+
+	def test_wrongChecksumDropped(self):
+		"""Tests that the framer finds the next packet after a packet with a wrong checksum."""
+		stream = b"\xaa\x01\x05\x07" + b"\xaa\x01\x06\x07"
+		self._assertFramedInAnyChunks(
+			dict(
+				getLength=lengthFromTable({0x01: 1}),
+				header=b"\xaa",
+				getChecksum=lambda body: sum(body) & 0xFF,
+			),
+			stream,
+			[b"\x01\x06"],
+		)
+
+	def test_emptyPacketSkipped(self):
+		"""Tests that a length of 0 without header, checksum or terminator doesn't stop the framer."""
+		packets = []
+		framer = PacketFramer(packets.append, getLength=lengthFromTable({0x01: 0}, offset=0))
+		framer.feed(b"\x01\x01")
+		self.assertEqual(packets, [])
+
+	def test_headerSplitAcrossChunks(self):
+		stream = b"\x00\xaa\x55\x01\x05" + b"\xaa\x55\x01\x06"
+		self._assertFramedInAnyChunks(
+			dict(getLength=lengthFromTable({}, default=1), header=b"\xaa\x55"),
+			stream,
+			[b"\x01\x05", b"\x01\x06"],
+		)
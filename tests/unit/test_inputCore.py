@@ -5,7 +5,11 @@
 
 """Unit tests for the inputCore module."""
 
+import sys
+import types
 import unittest
+from unittest.mock import patch
+
 import inputCore
 import keyboardHandler
 from .extensionPointTestHelpers import deciderTester
@@ -42,3 +46,62 @@ def test_exportAndUpdateAreEqual(self):
 		newMap = inputCore.GlobalGestureMap(exported)
 		self.assertEqual(HimsDriver.gestureMap, newMap)
 		self.assertDictEqual(HimsDriver.gestureMap._map, newMap._map)
+
+
+class TestGlobalGestureMapIndex(unittest.TestCase):
+	"""Tests for the index of resolved classes of L{inputCore.GlobalGestureMap}."""
+
+	MODULE_NAME = "_testGlobalGestureMapIndexModule"
+
+	def setUp(self):
+		self.module = types.ModuleType(self.MODULE_NAME)
+		self.module.TestClass = type("TestClass", (), {})
+		self.gestureMap = inputCore.GlobalGestureMap()
+		self.gestureMap.add("kb:a", self.MODULE_NAME, "TestClass", "test")
+
+	def tearDown(self):
+		sys.modules.pop(self.MODULE_NAME, None)
+
+	def _getScripts(self):
+		return list(self.gestureMap.getScriptsForGesture("kb:a"))
+
+	def test_resolvedOnce(self):
+		sys.modules[self.MODULE_NAME] = self.module
+		with patch.object(
+			self.gestureMap,
+			"_resolveScripts",
+			wraps=self.gestureMap._resolveScripts,
+		) as resolveMock:
+			self.assertEqual(self._getScripts(), [(self.module.TestClass, "test")])
+			self.assertEqual(self._getScripts(), [(self.module.TestClass, "test")])
+			self.assertEqual(
+				list(self.gestureMap.getScriptsForAllGestures()),
+				[(self.module.TestClass, "kb:a", "test")],
+			)
+		self.assertEqual(resolveMock.call_count, 1)
+
+	def test_unmappedGesture(self):
+		self.assertEqual(list(self.gestureMap.getScriptsForGesture("kb:b")), [])
+
+	def test_invalidatedOnModuleLoad(self):
+		self.assertEqual(self._getScripts(), [])
+		sys.modules[self.MODULE_NAME] = self.module
+		self.assertEqual(self._getScripts(), [(self.module.TestClass, "test")])
+		del sys.modules[self.MODULE_NAME]
+		self.assertEqual(self._getScripts(), [])
+
+	def test_invalidatedOnChange(self):
+		sys.modules[self.MODULE_NAME] = self.module
+		self.assertEqual(self._getScripts(), [(self.module.TestClass, "test")])
+		self.gestureMap.add("kb:a", self.MODULE_NAME, "TestClass", None, replace=True)
+		self.assertEqual(self._getScripts(), [(self.module.TestClass, None)])
+
+	def test_invalidatedOnReload(self):
+		sys.modules[self.MODULE_NAME] = self.module
+		oldCls = self.module.TestClass
+		self.assertEqual(self._getScripts(), [(oldCls, "test")])
+		self.module.TestClass = type("TestClass", (), {})
+		# Without invalidation, the previously resolved class is still returned.
+		self.assertEqual(self._getScripts(), [(oldCls, "test")])
+		inputCore.clearGlobalGestureMapIndexes()
+		self.assertEqual(self._getScripts(), [(self.module.TestClass, "test")])
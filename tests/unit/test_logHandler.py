@@ -0,0 +1,139 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for the logHandler module."""
+
+import gc
+import inspect
+import logging
+import os
+import queue
+import tempfile
+import unittest
+import weakref
+
+import logHandler
+
+
+class TestAsynchronousLogging(unittest.TestCase):
+	"""Tests for the queue based logging pipeline."""
+
+	def setUp(self):
+		self._tempDir = tempfile.TemporaryDirectory()
+		self.logFileName = os.path.join(self._tempDir.name, "nvda.log")
+		self.fileHandler = logHandler._BatchedFileHandler(self.logFileName, mode="w", encoding="utf-8")
+		self.fileHandler.setFormatter(logHandler.Formatter(fmt="{codepath!s}: {message}", style="{"))
+		self.listener = logHandler._BatchingQueueListener(queue.Queue(), self.fileHandler)
+		self.listener.start()
+		self.queueHandler = logHandler.QueueHandler(self.listener.queue)
+		self.queueHandler.setFormatter(logHandler.Formatter())
+		self.logger = logHandler.Logger("testLogger")
+		self.logger.setLevel(logging.DEBUG)
+		self.logger.propagate = False
+		self.logger.addHandler(self.queueHandler)
+
+	def tearDown(self):
+		self.logger.removeHandler(self.queueHandler)
+		if self.listener._thread is not None:
+			self.listener.stop()
+		self.fileHandler.close()
+		self._tempDir.cleanup()
+
+	def _readLog(self) -> list[str]:
+		with open(self.logFileName, "r", encoding="utf-8") as f:
+			return f.read().splitlines()
+
+	def test_orderPreserved(self):
+		for i in range(2000):
+			self.logger.debug("message %d", i, codepath="test")
+		self.listener.flush()
+		self.assertEqual(self._readLog(), [f"test: message {i}" for i in range(2000)])
+
+	def test_argsMergedOnLoggingThread(self):
+		"""Arguments changed after the log call must not affect the logged message."""
+		items = ["before"]
+		self.logger.debug("items: %s", items, codepath="test")
+		items[0] = "after"
+		self.listener.flush()
+		self.assertEqual(self._readLog(), ["test: items: ['before']"])
+
+	def test_exceptionTextIncluded(self):
+		try:
+			raise ValueError("boom")
+		except ValueError:
+			self.logger.exception("failed", codepath="test")
+		self.listener.flush()
+		lines = self._readLog()
+		self.assertEqual(lines[0], "test: failed")
+		self.assertEqual(lines[-1], "ValueError: boom")
+
+	def test_stopWritesPendingRecords(self):
+		for i in range(100):
+			self.logger.info("message %d", i, codepath="test")
+		self.listener.stop()
+		self.assertEqual(len(self._readLog()), 100)
+
+
+_MODULE_PATH = ("external:" if logHandler.isPathExternalToNVDA(__file__) else "") + __name__
+"""The module part of code paths in this module."""
+
+
+class _Base:
+	def method(self):
+		return logHandler.getCodePath(inspect.currentframe())
+
+	@classmethod
+	def clsMethod(cls):
+		return logHandler.getCodePath(inspect.currentframe())
+
+	@property
+	def prop(self):
+		return logHandler.getCodePath(inspect.currentframe())
+
+
+class _Derived(_Base):
+	def method(self):
+		return super().method(), logHandler.getCodePath(inspect.currentframe())
+
+
+def _function(arg):
+	return logHandler.getCodePath(inspect.currentframe())
+
+
+class TestGetCodePath(unittest.TestCase):
+	"""Tests for L{logHandler.getCodePath} and its caching."""
+
+	def test_method(self):
+		for _ in range(2):
+			self.assertEqual(_Base().method(), f"{_MODULE_PATH}._Base.method")
+
+	def test_inheritedMethod(self):
+		for _ in range(2):
+			self.assertEqual(
+				_Derived().method(),
+				(f"{_MODULE_PATH}._Base.method", f"{_MODULE_PATH}._Derived.method"),
+			)
+
+	def test_classMethod(self):
+		for _ in range(2):
+			self.assertEqual(_Derived.clsMethod(), f"{_MODULE_PATH}._Base.clsMethod")
+
+	def test_property(self):
+		for _ in range(2):
+			self.assertEqual(_Derived().prop, f"{_MODULE_PATH}._Base.prop")
+
+	def test_functionWithArgument(self):
+		"""The class of the first argument of a plain function must not be part of the path."""
+		for _ in range(2):
+			self.assertEqual(_function(_Base()), f"{_MODULE_PATH}._function")
+
+	def test_dynamicClassCanBeCollected(self):
+		dynamicCls = type("Dynamic_Test", (_Derived,), {})
+		self.assertEqual(dynamicCls().prop, f"{_MODULE_PATH}._Base.prop")
+		self.assertIn(dynamicCls, logHandler._classNameCache)
+		ref = weakref.ref(dynamicCls)
+		del dynamicCls
+		gc.collect()
+		self.assertIsNone(ref())
@@ -5,7 +5,10 @@
 
 """Unit tests for the nvwave module."""
 
+import tempfile
 import unittest
+import wave
+from unittest.mock import patch
 import nvwave
 from .extensionPointTestHelpers import deciderTester
 import os.path
@@ -28,3 +31,73 @@ def test_decide_playWaveFile(self):
 			**kwargs,
 		):
 			nvwave.playWaveFile(**kwargs)
+
+
+def _writeWaveFile(fileName: str, frames: bytes, channels: int = 1, sampleRate: int = 22050):
+	with wave.open(fileName, "wb") as f:
+		f.setnchannels(channels)
+		f.setsampwidth(2)
+		f.setframerate(sampleRate)
+		f.writeframes(frames)
+
+
+class TestWaveFileCache(unittest.TestCase):
+	def setUp(self):
+		tempDir = tempfile.TemporaryDirectory()
+		self.addCleanup(tempDir.cleanup)
+		self.dir = tempDir.name
+		self.cache = nvwave._WaveFileCache()
+		self.frames = bytes(range(256)) * 4
+
+	def _makeFile(self, name: str, frames: bytes | None = None, **kwargs) -> str:
+		fileName = os.path.join(self.dir, name)
+		_writeWaveFile(fileName, self.frames if frames is None else frames, **kwargs)
+		return fileName
+
+	def test_decoded(self):
+		fileName = self._makeFile("stereo.wav", channels=2, sampleRate=44100)
+		data = self.cache.get(fileName)
+		self.assertEqual(data, nvwave._WaveFileData(2, 44100, 16, self.frames))
+
+	def test_readOnce(self):
+		fileName = self._makeFile("sound.wav")
+		with patch("wave.open", wraps=wave.open) as waveOpen:
+			first = self.cache.get(fileName)
+			second = self.cache.get(fileName)
+		self.assertIs(first, second)
+		self.assertEqual(waveOpen.call_count, 1)
+
+	def test_changedFileReadAgain(self):
+		fileName = self._makeFile("sound.wav")
+		self.cache.get(fileName)
+		newFrames = bytes(100)
+		self._makeFile("sound.wav", frames=newFrames)
+		# Ensure the modification time changes, however coarse the file system's timestamps are.
+		stat = os.stat(fileName)
+		os.utime(fileName, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+		self.assertEqual(self.cache.get(fileName).frames, newFrames)
+
+	def test_leastRecentlyUsedEvicted(self):
+		fileNames = [self._makeFile(f"sound{index}.wav") for index in range(3)]
+		with patch.object(self.cache, "maxSize", 2):
+			self.cache.get(fileNames[0])
+			self.cache.get(fileNames[1])
+			self.cache.get(fileNames[0])
+			self.cache.get(fileNames[2])
+		self.assertEqual(
+			list(self.cache._entries),
+			[os.path.normcase(os.path.abspath(fileName)) for fileName in (fileNames[0], fileNames[2])],
+		)
+
+	def test_largeFileNotCached(self):
+		fileName = self._makeFile("long.wav")
+		with patch.object(self.cache, "maxFileSize", len(self.frames) - 1):
+			self.assertEqual(self.cache.get(fileName).frames, self.frames)
+		self.assertFalse(self.cache._entries)
+
+	def test_preload(self):
+		fileName = self._makeFile("sound.wav")
+		self.cache.preload([fileName, os.path.join(self.dir, "missing.wav")])
+		with patch("wave.open") as waveOpen:
+			self.cache.get(fileName)
+		waveOpen.assert_not_called()
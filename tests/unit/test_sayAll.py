@@ -0,0 +1,154 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for reading text ahead during say all."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import queueHandler
+import speech
+import synthDriverHandler
+import textInfos
+from speech import sayAll
+from speech.commands import CallbackCommand
+from speech.speechWithoutPauses import SpeechWithoutPauses
+from .textProvider import BasicTextProvider
+
+
+class FakeSynth:
+	"""Speaks the speech sent by say all on demand, running callbacks as they are reached."""
+
+	def __init__(self):
+		self._queue = []
+		self.spokenText: list[str] = []
+
+	def speak(self, sequence):
+		self._queue.extend(sequence)
+
+	def speakNextLine(self) -> bool:
+		"""Speaks up to and including the next callback.
+		@return: C{False} if there was nothing left to speak.
+		"""
+		while self._queue:
+			item = self._queue.pop(0)
+			if isinstance(item, str):
+				self.spokenText.append(item)
+			elif isinstance(item, CallbackCommand):
+				item.run()
+				return True
+		return False
+
+
+class FakeClock:
+	def __init__(self):
+		self.time = 0.0
+
+	def __call__(self) -> float:
+		return self.time
+
+
+def _pumpQueue():
+	while not queueHandler.eventQueue.empty():
+		queueHandler.pumpAll()
+
+
+class Test_TextReader(unittest.TestCase):
+	LINE_COUNT = 100
+
+	def setUp(self):
+		_pumpQueue()
+		self.lines = [f"Line {index} of the document." for index in range(self.LINE_COUNT)]
+		self.provider = BasicTextProvider(text="\n".join(self.lines))
+		self.synth = FakeSynth()
+		self.handler = sayAll._SayAllHandler(
+			SpeechWithoutPauses(speakFunc=self.synth.speak),
+			speakObject=MagicMock(),
+			getTextInfoSpeech=speech.getTextInfoSpeech,
+			SpeakTextInfoState=speech.SpeakTextInfoState,
+		)
+		self.clock = FakeClock()
+		self.handler.readAheadWindow._clock = self.clock
+		self.reviewPositions = []
+		for patcher in (
+			patch.object(sayAll, "SayAllHandler", self.handler),
+			patch.object(sayAll, "objectBelowLockScreenAndWindowsIsLocked", return_value=False),
+			patch("api.getReviewPosition", return_value=self.provider.makeTextInfo(textInfos.POSITION_FIRST)),
+			patch(
+				"api.setReviewPosition", side_effect=lambda info, **kwargs: self.reviewPositions.append(info)
+			),
+		):
+			patcher.start()
+			self.addCleanup(patcher.stop)
+		self.addCleanup(self.handler.stop)
+
+	def _start(self):
+		self.handler.readText(sayAll.CURSOR.REVIEW)
+
+	def _speakAll(self):
+		while self.synth.speakNextLine():
+			_pumpQueue()
+
+	def test_readsWholeDocument(self):
+		self._start()
+		reader = self.handler._getActiveSayAll()
+		_pumpQueue()
+		self._speakAll()
+		self.assertEqual(" ".join(self.synth.spokenText).split(), " ".join(self.lines).split())
+		self.assertEqual([info.text.strip() for info in self.reviewPositions], self.lines)
+		# The reader stopped once all the text was spoken.
+		self.assertIsNone(reader.reader)
+
+	def test_readsAheadToFillWindow(self):
+		self._start()
+		_pumpQueue()
+		reader = self.handler._getActiveSayAll()
+		self.assertGreaterEqual(reader._pendingLength, self.handler.readAheadWindow.targetLength)
+		self.assertLess(len(reader._pendingLineLengths), self.LINE_COUNT)
+		# Reaching a line reads more text to fill the window again.
+		self.synth.speakNextLine()
+		_pumpQueue()
+		self.assertGreaterEqual(reader._pendingLength, self.handler.readAheadWindow.targetLength)
+
+	def test_windowGrowsWhenSynthCatchesUp(self):
+		window = self.handler.readAheadWindow
+		# Each line fills the window on its own,
+		# so the synthesizer reaches the last line read whenever it reaches a line.
+		longLine = "word " * (window.INITIAL_LENGTH // 5) + "end."
+		self.provider.basicText = "\n".join([longLine] * 3)
+		self._start()
+		_pumpQueue()
+		self.assertEqual(window.targetLength, window.INITIAL_LENGTH)
+		self.synth.speakNextLine()
+		self.assertEqual(window.targetLength, window.INITIAL_LENGTH * 2)
+
+	def test_windowShrinksOnCancel(self):
+		self._start()
+		_pumpQueue()
+		targetLength = self.handler.readAheadWindow.targetLength
+		self.handler.stop()
+		self.assertEqual(self.handler.readAheadWindow.targetLength, targetLength // 2)
+
+	def test_windowBounded(self):
+		window = sayAll._ReadAheadWindow()
+		for _attempt in range(20):
+			window.grow()
+		self.assertEqual(window.targetLength, window.MAX_LENGTH)
+		for _attempt in range(20):
+			window.shrink()
+		self.assertEqual(window.targetLength, window.MIN_LENGTH)
+
+	def test_synthIdleGapsRecorded(self):
+		self._start()
+		_pumpQueue()
+		window = self.handler.readAheadWindow
+		synthDriverHandler.synthDoneSpeaking.notify(synth=None)
+		self.clock.time += 0.5
+		# Reaching a line reads and speaks more text, ending the gap.
+		self.synth.speakNextLine()
+		self.assertEqual(window.idleGapCount, 1)
+		self.assertAlmostEqual(window.totalIdleTime, 0.5)
+		self.assertAlmostEqual(window.longestIdleGap, 0.5)
+		self.assertEqual(window.targetLength, window.INITIAL_LENGTH * 2)
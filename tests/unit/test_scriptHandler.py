@@ -6,9 +6,15 @@
 """Unit tests for the scriptHandler module."""
 
 import unittest
+from unittest.mock import patch
+
+import api
+import inputCore
+import scriptHandler
 from scriptHandler import script
 from inputCore import SCRCAT_MISC
 from speech.sayAll import CURSOR
+from .objectProvider import PlaceholderNVDAObject
 
 
 class TestScriptDecorator(unittest.TestCase):
@@ -35,3 +41,71 @@ def script_test(self, gesture):
 		self.assertTrue(script_test.bypassInputHelp)
 		self.assertTrue(script_test.allowInSleepMode)
 		self.assertEqual(script_test.resumeSayAllMode, CURSOR.CARET)
+
+
+class _FakeGesture(inputCore.InputGesture):
+	def _get_identifiers(self):
+		return ("test:cachedGesture",)
+
+
+class _ObjectWithScript(PlaceholderNVDAObject):
+	def script_test(self, gesture):
+		return
+
+
+class TestFindScriptCache(unittest.TestCase):
+	"""Tests that the scripts resolved by L{scriptHandler.findScript} are cached and invalidated as appropriate."""
+
+	def setUp(self):
+		inputCore.initialize()
+		scriptHandler.clearFindScriptCache()
+		self._origFocus = api.getFocusObject()
+		self.focus = _ObjectWithScript()
+		api.setFocusObject(self.focus)
+
+	def tearDown(self):
+		api.setFocusObject(self._origFocus)
+		scriptHandler.clearFindScriptCache()
+		inputCore.terminate()
+
+	def _findScript(self, expectSearch: bool):
+		with patch.object(
+			scriptHandler,
+			"_findScriptInObjects",
+			wraps=scriptHandler._findScriptInObjects,
+		) as searchMock:
+			found = scriptHandler.findScript(_FakeGesture())
+		self.assertEqual(searchMock.called, expectSearch)
+		return found
+
+	def test_negativeResultCached(self):
+		self.assertIsNone(self._findScript(expectSearch=True))
+		self.assertIsNone(self._findScript(expectSearch=False))
+
+	def test_positiveResultCached(self):
+		self.focus.bindGesture("test:cachedGesture", "test")
+		self.assertEqual(self._findScript(expectSearch=True), self.focus.script_test)
+		self.assertEqual(self._findScript(expectSearch=False), self.focus.script_test)
+
+	def test_invalidatedByGestureBinding(self):
+		self.assertIsNone(self._findScript(expectSearch=True))
+		self.focus.bindGesture("test:cachedGesture", "test")
+		self.assertEqual(self._findScript(expectSearch=True), self.focus.script_test)
+		self.focus.removeGestureBinding("test:cachedGesture")
+		self.assertIsNone(self._findScript(expectSearch=True))
+
+	def test_invalidatedByGlobalGestureMap(self):
+		self.assertIsNone(self._findScript(expectSearch=True))
+		inputCore.manager.userGestureMap.add(
+			"test:cachedGesture",
+			_ObjectWithScript.__module__,
+			_ObjectWithScript.__name__,
+			"test",
+		)
+		self.assertEqual(self._findScript(expectSearch=True), self.focus.script_test)
+
+	def test_invalidatedByFocusChange(self):
+		self.focus.bindGesture("test:cachedGesture", "test")
+		self.assertEqual(self._findScript(expectSearch=True), self.focus.script_test)
+		api.setFocusObject(_ObjectWithScript())
+		self.assertIsNone(self._findScript(expectSearch=True))
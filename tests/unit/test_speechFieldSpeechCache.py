@@ -0,0 +1,168 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for the caching of control and format field speech."""
+
+import unittest
+from unittest.mock import patch
+
+import colors
+import config
+import controlTypes
+import speech
+import textInfos
+from controlTypes import OutputReason
+from speech.fieldSpeechCache import FieldSpeechCache, UnfreezableError, freezeFieldValue
+from speech.speech import _controlFieldSpeechCache, _formatFieldSpeechCache
+from .textProvider import FieldsTextProvider
+
+
+class Test_freezeFieldValue(unittest.TestCase):
+	def test_equalValuesFrozenEqual(self):
+		attrs = {"states": {controlTypes.State.LINKED, controlTypes.State.FOCUSABLE}, "level": 2}
+		sameAttrs = {"states": {controlTypes.State.FOCUSABLE, controlTypes.State.LINKED}, "level": 2}
+		self.assertEqual(freezeFieldValue(attrs), freezeFieldValue(sameAttrs))
+		self.assertEqual(hash(freezeFieldValue(attrs)), hash(freezeFieldValue(sameAttrs)))
+
+	def test_typeDistinguished(self):
+		self.assertNotEqual(freezeFieldValue({"level": 1}), freezeFieldValue({"level": True}))
+		self.assertNotEqual(freezeFieldValue(colors.RGB(0, 0, 0)), freezeFieldValue((0, 0, 0)))
+
+	def test_nestedValuesFrozen(self):
+		frozen = freezeFieldValue({"table-info": {"row-number": 1, "headers": ["a", "b"]}})
+		hash(frozen)
+
+	def test_unknownTypeNotFrozen(self):
+		with self.assertRaises(UnfreezableError):
+			freezeFieldValue({"obj": object()})
+
+
+class Test_FieldSpeechCache(unittest.TestCase):
+	def test_sequenceIsCopied(self):
+		cache = FieldSpeechCache()
+		sequence = ["link"]
+		cache.add("key", sequence)
+		sequence.append("visited")
+		cached = cache.get("key")
+		cached.append("clickable")
+		self.assertEqual(cache.get("key"), ["link"])
+
+	def test_leastRecentlyUsedEvicted(self):
+		cache = FieldSpeechCache(maxSize=2)
+		cache.add("a", ["a"])
+		cache.add("b", ["b"])
+		cache.get("a")
+		cache.add("c", ["c"])
+		self.assertEqual(cache.get("a"), ["a"])
+		self.assertIsNone(cache.get("b"))
+		self.assertEqual(len(cache), 2)
+
+	def test_stateChangeClearsCache(self):
+		cache = FieldSpeechCache()
+		cache.validate((1, "en"))
+		cache.add("a", ["a"])
+		cache.validate((1, "en"))
+		self.assertEqual(cache.get("a"), ["a"])
+		cache.validate((1, "fr"))
+		self.assertIsNone(cache.get("a"))
+
+	def test_formatConfigKeyFollowsContent(self):
+		cache = FieldSpeechCache()
+		formatConfig = {"reportFontName": True, "reportPage": False}
+		key = cache.getFormatConfigKey(formatConfig)
+		self.assertEqual(cache.getFormatConfigKey(dict(formatConfig)), key)
+		formatConfig["reportPage"] = True
+		changedKey = cache.getFormatConfigKey(formatConfig)
+		self.assertNotEqual(changedKey, key)
+		formatConfig["reportPage"] = False
+		self.assertEqual(cache.getFormatConfigKey(formatConfig), key)
+
+	def test_zeroSizeDisablesCaching(self):
+		cache = FieldSpeechCache(maxSize=0)
+		cache.add("a", ["a"])
+		self.assertIsNone(cache.get("a"))
+
+
+class Test_cachedFieldSpeech(unittest.TestCase):
+	"""Checks that the cached field speech is the same as the speech computed for every field."""
+
+	def setUp(self):
+		for cache in (_controlFieldSpeechCache, _formatFieldSpeechCache):
+			cache.clear()
+			self.addCleanup(cache.clear)
+		self.formatConfig = dict(config.conf.getSectionSnapshot("documentFormatting"))
+		self.formatConfig.update(
+			reportFontName=True,
+			reportFontSize=True,
+			reportColor=True,
+			reportFontAttributes=True,
+			reportPage=True,
+			reportSpellingErrors=True,
+			reportHeadings=True,
+			reportLinks=True,
+			reportLists=True,
+		)
+
+	def _getSpeech(self, reason: OutputReason) -> list:
+		info = FieldsTextProvider().makeTextInfo(textInfos.POSITION_ALL)
+		return list(
+			speech.getTextInfoSpeech(
+				info,
+				useCache=False,
+				formatConfig=self.formatConfig,
+				reason=reason,
+			),
+		)
+
+	def _getUncachedSpeech(self, reason: OutputReason) -> list:
+		with (
+			patch.object(_controlFieldSpeechCache, "maxSize", 0),
+			patch.object(_formatFieldSpeechCache, "maxSize", 0),
+		):
+			return self._getSpeech(reason)
+
+	def test_cachedSpeechIdentical(self):
+		for reason in (OutputReason.SAYALL, OutputReason.CARET, OutputReason.QUICKNAV):
+			with self.subTest(reason=reason):
+				expected = self._getUncachedSpeech(reason)
+				# The first pass fills the caches, the second one only uses cached speech.
+				self.assertEqual(self._getSpeech(reason), expected)
+				self.assertEqual(self._getSpeech(reason), expected)
+		self.assertGreater(len(_controlFieldSpeechCache), 0)
+		self.assertGreater(len(_formatFieldSpeechCache), 0)
+
+	def test_attrsCacheUpdatedFromCachedSpeech(self):
+		attrs = textInfos.FormatField({"font-name": "Arial", "page-number": "2"})
+		for _attempt in range(2):
+			attrsCache = textInfos.FormatField({"font-name": "Calibri"})
+			sequence = speech.getFormatFieldSpeech(attrs, attrsCache, formatConfig=self.formatConfig)
+			self.assertEqual(sequence, ["page 2", "Arial"])
+			self.assertEqual(attrsCache, attrs)
+
+	def test_configChangeClearsCache(self):
+		attrs = textInfos.FormatField({"font-name": "Arial"})
+		reportFontName = config.conf["documentFormatting"]["reportFontName"]
+		self.addCleanup(config.conf["documentFormatting"].__setitem__, "reportFontName", reportFontName)
+		config.conf["documentFormatting"]["reportFontName"] = False
+		self.assertEqual(speech.getFormatFieldSpeech(attrs), [])
+		config.conf["documentFormatting"]["reportFontName"] = True
+		self.assertEqual(speech.getFormatFieldSpeech(attrs), ["Arial"])
+
+	def test_tableControlFieldNotCached(self):
+		attrs = textInfos.ControlField(
+			{
+				"role": controlTypes.Role.TABLE,
+				"table-id": 1,
+				"table-rowcount": 2,
+				"table-columncount": 2,
+			},
+		)
+		speech.getControlFieldSpeech(attrs, [], "start_addedToControlFieldStack", self.formatConfig)
+		self.assertEqual(len(_controlFieldSpeechCache), 0)
+
+	def test_unfreezableControlFieldNotCached(self):
+		attrs = textInfos.ControlField({"role": controlTypes.Role.LINK, "states": set(), "obj": object()})
+		speech.getControlFieldSpeech(attrs, [], "start_addedToControlFieldStack", self.formatConfig)
+		self.assertEqual(len(_controlFieldSpeechCache), 0)
@@ -78,6 +78,12 @@ def test_trailingSurrogateThenNonSurrogate(self):
 		out = speechXml._escapeXml("\ude0az")
 		self.assertEqual(out, REPLACEMENT_CHAR + "z")
 
+	def test_validControlChars(self):
+		"""Test tab and line feed, which aren't printable but are valid."""
+		inp = "a\tb\nc"
+		out = speechXml._escapeXml(inp)
+		self.assertEqual(inp, out)
+
 
 class TestXmlBalancer(unittest.TestCase):
 	def setUp(self):
@@ -242,6 +248,26 @@ def test_stopEnclosingText(self):
 		)
 		self.assertEqual(xml, "<say-as>c</say-as>t")
 
+	def test_reuse(self):
+		"""Test that nothing is kept from a previous conversion."""
+		self.balancer.generateXml(
+			[
+				speechXml.EncloseAllCommand("encloseAll", {}),
+				speechXml.SetAttrCommand("pitch", "val", 50),
+				speechXml.EncloseTextCommand("say-as", {}),
+				"t1",
+			],
+		)
+		xml = self.balancer.generateXml(["t2"])
+		self.assertEqual(xml, "t2")
+
+	def test_cachedTagValueTypes(self):
+		"""Test that attribute values which are equal but format differently aren't confused by the cache."""
+		xml = self.balancer.generateXml([speechXml.SetAttrCommand("pitch", "val", 1), "t"])
+		self.assertEqual(xml, '<pitch val="1">t</pitch>')
+		xml = self.balancer.generateXml([speechXml.SetAttrCommand("pitch", "val", 1.0), "t"])
+		self.assertEqual(xml, '<pitch val="1.0">t</pitch>')
+
 
 class TestSsmlConverter(unittest.TestCase):
 	def test_convertComplex(self):
@@ -278,6 +304,29 @@ def test_convertComplex(self):
 			"</voice></prosody></speak>",
 		)
 
+	def test_convertText(self):
+		"""Test converting a speech sequence which only contains text."""
+		converter = speechXml.SsmlConverter("en_US")
+		xml = converter.convertToXml(["t1 ", "<t2>"])
+		self.assertEqual(
+			xml,
+			'<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="en-US">'
+			"t1 &lt;t2&gt;"
+			"</speak>",
+		)
+
+	def test_reuse(self):
+		"""Test that commands from a previous utterance don't affect the next one."""
+		converter = speechXml.SsmlConverter("en_US")
+		converter.convertToXml([PitchCommand(multiplier=2), LangChangeCommand("de_DE"), "t1"])
+		xml = converter.convertToXml(["t2", IndexCommand(1)])
+		self.assertEqual(
+			xml,
+			'<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="en-US">'
+			't2<mark name="1"/>'
+			"</speak>",
+		)
+
 
 class TestSsmlParser(unittest.TestCase):
 	def test_parse(self):
@@ -7,10 +7,18 @@
 
 """Unit tests for the textInfos module, its submodules and classes."""
 
+import unicodedata
 import unittest
-from .textProvider import BasicTextProvider, MockBlackBoxTextInfo
+from unittest.mock import patch
+from .textProvider import BasicTextInfo, BasicTextProvider, MockBlackBoxTextInfo
 import textInfos
-from textInfos.offsets import Offsets
+from textInfos.offsets import (
+	Offsets,
+	_getOffsetsFromBoundaries,
+	_isWordCharacter,
+	findEndOfWord,
+	findStartOfWord,
+)
 import textUtils
 
 
@@ -274,3 +282,198 @@ def test_chinese(self):
 
 	def test_smileyFace(self):
 		self.runTestAllEncodingsAllPrefixes("😂0😂", "0")
+
+
+class TestGetTextInChunksInOffsetsTextInfo(unittest.TestCase):
+	"""Checks that the chunks found in the story text in one pass are the same as
+	the chunks found by expanding to every unit.
+	"""
+
+	encodings = [
+		textUtils.WCHAR_ENCODING,
+		None,
+	]
+
+	texts = [
+		"",
+		"single line",
+		"first\nsecond\nthird\n",
+		"windows\r\nline\r\nendings",
+		"old\rmac\rendings",
+		"mixed\r\nline\rendings\n\n\n",
+		"😂 at start\nat end 😂\n🤦😊👍",
+	]
+
+	units = [
+		textInfos.UNIT_LINE,
+		textInfos.UNIT_PARAGRAPH,
+		textInfos.UNIT_READINGCHUNK,
+	]
+
+	def assertChunksMatch(self, info: textInfos.TextInfo, unit: str):
+		expected = list(textInfos.TextInfo.getTextInChunks(info, unit))
+		self.assertEqual(list(info.getTextInChunks(unit)), expected)
+
+	def test_wholeText(self):
+		for encoding in self.encodings:
+			for text in self.texts:
+				for unit in self.units:
+					with self.subTest(encoding=encoding, text=text, unit=unit):
+						obj = BasicTextProvider(text=text, encoding=encoding)
+						self.assertChunksMatch(obj.makeTextInfo(textInfos.POSITION_ALL), unit)
+
+	def test_partialRanges(self):
+		for encoding in self.encodings:
+			for text in self.texts:
+				obj = BasicTextProvider(text=text, encoding=encoding)
+				storyLength = obj.makeTextInfo(textInfos.POSITION_ALL)._endOffset
+				for start in range(storyLength + 1):
+					for end in range(start, storyLength + 1):
+						with self.subTest(encoding=encoding, text=text, start=start, end=end):
+							self.assertChunksMatch(obj.makeTextInfo(Offsets(start, end)), textInfos.UNIT_LINE)
+
+	def test_storyTextRetrievedOnce(self):
+		obj = BasicTextProvider(text="\n".join(f"line {index}" for index in range(20)))
+		info = obj.makeTextInfo(textInfos.POSITION_ALL)
+		with patch.object(info, "_getStoryText", wraps=info._getStoryText) as getStoryText:
+			chunks = list(info.getTextInChunks(textInfos.UNIT_LINE))
+		self.assertEqual(len(chunks), 20)
+		getStoryText.assert_called_once()
+
+	def test_overriddenLineOffsetsUsed(self):
+		class FixedLineLengthTextInfo(BasicTextInfo):
+			def _getLineOffsets(self, offset):
+				return (offset - offset % 4, offset - offset % 4 + 4)
+
+		class FixedLineLengthTextProvider(BasicTextProvider):
+			TextInfo = FixedLineLengthTextInfo
+
+		obj = FixedLineLengthTextProvider(text="abcdefghij")
+		info = obj.makeTextInfo(Offsets(1, 10))
+		self.assertEqual(list(info.getTextInChunks(textInfos.UNIT_LINE)), ["bcd", "efgh", "ij"])
+
+
+class TestUnitBoundariesInOffsetsTextInfo(unittest.TestCase):
+	"""Checks that the unit boundaries found in one call match the offsets found for each offset."""
+
+	encodings = [
+		textUtils.WCHAR_ENCODING,
+		None,
+	]
+
+	texts = [
+		"",
+		"single line",
+		"first\nsecond\nthird\n",
+		"windows\r\nline\r\nendings",
+		"\n\nempty lines\n\n",
+		"😂 at start\nat end 😂\n🤦😊👍",
+	]
+
+	def test_boundariesMatchLineOffsets(self):
+		for encoding in self.encodings:
+			for text in self.texts:
+				with self.subTest(encoding=encoding, text=text):
+					obj = BasicTextProvider(text=text, encoding=encoding)
+					info = obj.makeTextInfo(textInfos.POSITION_ALL)
+					boundaries = info._getUnitBoundaries(textInfos.UNIT_LINE)
+					self.assertEqual(boundaries[-1], info._endOffset)
+					for offset in range(info._endOffset + 2):
+						self.assertEqual(
+							_getOffsetsFromBoundaries(boundaries, offset),
+							tuple(info._getLineOffsets(offset)),
+						)
+
+	def test_boundariesOverRange(self):
+		obj = BasicTextProvider(text="0123\n5678\nab")
+		info = obj.makeTextInfo(textInfos.POSITION_ALL)
+		self.assertEqual(info._getUnitBoundaries(textInfos.UNIT_LINE), (0, 5, 10, 12))
+		self.assertEqual(info._getUnitBoundaries(textInfos.UNIT_LINE, 6, 11), (5, 10, 12))
+		self.assertEqual(info._getUnitBoundaries(textInfos.UNIT_LINE, 5, 10), (5, 10))
+		self.assertEqual(info._getUnitBoundaries(textInfos.UNIT_LINE, 0, 1), (0, 5))
+
+	def test_boundariesFollowStoryChanges(self):
+		obj = BasicTextProvider(text="a\nb")
+		info = obj.makeTextInfo(textInfos.POSITION_ALL)
+		self.assertEqual(info._getUnitBoundaries(textInfos.UNIT_LINE), (0, 2, 3))
+		obj.basicText = "a\nb\nc"
+		self.assertEqual(info._getUnitBoundaries(textInfos.UNIT_LINE), (0, 2, 4, 5))
+
+	def test_unsupportedBoundaries(self):
+		# The line containing an offset after a carriage return depends on the direction searched in.
+		obj = BasicTextProvider(text="old\rmac\nendings")
+		info = obj.makeTextInfo(textInfos.POSITION_ALL)
+		self.assertIsNone(info._getUnitBoundaries(textInfos.UNIT_LINE))
+		self.assertIsNone(info._getUnitBoundaries(textInfos.UNIT_WORD))
+
+	def test_unitCount(self):
+		for text, lineCount in (("", 0), ("one", 1), ("one\ntwo\n", 2), ("one\r\n\nthree", 3)):
+			with self.subTest(text=text):
+				obj = BasicTextProvider(text=text)
+				info = obj.makeTextInfo(textInfos.POSITION_FIRST)
+				self.assertEqual(info.unitCount(textInfos.UNIT_LINE), lineCount)
+
+	def test_moveMatchesMovingByEachUnit(self):
+		text = "\n".join(f"line {index} 😂" for index in range(50)) + "\n"
+		for encoding in self.encodings:
+			obj = BasicTextProvider(text=text, encoding=encoding)
+			storyLength = obj.makeTextInfo(textInfos.POSITION_ALL)._endOffset
+			for start in (0, 3, storyLength // 2, storyLength):
+				for direction in (-100, -20, 20, 100):
+					for endPoint in (None, "start", "end"):
+						with self.subTest(
+							encoding=encoding, start=start, direction=direction, endPoint=endPoint
+						):
+							info = obj.makeTextInfo(Offsets(start, start))
+							with patch.object(BasicTextInfo, "minBatchMoveCount", 1000):
+								expectedInfo = info.copy()
+								expectedCount = expectedInfo.move(textInfos.UNIT_LINE, direction, endPoint)
+							with patch.object(BasicTextInfo, "minBatchMoveCount", 1):
+								count = info.move(textInfos.UNIT_LINE, direction, endPoint)
+							self.assertEqual(count, expectedCount)
+							self.assertEqual(info.offsets, expectedInfo.offsets)
+
+
+class TestFindWord(unittest.TestCase):
+	"""Tests for finding words with the lookup table of word characters."""
+
+	def test_wordCharactersMatchCategories(self):
+		for code in (*range(0x10000), 0x1D49C, 0x1F602, 0x20000, 0xE0100):
+			char = chr(code)
+			with self.subTest(code=hex(code)):
+				self.assertEqual(_isWordCharacter(char), unicodedata.category(char)[0] in "LMN")
+
+	def test_words(self):
+		text = "Hello, wörld́ 42 漢字 x"
+		for offset, start, end in (
+			(0, 0, 5),
+			(3, 0, 5),
+			(5, 5, 7),
+			(6, 5, 7),
+			(9, 7, 14),
+			(14, 14, 17),
+			(18, 17, 20),
+			(len(text) - 1, len(text) - 1, len(text)),
+		):
+			with self.subTest(offset=offset):
+				self.assertEqual(findStartOfWord(text, offset), start)
+				self.assertEqual(findEndOfWord(text, offset), end)
+
+	def test_longWord(self):
+		url = "https://example.com/" + "aB3" * 1000 + "?q=1"
+		wordStart = len("https://example.com/")
+		wordEnd = wordStart + 3000
+		for offset in (wordStart, wordStart + 1, wordStart + 1500, wordEnd - 1):
+			with self.subTest(offset=offset):
+				self.assertEqual(findStartOfWord(url, offset), wordStart)
+				self.assertEqual(findEndOfWord(url, offset), wordEnd)
+
+	def test_astralCharactersInWord(self):
+		# Mathematical script capitals are letters outside the Basic Multilingual Plane, emoji aren't letters.
+		text = "ab𝒜c𝒞" * 100 + "😂 d"
+		for offset in (0, 2, 250, 499):
+			with self.subTest(offset=offset):
+				self.assertEqual(findStartOfWord(text, offset), 0)
+				self.assertEqual(findEndOfWord(text, offset), 500)
+		self.assertEqual(findStartOfWord(text, 500), 500)
+		self.assertEqual(findEndOfWord(text, 500), 502)
@@ -6,6 +6,10 @@
 """Unit tests for the tones module."""
 
 import unittest
+from array import array
+from ctypes import c_char_p, c_float, c_int, create_string_buffer
+
+import NVDAHelper
 import tones
 from .extensionPointTestHelpers import deciderTester
 
@@ -34,3 +38,53 @@ def test_decide_beep(self):
 			**kwargs,
 		):
 			tones.beep(**kwargs)
+
+
+def _nativeBeep(hz: float, length: int, left: int, right: int) -> bytes:
+	generateBeep = NVDAHelper.localLib.generateBeep
+	generateBeep.argtypes = [c_char_p, c_float, c_int, c_int, c_int]
+	generateBeep.restype = c_int
+	buf = create_string_buffer(generateBeep(None, hz, length, left, right))
+	generateBeep(buf, hz, length, left, right)
+	return buf.raw
+
+
+class TestGenerateBeep(unittest.TestCase):
+	"""Tests for generating tones in Python."""
+
+	TONES = (
+		(440.0, 40, 50, 50),
+		(1000.0, 1500, 100, 0),
+		(82.4, 2500, 30, 70),
+		(6000.0, 10, 0, 100),
+		# A progress bar beep.
+		(110 * 2 ** (37 / 25.0), 40, 50, 50),
+	)
+
+	def test_matchesNative(self):
+		if not NVDAHelper.localLib:
+			self.skipTest("nvdaHelperLocal isn't loaded")
+		for tone in self.TONES:
+			with self.subTest(tone=tone):
+				self.assertEqual(tones._generateBeep(*tone, tones.SAMPLE_RATE), _nativeBeep(*tone))
+
+	def test_wholeCycles(self):
+		buf = tones._generateBeep(441.0, 45, 50, 50, 44100)
+		# 100 samples per cycle, 4 bytes per sample.
+		self.assertEqual(len(buf), 2000 * 4)
+		samples = array("h", buf)
+		self.assertEqual(samples[:200], samples[200:400])
+
+	def test_balance(self):
+		samples = array("h", tones._generateBeep(440.0, 40, 100, 0, 22050))
+		self.assertTrue(any(samples[0::2]))
+		self.assertFalse(any(samples[1::2]))
+		self.assertLessEqual(max(samples[0::2]), tones._AMPLITUDE)
+
+	def test_cached(self):
+		tones._getBeepBuffer.cache_clear()
+		self.addCleanup(tones._getBeepBuffer.cache_clear)
+		first = tones._getBeepBuffer(440.0, 40, 50, 50, 22050)
+		second = tones._getBeepBuffer(440.0, 40, 50, 50, 22050)
+		self.assertIs(first, second)
+		self.assertEqual(tones._getBeepBuffer.cache_info().hits, 1)
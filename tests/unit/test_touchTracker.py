@@ -0,0 +1,65 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Unit tests for the touchTracker module."""
+
+import unittest
+
+import touchTracker
+from .touchReplay import randomSession, replay, touch
+
+
+def concurrently(*fingers: list) -> list:
+	"""Merges the events of fingers touching the screen at the same time."""
+	return sorted((event for events in fingers for event in events), key=lambda event: event.time)
+
+
+class TestTrackerManager(unittest.TestCase):
+	def test_tap(self):
+		self.assertEqual(replay(touch(1, 0, [(100, 100), (101, 100)], 0.05)), ["1finger_tapx1@100,100"])
+
+	def test_doubleTap(self):
+		events = touch(1, 0, [(100, 100)], 0.05) + touch(2, 0.15, [(102, 101)], 0.05)
+		self.assertEqual(replay(events), ["1finger_tapx2@100,100"])
+
+	def test_twoFingerTap(self):
+		events = concurrently(touch(1, 0, [(100, 100)], 0.06), touch(2, 0.01, [(300, 100)], 0.06))
+		self.assertEqual(replay(events), ["2finger_tapx1@200,100"])
+
+	def test_flick(self):
+		events = touch(1, 0, [(100, 100), (150, 100), (200, 101)], 0.1)
+		self.assertEqual(replay(events), ["1finger_flickrightx1@100,100"])
+
+	def test_tapAndHold(self):
+		events = touch(1, 0, [(100, 100)], 0.05) + touch(2, 0.15, [(100, 100), (101, 100)], 0.8)
+		self.assertEqual(
+			replay(events),
+			["1finger_tapandholdx1@100,100", "1finger_hoverx1@101,100", "1finger_hoverupx1@101,100"],
+		)
+
+	def test_tapWhileHovering(self):
+		events = concurrently(
+			touch(1, 0, [(100, 100), (110, 100), (120, 100)], 1.5),
+			touch(2, 0.8, [(500, 500)], 0.05),
+		)
+		gestures = replay(events)
+		self.assertEqual(gestures[0], "1finger_hoverdownx1@110,100")
+		self.assertIn("1finger_hold+1finger_tapx1@500,500", gestures)
+		self.assertEqual(gestures[-1], "1finger_hoverupx1@120,100")
+
+	def test_tapAfterQueuedFlick(self):
+		"""A tap following a flick which is still queued, because another finger's action was unknown."""
+		events = concurrently(
+			touch(1, 0, [(500, 500), (530, 530)], 0.18),
+			touch(2, 0, [(100, 100), (160, 100), (220, 100)], 0.1),
+			touch(3, 0.15, [(900, 900)], 0.05),
+		)
+		self.assertEqual(replay(events), ["1finger_flickrightx1@100,100", "1finger_tapx1@900,900"])
+
+	def test_queueIndexConsistent(self):
+		manager = touchTracker.TrackerManager()
+		replay(randomSession(1, 50), manager=manager)
+		self.assertEqual(manager.multiTouchTrackers, [])
+		self.assertEqual(manager._queuedTrackersByAction, {})
@@ -10,6 +10,8 @@
 
 from NVDAObjects import NVDAObjectTextInfo
 from .objectProvider import PlaceholderNVDAObject
+import colors
+import controlTypes
 import textInfos
 from textInfos.offsets import Offsets
 import textUtils
@@ -99,6 +101,88 @@ def makeTextInfo(self, position):
 		return result
 
 
+class FieldsTextInfo(BasicTextInfo):
+	def getTextWithFields(self, formatConfig=None) -> textInfos.TextInfo.TextWithFieldsT:
+		# The fields are made anew for every call, as callers may modify them.
+		return self.obj.makeTextWithFields()
+
+
+class FieldsTextProvider(BasicTextProvider):
+	"""A BasicTextProvider whose text is a document of paragraphs with control and format fields,
+	such as headings, links and lists with varying fonts.
+	Fields with the same attributes repeat throughout the document, like in real documents.
+	L{FieldsTextInfo} always provides the fields of the whole document.
+	"""
+
+	TextInfo = FieldsTextInfo
+
+	def __init__(self, paragraphCount: int = 40):
+		"""
+		@param paragraphCount: The number of paragraphs in the document.
+		"""
+		self.paragraphCount = paragraphCount
+		super().__init__(text="".join(self._getParagraphText(index) for index in range(paragraphCount)))
+
+	@staticmethod
+	def _getParagraphText(index: int) -> str:
+		return f"Paragraph {index} of the document.\n"
+
+	def _makeFormatField(self, index: int, **attrs) -> textInfos.FieldCommand:
+		field = textInfos.FormatField(
+			{
+				"font-name": "Calibri" if index % 3 else "Arial",
+				"font-size": "12 pt",
+				"color": colors.RGB(0, 0, 0),
+				"background-color": colors.RGB(255, 255, 255),
+				"page-number": str(index // 20 + 1),
+				"invalid-spelling": index % 7 == 0,
+				**attrs,
+			},
+		)
+		return textInfos.FieldCommand("formatChange", field)
+
+	def _makeControlField(self, role: controlTypes.Role, **attrs) -> textInfos.FieldCommand:
+		field = textInfos.ControlField({"role": role, "states": set(), **attrs})
+		return textInfos.FieldCommand("controlStart", field)
+
+	def makeTextWithFields(self) -> textInfos.TextInfo.TextWithFieldsT:
+		commands = []
+		for index in range(self.paragraphCount):
+			text = self._getParagraphText(index)
+			kind = index % 4
+			if kind == 0:
+				commands.append(self._makeControlField(controlTypes.Role.HEADING, level=2))
+				commands.append(self._makeFormatField(index, bold=True, **{"heading-level": 2}))
+				commands.append(text)
+				commands.append(textInfos.FieldCommand("controlEnd", None))
+			elif kind == 1:
+				commands.append(self._makeControlField(controlTypes.Role.PARAGRAPH))
+				commands.append(self._makeFormatField(index))
+				commands.append(text[:10])
+				commands.append(
+					self._makeControlField(
+						controlTypes.Role.LINK,
+						states={controlTypes.State.LINKED, controlTypes.State.FOCUSABLE},
+						value="https://www.nvaccess.org/",
+					),
+				)
+				commands.append(self._makeFormatField(index, underline=True))
+				commands.append(text[10:])
+				commands.append(textInfos.FieldCommand("controlEnd", None))
+				commands.append(textInfos.FieldCommand("controlEnd", None))
+			elif kind == 2:
+				commands.append(self._makeControlField(controlTypes.Role.LIST, _childcontrolcount="1"))
+				commands.append(self._makeControlField(controlTypes.Role.LISTITEM, level=1))
+				commands.append(self._makeFormatField(index, **{"line-prefix": "•"}))
+				commands.append(text)
+				commands.append(textInfos.FieldCommand("controlEnd", None))
+				commands.append(textInfos.FieldCommand("controlEnd", None))
+			else:
+				commands.append(self._makeFormatField(index, italic=True))
+				commands.append(text)
+		return commands
+
+
 class CursorManager(cursorManager.CursorManager, BasicTextProvider):
 	"""CursorManager which navigates within a provided string of text."""
 
@@ -0,0 +1,144 @@
+# A part of NonVisual Desktop Access (NVDA)
+# This file is covered by the GNU General Public License.
+# See the file COPYING for more details.
+# Copyright (C) 2026 NV Access Limited
+
+"""Replay of recorded touch point sequences through a L{touchTracker.TrackerManager}.
+Sequences of L{TouchEvent}s are fed to the manager on a simulated clock,
+pumping it as the touch handler does, and the emitted gestures are returned as strings.
+"""
+
+from random import Random
+from typing import NamedTuple
+from unittest.mock import patch
+
+import touchTracker
+
+
+class TouchEvent(NamedTuple):
+	"""A new, moved or completed contact, as passed to L{touchTracker.TrackerManager.update}."""
+
+	time: float
+	ID: int
+	x: int
+	y: int
+	complete: bool = False
+
+
+def touch(
+	ID: int,
+	startTime: float,
+	points: list[tuple[int, int]],
+	duration: float,
+) -> list[TouchEvent]:
+	"""Makes the events of one finger touching, moving through points at a constant pace and releasing.
+	@param ID: The ID of the contact.
+	@param startTime: When the finger first makes contact.
+	@param points: The positions of the finger, the first of which is where it makes contact
+		and the last of which is where it breaks contact.
+	@param duration: How long the finger stays in contact.
+	"""
+	step = duration / max(len(points) - 1, 1)
+	events = [TouchEvent(startTime + index * step, ID, x, y) for index, (x, y) in enumerate(points)]
+	x, y = points[-1]
+	events.append(TouchEvent(startTime + duration, ID, x, y, complete=True))
+	return events
+
+
+def randomSession(seed: int, gestureCount: int, maxFingers: int = 4) -> list[TouchEvent]:
+	"""Makes a session of taps, flicks and holds with up to several fingers at once, at random places on a large screen.
+	@param seed: Makes the session reproducible.
+	@param gestureCount: The number of gestures in the session.
+	@param maxFingers: The maximum number of fingers used for a gesture.
+	"""
+	random = Random(seed)
+	events = []
+	startTime = 0.0
+	ID = 0
+	for _gesture in range(gestureCount):
+		kind = random.choice(("tap", "tap", "flick", "hold"))
+		fingers = random.randint(1, maxFingers)
+		for _finger in range(fingers):
+			ID += 1
+			x = random.randrange(0, 3840)
+			y = random.randrange(0, 2160)
+			fingerStart = startTime + random.uniform(0, 0.03)
+			if kind == "tap":
+				events += touch(ID, fingerStart, [(x, y), (x + 2, y + 1)], random.uniform(0.03, 0.12))
+			elif kind == "flick":
+				dx, dy = random.choice(((120, 0), (-120, 0), (0, 120), (0, -120)))
+				points = [(x + dx * step // 4, y + dy * step // 4) for step in range(5)]
+				events += touch(ID, fingerStart, points, random.uniform(0.05, 0.15))
+			else:
+				points = [(x + step, y) for step in range(0, 60, 6)]
+				events += touch(ID, fingerStart, points, random.uniform(0.4, 1.0))
+		# Some gestures follow quickly enough to be merged into plural gestures.
+		startTime += random.choice((0.15, 0.3, 0.6, 1.2))
+	events.sort(key=lambda event: event.time)
+	return events
+
+
+def flickStorm(seed: int, fingerCount: int, interval: float = 0.01) -> list[TouchEvent]:
+	"""Makes a session of fingers tapping and flicking in quick succession at random places on a large screen,
+	so that many trackers are waiting to be emitted at once.
+	@param seed: Makes the session reproducible.
+	@param fingerCount: The number of fingers which touch the screen.
+	@param interval: The time between fingers touching the screen.
+	"""
+	random = Random(seed)
+	events = []
+	for ID in range(1, fingerCount + 1):
+		x = random.randrange(0, 3840)
+		y = random.randrange(0, 2160)
+		startTime = ID * interval
+		dx, dy = random.choice(((0, 0), (120, 0), (-120, 0), (0, 120), (0, -120)))
+		points = [(x + dx * step // 2, y + dy * step // 2) for step in range(3)]
+		events += touch(ID, startTime, points, random.uniform(0.05, 0.1))
+	events.sort(key=lambda event: event.time)
+	return events
+
+
+def describe(
+	preheldTracker: touchTracker.MultiTouchTracker | None, tracker: touchTracker.MultiTouchTracker
+) -> str:
+	"""Describes an emitted gesture for comparison."""
+	description = f"{tracker.numFingers}finger_{tracker.action}x{tracker.actionCount}@{tracker.x},{tracker.y}"
+	if preheldTracker:
+		description = f"{preheldTracker.numFingers}finger_{preheldTracker.action}+{description}"
+	return description
+
+
+def replay(
+	events: list[TouchEvent],
+	pumpInterval: float = 0.02,
+	manager: touchTracker.TrackerManager | None = None,
+) -> list[str]:
+	"""Feeds touch events to a tracker manager and collects the gestures it emits.
+	The manager is pumped after every event, and regularly while time passes between events,
+	until a second after the last event.
+	@param events: The events, in the order of their times.
+	@param pumpInterval: How often the manager is pumped while no event occurs.
+	@param manager: The manager, a new one if not provided.
+	@return: The descriptions of the emitted gestures, see L{describe}.
+	"""
+	clock = [0.0]
+	gestures = []
+	if manager is None:
+		manager = touchTracker.TrackerManager()
+
+	def pumpUntil(time: float):
+		while clock[0] + pumpInterval < time:
+			clock[0] += pumpInterval
+			pump()
+		clock[0] = max(clock[0], time)
+
+	def pump():
+		gestures.extend(describe(preheld, tracker) for preheld, tracker in manager.emitTrackers())
+
+	with patch.object(touchTracker.time, "time", lambda: clock[0]):
+		for event in events:
+			pumpUntil(event.time)
+			manager.update(event.ID, event.x, event.y, event.complete)
+			pump()
+		pumpUntil(clock[0] + 1)
+	return gestures